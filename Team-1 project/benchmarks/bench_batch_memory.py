@@ -0,0 +1,68 @@
+"""
+Benchmark: allocation and GC pressure of a large batch translation
+
+Translates a batch of distinct Hindi sentences in-process (as each
+/api/batch-translate pool worker does) and reports wall time, peak traced
+memory during the batch, memory retained by the results, objects left
+tracked by the garbage collector, collections triggered, and the pickled
+size of the results (what a pool worker sends back to the server).
+
+Run from the project root:
+    python benchmarks/bench_batch_memory.py [N]
+"""
+
+import gc
+import os
+import pickle
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.engine import TranslationEngine
+
+
+def make_batch(engine, count, seed=11):
+    """Distinct sentences mixing phrases, known words and unknown words"""
+    rng = random.Random(seed)
+    vocab = [w for key in engine.dictionary.hindi_to_santali for w in key.split()]
+    vocab += ['झिलमिल', 'किताबों', 'लड़कियों', 'नमसते', 'खरीदूंगा'] * 50
+    return [' '.join(rng.choices(vocab, k=rng.randint(4, 16))) for _ in range(count)]
+
+
+def main(count=2000):
+    engine = TranslationEngine(batch_workers=1, cache_size=count * 2)
+    texts = make_batch(engine, count)
+    engine.batch_translate(make_batch(engine, 500, seed=1), 'hi', 'sat')  # warm lazy indexes
+    engine.clear_cache()
+
+    start = time.perf_counter()
+    engine.batch_translate(texts, 'hi', 'sat')
+    elapsed = time.perf_counter() - start
+    engine.clear_cache()
+
+    gc.collect()
+    collections = sum(s['collections'] for s in gc.get_stats())
+    tracked = len(gc.get_objects())
+    tracemalloc.start()
+    results = engine.batch_translate(texts, 'hi', 'sat')
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    collections = sum(s['collections'] for s in gc.get_stats()) - collections - 1
+    tracked = len(gc.get_objects()) - tracked
+
+    mappings = sum(len(r['word_mappings']) for r in results)
+    print("Batch: {} texts, {} word mappings".format(len(results), mappings))
+    print("  Wall time            : {:8.1f} ms".format(elapsed * 1000))
+    print("  Peak traced memory   : {:8.1f} MB".format(peak / 2 ** 20))
+    print("  Retained (results+cache): {:5.1f} MB".format(retained / 2 ** 20))
+    print("  GC-tracked objects   : {:8d}".format(tracked))
+    print("  GC collections       : {:8d}".format(collections))
+    print("  Pickled results      : {:8.1f} MB".format(len(pickle.dumps(results)) / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,105 @@
+"""
+Benchmark: memory held by one worker's Dictionary, and lookup speed
+
+Builds the engine from the CSV, builds every lazy index, then reports the
+deep size of each Dictionary structure (strings shared between structures
+are counted once, for the first structure listed), the process RSS, and the
+per-operation cost of the lookups the engine makes on every request.
+
+Run from the project root:
+    python benchmarks/bench_dictionary_memory.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.engine import TranslationEngine
+
+STRUCTURES = ('hindi_to_santali', 'santali_to_hindi', 'hindi_lower', 'phrase_trie',
+              'hindi_fuzzy_index', 'santali_fuzzy_index', '_prefix_index')
+
+
+def deep_size(obj, seen):
+    """Bytes reachable from obj that are not already in seen"""
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__') and not isinstance(item, type):
+            stack.append(item.__dict__)
+        elif hasattr(item, '__slots__'):
+            stack.extend(getattr(item, name) for name in item.__slots__ if hasattr(item, name))
+    return size
+
+
+def rss_mb():
+    """Resident set size of this process (Linux), or None"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def time_per_op(func, items, repeat=5):
+    """Best-of-N mean cost per item in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main():
+    engine = TranslationEngine(batch_workers=1, use_snapshot=False)
+    dictionary = engine.dictionary
+    dictionary._ensure_phrase_trie()
+    dictionary._ensure_hindi_fuzzy_index()
+    dictionary._ensure_santali_fuzzy_index()
+    dictionary.prefix_index
+
+    seen = {id(dictionary.dictionary_path)}
+    total = 0
+    print("Dictionary: {} Hindi keys".format(len(dictionary.hindi_to_santali)))
+    for name in STRUCTURES:
+        size = deep_size(getattr(dictionary, name), seen)
+        total += size
+        print("  {:20s}: {:6.2f} MB".format(name, size / 2 ** 20))
+    print("  {:20s}: {:6.2f} MB".format('total', total / 2 ** 20))
+    rss = rss_mb()
+    if rss is not None:
+        print("  {:20s}: {:6.1f} MB".format('process RSS', rss))
+
+    keys = list(dictionary.hindi_to_santali)
+    words = [w for key in keys for w in key.split()]
+    sentences = [dictionary.encode_tokens(key.split() + ['झिलमिल']) for key in keys]
+    print("Lookups:")
+    print("  probe_hindi          : {:6.3f} us".format(time_per_op(dictionary.probe_hindi, words)))
+    print("  longest_phrase_match : {:6.3f} us".format(
+        time_per_op(lambda ids: dictionary.longest_phrase_match(ids, 0), sentences)))
+    print("  encode_tokens        : {:6.3f} us".format(time_per_op(dictionary.encode_tokens, [k.split() for k in keys])))
+    print("  prefix lookup        : {:6.3f} us".format(
+        time_per_op(lambda w: dictionary.prefix_index.get(w[:2]), words[:2000])))
+    print("  translate (uncached) : {:6.1f} us".format(time_per_op(
+        lambda k: engine._translate_hindi_to_santali(k + ' पानी'), keys[:2000], repeat=2)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: fuzzy matching of out-of-vocabulary words
+
+Compares the original linear SequenceMatcher scans over hindi_to_santali and
+santali_to_hindi with the FuzzyIndex-backed Dictionary.fuzzy_match_* methods,
+checks that both return the same match and score, and prints per-word latency.
+
+Run from the project root:
+    python benchmarks/bench_fuzzy_match.py
+"""
+
+import os
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.engine import TranslationEngine
+
+# Inflected / misspelled forms that miss the exact and stem lookups
+OOV_WORDS = [
+    'जाऊंगा', 'फलियां', 'खरीदूंगा', 'घरवाले', 'भूखे', 'पढ़ाई', 'लड़कियां',
+    'बोलूंगा', 'किताबें', 'खेलेंगे', 'सुनाइए', 'मिठाइयाँ', 'दोस्तों', 'चलिए',
+    'समझाइए', 'गाड़ियाँ', 'नदियों', 'पहाड़ों', 'बच्चियाँ', 'रसोईघर',
+]
+
+# Inflected Ol Chiki forms (dictionary stems + Santali suffixes)
+OOV_SANTALI_WORDS = [
+    'ᱡᱚᱦᱟᱨᱠᱚ', 'ᱟᱢᱟᱜᱮ', 'ᱵᱟᱝᱟ', 'ᱦᱟᱴᱨᱮ', 'ᱤᱧᱟᱜ', 'ᱟᱞᱮᱭᱟᱜ', 'ᱥᱟᱱᱟᱢᱠᱚ',
+    'ᱩᱱᱠᱩ', 'ᱵᱟᱨᱟᱝᱮ', 'ᱡᱚᱛᱚᱠᱚ', 'ᱜᱮᱞᱟ', 'ᱠᱳᱣᱟᱨᱮ', 'ᱱᱩᱱᱩᱠᱚ', 'ᱯᱩᱱᱟ',
+]
+
+THRESHOLD = 0.50  # same threshold _translate_hindi_to_santali uses
+SANTALI_THRESHOLD = 0.65  # same threshold _translate_santali_to_hindi uses
+
+
+def linear_fuzzy_match(dictionary, hindi_word, threshold):
+    """Original full-scan implementation, kept as the reference"""
+    hindi_word_lower = dictionary._normalize_text(hindi_word).lower()
+    best_match = None
+    best_score = threshold
+    for dictionary_word, santali_word in dictionary.hindi_to_santali.items():
+        if hindi_word_lower == dictionary_word.lower():
+            return (santali_word, 1.0)
+        similarity = SequenceMatcher(None, hindi_word_lower, dictionary_word.lower()).ratio()
+        if similarity > best_score:
+            best_score = similarity
+            best_match = (santali_word, similarity)
+    return best_match
+
+
+def linear_fuzzy_match_santali(dictionary, santali_word, threshold):
+    """Original full-scan implementation of the reverse direction"""
+    santali_word_lower = santali_word.lower()
+    best_match = None
+    best_score = threshold
+    for dictionary_santali, hindi_word in dictionary.santali_to_hindi.items():
+        similarity = SequenceMatcher(None, santali_word_lower, dictionary_santali.lower()).ratio()
+        if similarity > best_score:
+            best_score = similarity
+            best_match = (hindi_word, similarity)
+    return best_match
+
+
+def compare(label, words, linear, indexed):
+    """Check result parity and print per-word latency for one direction"""
+    mismatches = 0
+    for word in words:
+        expected = linear(word)
+        actual = indexed(word)
+        if expected != actual:
+            mismatches += 1
+            print("[MISMATCH] {}: linear={} indexed={}".format(word, expected, actual))
+    print("{} parity: {}/{} words identical".format(label, len(words) - mismatches, len(words)))
+
+    linear_ms = time_per_word(linear, words)
+    indexed_ms = time_per_word(indexed, words)
+    print("  Linear scan : {:8.3f} ms/word".format(linear_ms))
+    print("  FuzzyIndex  : {:8.3f} ms/word".format(indexed_ms))
+    print("  Speed-up    : {:8.1f}x".format(linear_ms / indexed_ms))
+
+
+def time_per_word(func, words, repeat=3):
+    """Best-of-N mean latency per word in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for word in words:
+            func(word)
+        best = min(best, time.perf_counter() - start)
+    return best / len(words) * 1000
+
+
+def main():
+    engine = TranslationEngine()
+    dictionary = engine.dictionary
+    print("Dictionary entries: {}".format(len(dictionary.hindi_to_santali)))
+
+    compare('hi->sat', OOV_WORDS,
+            lambda w: linear_fuzzy_match(dictionary, w, THRESHOLD),
+            lambda w: dictionary.fuzzy_match_hindi_to_santali(w, threshold=THRESHOLD))
+    compare('sat->hi', OOV_SANTALI_WORDS,
+            lambda w: linear_fuzzy_match_santali(dictionary, w, SANTALI_THRESHOLD),
+            lambda w: dictionary.fuzzy_match_santali_to_hindi(w, threshold=SANTALI_THRESHOLD))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: OlChikiConverter.convert on paragraph-sized input
+
+Compares the precompiled single-pass converter with the original one
+str.replace pass per substitution, checks byte-identical output on the
+Hindi column of hindi_santali_final.csv, and prints latency per paragraph
+and per single dataset entry.
+
+Run from the project root:
+    python benchmarks/bench_olchiki_converter.py
+"""
+
+import csv
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.translator.olchiki_converter import OlChikiConverter
+
+
+def load_corpus():
+    """Hindi column of the dataset, used as the golden corpus"""
+    path = os.path.join(PROJECT_ROOT, 'hindi_santali_final.csv')
+    with open(path, 'r', encoding='utf-8') as f:
+        return [row['hindi'] for row in csv.DictReader(f) if row.get('hindi')]
+
+
+def time_per_call(func, inputs, repeat=5):
+    """Best-of-N mean latency per input in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in inputs:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs) * 1000
+
+
+def main():
+    corpus = load_corpus()
+    mismatches = sum(1 for text in corpus
+                     if OlChikiConverter.convert(text) != OlChikiConverter._convert_sequential(text))
+    print("Golden corpus: {}/{} entries byte-identical".format(len(corpus) - mismatches, len(corpus)))
+
+    # ~1-2 KB paragraphs built from consecutive dataset sentences
+    paragraphs = [' '.join(corpus[i:i + 40]) for i in range(0, len(corpus), 40)]
+    avg_len = sum(len(p) for p in paragraphs) / len(paragraphs)
+    print("Paragraphs: {} (avg {:.0f} chars)".format(len(paragraphs), avg_len))
+
+    for label, inputs in (('paragraph', paragraphs), ('entry', corpus)):
+        sequential_ms = time_per_call(OlChikiConverter._convert_sequential, inputs)
+        compiled_ms = time_per_call(OlChikiConverter.convert, inputs)
+        print("Per {}:".format(label))
+        print("  Sequential replace : {:8.4f} ms".format(sequential_ms))
+        print("  Precompiled scan   : {:8.4f} ms".format(compiled_ms))
+        print("  Speed-up           : {:8.1f}x".format(sequential_ms / compiled_ms))
+
+
+if __name__ == '__main__':
+    main()
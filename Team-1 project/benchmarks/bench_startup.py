@@ -0,0 +1,62 @@
+"""
+Benchmark: cold-start cost of building the translator
+
+Each sample runs in a fresh interpreter (as a new serverless instance
+would) and times importing the engine, constructing TranslationEngine and
+serving the first translation. If Flask is installed, importing the Vercel
+handler api/index.py (which builds the engine via create_app) is timed too.
+
+Run from the project root:
+    python benchmarks/bench_startup.py
+"""
+
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+ENGINE_PROBE = '''
+import time
+start = time.perf_counter()
+from src.translator.engine import TranslationEngine
+imported = time.perf_counter()
+engine = TranslationEngine()
+built = time.perf_counter()
+engine.translate('मैं कल बाजार जाऊंगा', 'hi', 'sat')
+done = time.perf_counter()
+print(imported - start, built - imported, done - built)
+'''
+
+HANDLER_PROBE = '''
+import time
+start = time.perf_counter()
+import api.index
+print(time.perf_counter() - start)
+'''
+
+
+def run_probe(code):
+    """Run a probe in a fresh interpreter and return its timings"""
+    out = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    return [float(x) for x in out.strip().splitlines()[-1].split()]
+
+
+def main(samples=7):
+    runs = [run_probe(ENGINE_PROBE) for _ in range(samples)]
+    for label, i in (('import engine', 0), ('TranslationEngine()', 1), ('first translate', 2)):
+        print("{:20s}: {:7.1f} ms (median of {})".format(
+            label, statistics.median(r[i] for r in runs) * 1000, samples))
+
+    if importlib.util.find_spec('flask') is None:
+        print("Flask not installed - skipping api/index.py handler timing")
+        return
+    handler = [run_probe(HANDLER_PROBE)[0] for _ in range(samples)]
+    print("{:20s}: {:7.1f} ms (median of {})".format('import api/index.py', statistics.median(handler) * 1000, samples))
+
+
+if __name__ == '__main__':
+    main()
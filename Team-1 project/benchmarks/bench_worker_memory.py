@@ -0,0 +1,92 @@
+"""
+Benchmark: per-worker memory with and without a preloaded, frozen engine
+
+Forks server-like workers the two ways gunicorn can run the app:
+
+    separate  each worker builds its own engine after the fork (the default)
+    preload   the parent builds the engine and its indexes, freezes it and
+              forks (gunicorn.conf.py: preload_app + gc.freeze)
+
+Every worker translates the same mixed workload, then reports its unique
+(USS) and proportional (PSS) memory from /proc/<pid>/smaps_rollup while all
+workers are still alive. Linux only.
+
+Run from the project root:
+    python benchmarks/bench_worker_memory.py [WORKERS]
+"""
+
+import gc
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.engine import TranslationEngine
+from src.translator.preload import freeze_for_fork, process_memory
+
+
+def make_workload(engine, count=1500, seed=5):
+    """Sentences hitting phrases, dictionary words, stems and unknown words"""
+    rng = random.Random(seed)
+    vocab = [w for key in engine.dictionary.hindi_to_santali for w in key.split()]
+    vocab += ['झिलमिल', 'किताबों', 'लड़कियों', 'नमसते', 'खरीदूंगा'] * 50
+    return [' '.join(rng.choices(vocab, k=rng.randint(4, 16))) for _ in range(count)]
+
+
+def run_workers(workers, engine=None):
+    """Fork workers, each translating the workload; return their memory reports"""
+    report_r, report_w = os.pipe()
+    release_r, release_w = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(report_r)
+            os.close(release_w)
+            worker_engine = engine or TranslationEngine(batch_workers=1)
+            for text in make_workload(worker_engine):
+                worker_engine.translate(text, 'hi', 'sat')
+            gc.collect()
+            os.write(report_w, (json.dumps(process_memory()) + '\n').encode())
+            os.read(release_r, 1)  # stay alive until every worker has reported
+            os._exit(0)
+        pids.append(pid)
+    os.close(report_w)
+    os.close(release_r)
+    with os.fdopen(report_r) as reports:
+        memory = [json.loads(reports.readline()) for _ in pids]
+    os.close(release_w)
+    for pid in pids:
+        os.waitpid(pid, 0)
+    return memory
+
+
+def print_report(label, memory):
+    print("{} ({} workers):".format(label, len(memory)))
+    for i, m in enumerate(memory):
+        print("  worker {}: USS {:6.1f} MB  PSS {:6.1f} MB  RSS {:6.1f} MB".format(
+            i, m['uss_mb'], m['pss_mb'], m['rss_mb']))
+    print("  mean USS {:6.1f} MB, total PSS {:6.1f} MB".format(
+        sum(m['uss_mb'] for m in memory) / len(memory), sum(m['pss_mb'] for m in memory)))
+
+
+def main(workers=4):
+    if process_memory() is None:
+        print("[WARN] /proc/self/smaps_rollup is unavailable; this benchmark needs Linux")
+        return
+
+    print_report('separate', run_workers(workers))
+
+    gc.disable()
+    engine = TranslationEngine(batch_workers=1)
+    engine.preload()
+    frozen = freeze_for_fork()
+    gc.enable()
+    print("Parent: {} objects frozen, RSS {} MB".format(frozen, process_memory()['rss_mb']))
+    print_report('preload', run_workers(workers, engine))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
@@ -0,0 +1,52 @@
+"""
+Pre-render phrase audio used to stitch /api/speak responses
+
+Renders one WAV clip (offline pyttsx3 engine) for every Santali value in the
+merged dictionary, which includes the SUPPLEMENTARY_SENTENCES phrases, and
+stores it in phrase_audio/ (or PHRASE_AUDIO_DIR). Existing clips are kept, so
+an interrupted run can simply be restarted.
+
+Usage:
+    python build_phrase_audio.py [--hindi] [--limit N]
+"""
+
+import argparse
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.translator.engine import TranslationEngine
+from src.translator.audio_gen import prepare_speech_input, _generate_with_pyttsx3
+from src.translator.phrase_audio import get_phrase_audio_store
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--hindi', action='store_true', help='also render the Hindi keys')
+    parser.add_argument('--limit', type=int, default=None, help='render at most N new clips')
+    args = parser.parse_args()
+
+    engine = TranslationEngine()
+    store = get_phrase_audio_store()
+    phrases = [(text, 'sat') for text in dict.fromkeys(engine.dictionary.hindi_to_santali.values())]
+    if args.hindi:
+        phrases += [(text, 'hi') for text in engine.dictionary.hindi_to_santali]
+
+    start = time.perf_counter()
+    rendered = skipped = failed = 0
+    for text, language in phrases:
+        if args.limit is not None and rendered >= args.limit:
+            break
+        if not store.tokens(text) or store.has(text, language):
+            skipped += 1
+            continue
+        try:
+            store.save(text, language, _generate_with_pyttsx3(*prepare_speech_input(text, language)))
+            rendered += 1
+        except Exception as e:
+            print("[WARN] Could not render '{}': {}".format(text, e))
+            failed += 1
+    print("[OK] {} clips rendered, {} already present, {} failed in {:.1f}s -> {}".format(
+        rendered, skipped, failed, time.perf_counter() - start, store.directory))
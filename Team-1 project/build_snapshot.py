@@ -0,0 +1,27 @@
+"""
+Build the binary dictionary snapshot used for fast cold starts
+
+Parses hindi_santali_final.csv, merges the SUPPLEMENTARY_* tables and writes
+hindi_santali_final.snapshot next to the CSV. Re-run after editing either;
+a stale snapshot is detected by its hash and ignored (the CSV is used).
+
+Usage:
+    python build_snapshot.py [output_path]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.translator.engine import TranslationEngine
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    engine = TranslationEngine(use_snapshot=False)
+    path = engine.build_snapshot(sys.argv[1] if len(sys.argv) > 1 else None)
+    print("[OK] Wrote {} ({} entries, {:.0f} KB) in {:.2f}s".format(
+        path, len(engine.dictionary.hindi_to_santali),
+        os.path.getsize(path) / 1024, time.perf_counter() - start))
@@ -0,0 +1,67 @@
+"""
+Gunicorn configuration: all workers share one read-only dictionary
+
+The app is loaded once in the master (preload_app) with TRANSLATOR_PRELOAD
+set, so the engine parses the dataset and builds its lookup indexes before
+any worker exists. Workers inherit it through fork() and share its memory
+pages copy-on-write instead of each building a private copy. See
+src/translator/preload.py for why garbage collection is paused until the fork.
+
+Run from the project root:
+    gunicorn -c gunicorn.conf.py
+
+Workers are threaded (gthread). Streaming endpoints (/api/speak/stream,
+NDJSON batch translation, /ws/transcribe) hold their connection for as
+long as they run; with the default sync workers each would block a whole
+worker and be killed after the 30 s timeout. A gthread worker serves them
+on one of its threads and keeps reporting to the master while they run,
+so `timeout` only catches a worker that is stuck as a whole.
+
+Environment:
+    BIND             Address to listen on (default 0.0.0.0:5000)
+    WEB_CONCURRENCY  Worker processes (default 4)
+    GUNICORN_THREADS Threads per worker, i.e. concurrent requests and
+                     open streams each worker serves (default 8)
+    GUNICORN_TIMEOUT Seconds before an unresponsive worker is restarted
+                     (default 120)
+    BATCH_WORKERS    Batch translation processes per worker (default 1:
+                     batches run in-process, on the shared dictionary)
+
+Check sharing with GET /api/stats on a running server: 'memory' reports the
+answering worker's unique (uss_mb) and proportional (pss_mb) memory.
+"""
+
+import gc
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+wsgi_app = 'api.index:app'
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', '4'))
+preload_app = True
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = 30
+keepalive = 5
+
+# Read by create_app(): build every index now, while still in the master
+os.environ.setdefault('TRANSLATOR_PRELOAD', '1')
+
+# No collections while the shared state is built (re-enabled once it is frozen)
+gc.disable()
+
+
+def when_ready(server):
+    """Master is about to start workers: freeze the preloaded objects"""
+    from translator.preload import freeze_for_fork, process_memory  # src/ is on sys.path via api/index.py
+
+    frozen = freeze_for_fork()
+    gc.enable()
+    memory = process_memory()
+    server.log.info("[OK] Froze %d preloaded objects before forking (master RSS %s MB)",
+                    frozen, memory['rss_mb'] if memory else '?')
@@ -0,0 +1,227 @@
+"""
+Two-tier cache for synthesized speech audio
+
+Tier 1 is an in-memory LRU (TranslationCache). Tier 2 is an on-disk store in
+which each clip is saved under the hash of its key, so it survives restarts
+and is shared by every worker process on the host.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import unicodedata
+from typing import Dict, Optional, Sequence
+
+from .cache import TranslationCache
+
+# Bump when the synthesis pipeline changes in a way that changes the audio
+AUDIO_CACHE_VERSION = 1
+
+_EXTENSIONS = {'audio/mpeg': '.mp3', 'audio/wav': '.wav'}
+_CONTENT_TYPES = {ext: ctype for ctype, ext in _EXTENSIONS.items()}
+
+
+def normalize_tts_text(text: str) -> str:
+    """Normalize TTS input so equivalent texts share a cache entry"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+class AudioCache:
+    """In-memory LRU in front of a content-addressed on-disk audio store
+
+    Entries are dicts with 'audio' (bytes), 'content_type' and 'etag'. The
+    disk tier is bounded by total bytes; when it grows past the limit the
+    least recently used files (by mtime, refreshed on every hit) are removed.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024,
+                 disk_dir: Optional[str] = None, disk_max_bytes: int = 256 * 1024 * 1024):
+        """Initialize audio cache
+
+        Args:
+            max_entries: Maximum clips held in memory
+            max_bytes: Maximum bytes of audio held in memory
+            disk_dir: Directory for the on-disk store (None disables it)
+            disk_max_bytes: Maximum bytes of audio kept on disk
+        """
+        self.memory = TranslationCache(max_entries=max_entries, max_bytes=max_bytes)
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._disk_bytes = None  # computed on first use
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.disk_writes = 0
+        self.disk_evictions = 0
+        self.disk_errors = 0
+
+    @staticmethod
+    def make_key(tts_text: str, language: str, engine: str = 'auto',
+                 segments: Optional[Sequence[str]] = None) -> str:
+        """Cache key for the text actually sent to the TTS engine
+
+        Args:
+            tts_text: Output of prepare_text_for_tts
+            language: Language code passed to the TTS engine
+            engine: TTS engine selection
+            segments: Explicit phrase segmentation the audio is stitched by
+                (clips stitched differently are different audio)
+
+        Returns:
+            64-character hex digest
+        """
+        raw = '\0'.join((str(AUDIO_CACHE_VERSION), engine, language, normalize_tts_text(tts_text)))
+        if segments:
+            raw += '\0' + '\x1f'.join(normalize_tts_text(segment) for segment in segments)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def etag_for(audio: bytes) -> str:
+        """Strong validator for a clip, derived from its bytes
+
+        Not from the cache key: workers may store different audio (or even
+        MP3 vs WAV, depending on which engine won) under the same key.
+        """
+        return hashlib.sha256(audio).hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached clip for key from memory or disk, or None"""
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry
+        if not self.disk_dir:
+            return None
+        for ext, content_type in _CONTENT_TYPES.items():
+            path = self._path(key, ext)
+            try:
+                with open(path, 'rb') as f:
+                    audio = f.read()
+                os.utime(path)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                print("[WARN] Audio cache read failed: {}".format(repr(e)))
+                self.disk_errors += 1
+                continue
+            self.disk_hits += 1
+            entry = {'audio': audio, 'content_type': content_type, 'etag': self.etag_for(audio)}
+            self.memory.set(key, entry)
+            return entry
+        self.disk_misses += 1
+        return None
+
+    def set(self, key: str, audio: bytes, content_type: str) -> Dict:
+        """Store a clip in both tiers and return its entry"""
+        entry = {'audio': audio, 'content_type': content_type, 'etag': self.etag_for(audio)}
+        self.memory.set(key, entry)
+        ext = _EXTENSIONS.get(content_type)
+        if self.disk_dir and ext:
+            self._write(self._path(key, ext), audio)
+        return entry
+
+    def _path(self, key: str, ext: str) -> str:
+        # Two-level fan-out keeps directories small
+        return os.path.join(self.disk_dir, key[:2], key + ext)
+
+    def _write(self, path: str, audio: bytes) -> None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+            with open(tmp_path, 'wb') as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print("[WARN] Audio cache write failed: {}".format(repr(e)))
+            self.disk_errors += 1
+            return
+        with self._lock:
+            self.disk_writes += 1
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._disk_bytes += len(audio)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _scan(self):
+        """Yield (path, size, mtime) for every stored clip"""
+        if not self.disk_dir or not os.path.isdir(self.disk_dir):
+            return
+        for bucket in os.scandir(self.disk_dir):
+            if not bucket.is_dir():
+                continue
+            for item in os.scandir(bucket.path):
+                if item.name.endswith('.tmp'):
+                    continue
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue
+                yield item.path, st.st_size, st.st_mtime
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used files until under 90% of the limit"""
+        files = sorted(self._scan(), key=lambda f: f[2])
+        total = sum(size for _, size, _ in files)
+        target = self.disk_max_bytes * 0.9
+        for path, size, _ in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.disk_evictions += 1
+        self._disk_bytes = total
+
+    def clear(self) -> None:
+        """Drop all cached clips from both tiers"""
+        self.memory.clear()
+        with self._lock:
+            for path, _, _ in list(self._scan()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._disk_bytes = 0
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics for both tiers"""
+        disk_lookups = self.disk_hits + self.disk_misses
+        return {
+            'memory': self.memory.get_stats(),
+            'disk_dir': self.disk_dir,
+            'disk_bytes': self._disk_bytes,
+            'disk_max_bytes': self.disk_max_bytes,
+            'disk_hits': self.disk_hits,
+            'disk_misses': self.disk_misses,
+            'disk_hit_rate': round(self.disk_hits / disk_lookups, 4) if disk_lookups else 0.0,
+            'disk_writes': self.disk_writes,
+            'disk_evictions': self.disk_evictions,
+            'disk_errors': self.disk_errors,
+        }
+
+
+_default_cache = None
+
+
+def get_audio_cache() -> AudioCache:
+    """Process-wide audio cache configured from the environment
+
+    TTS_CACHE_DIR sets the on-disk store (default: a folder in the system temp
+    directory, which is writable on serverless hosts; an empty value disables
+    it). TTS_CACHE_MEMORY_MB and TTS_CACHE_DISK_MB set the size limits.
+    """
+    global _default_cache
+    if _default_cache is None:
+        disk_dir = os.environ.get('TTS_CACHE_DIR')
+        if disk_dir is None:
+            disk_dir = os.path.join(tempfile.gettempdir(), 'hindi-santali-tts')
+        _default_cache = AudioCache(
+            max_bytes=int(os.environ.get('TTS_CACHE_MEMORY_MB', '32')) * 1024 * 1024,
+            disk_dir=disk_dir or None,
+            disk_max_bytes=int(os.environ.get('TTS_CACHE_DISK_MB', '256')) * 1024 * 1024,
+        )
+    return _default_cache
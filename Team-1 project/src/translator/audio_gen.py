@@ -0,0 +1,302 @@
+"""
+Audio generation for text-to-speech
+Supports multiple TTS engines with Ol Chiki transliteration
+Returns (audio_bytes, content_type) so callers can set the correct HTTP header.
+"""
+
+import os
+import tempfile
+from io import BytesIO
+from .olchiki_tts import prepare_text_for_tts, is_olchiki_text
+from .audio_cache import AudioCache, get_audio_cache
+from .phrase_audio import get_phrase_audio_store
+from .tts_orchestrator import get_tts_orchestrator
+from .offline_tts import get_offline_tts_pool
+from . import pcm
+from .pcm import PCMFormat
+
+def prepare_speech_input(text, language='hi'):
+    """Resolve the text and language actually sent to the TTS engines.
+
+    Args:
+        text: Text to speak
+        language: Language code ('hi' for Hindi, 'sat' for Santali)
+
+    Returns:
+        tuple: (tts_text, tts_language)
+    """
+    # Transliterate Ol Chiki to phonetic Latin so gTTS/pyttsx3 can pronounce it
+    if is_olchiki_text(text):
+        return prepare_text_for_tts(text), 'hi'  # use Hindi engine for phonetic Santali
+    return text, language
+
+
+def speech_cache_key(text, language='hi', segments=None):
+    """Audio cache key for text (and its segmentation), without synthesizing anything."""
+    tts_text, tts_language = prepare_speech_input(text, language)
+    return AudioCache.make_key(tts_text, tts_language, segments=segments)
+
+
+def get_speech_audio(text, language='hi', cache=None, segments=None):
+    """Generate speech audio, serving repeated phrases from the audio cache.
+
+    Text covered by pre-rendered phrase clips (see build_phrase_audio.py) is
+    stitched from them; only uncovered words are synthesized.
+
+    Args:
+        text: Text to speak
+        language: Language code ('hi' for Hindi, 'sat' for Santali)
+        cache: AudioCache to use (defaults to the process-wide cache)
+        segments: Optional phrase units of text, e.g. the 'santali' values of
+            a translation's word_mappings
+
+    Returns:
+        dict with 'audio', 'content_type', 'etag' (None when the audio is the
+        uncached tone fallback) and 'cached', or None on failure
+    """
+    if not text or not text.strip():
+        print("[TTS] Empty text — nothing to speak")
+        return None
+
+    tts_text, tts_language = prepare_speech_input(text, language)
+    cache = cache or get_audio_cache()
+    key = AudioCache.make_key(tts_text, tts_language, segments=segments)
+    entry = cache.get(key)
+    if entry is not None:
+        entry['cached'] = True
+        return entry
+
+    audio_data = _stitch_phrases(text, language, segments)
+    if audio_data:
+        content_type, cacheable = 'audio/wav', True
+    else:
+        audio_data, content_type, cacheable = _synthesize(tts_text, tts_language)
+    if not audio_data:
+        return None
+    if not cacheable:
+        # The tone is a placeholder for failed engines; never pin it
+        return {'audio': audio_data, 'content_type': content_type, 'etag': None, 'cached': False}
+    entry = cache.set(key, audio_data, content_type)
+    entry = dict(entry, cached=False)
+    return entry
+
+
+def get_speech_audio_as(text, language, content_type):
+    """Generate speech audio in a given format, bypassing the audio cache.
+
+    Used to join a sentence to a stream that is already in content_type when
+    the regular path (get_speech_audio) answered it in the other format.
+
+    Args:
+        text: Text to speak
+        language: Language code ('hi' for Hindi, 'sat' for Santali)
+        content_type: 'audio/mpeg' or 'audio/wav'
+
+    Returns:
+        dict with 'audio', 'content_type', 'etag' (None) and 'cached', or
+        None if no engine producing content_type succeeded
+    """
+    if not text or not text.strip():
+        return None
+    audio_data = _stitch_phrases(text, language) if content_type == 'audio/wav' else None
+    if not audio_data:
+        tts_text, tts_language = prepare_speech_input(text, language)
+        audio_data, _, _ = get_tts_orchestrator().synthesize(tts_text, tts_language, content_type=content_type)
+    if not audio_data:
+        return None
+    return {'audio': audio_data, 'content_type': content_type, 'etag': None, 'cached': False}
+
+
+def generate_speech_audio(text, language='hi'):
+    """Generate speech audio using available TTS engines.
+
+    Args:
+        text: Text to speak
+        language: Language code ('hi' for Hindi, 'sat' for Santali)
+
+    Returns:
+        tuple: (audio_bytes, content_type_string) or (None, None) on failure
+    """
+    entry = get_speech_audio(text, language)
+    if entry is None:
+        return None, None
+    return entry['audio'], entry['content_type']
+
+
+def _stitch_phrases(text, language, segments=None):
+    """Assemble speech from pre-rendered phrase clips, or None if not covered."""
+    store = get_phrase_audio_store()
+    if not len(store):
+        return None
+
+    def synthesize_leftover(leftover):
+        # Leftovers must be PCM to be joined, so only the offline engine fits
+        try:
+            return _generate_with_pyttsx3(*prepare_speech_input(leftover, language))
+        except Exception as e:
+            print("[TTS] Leftover synthesis failed: {}".format(e))
+            return None
+
+    audio_data = store.stitch(text, language, synthesize_leftover, segments)
+    if audio_data:
+        print("[TTS] Stitched from phrase clips — {} bytes (WAV)".format(len(audio_data)))
+    return audio_data
+
+
+def _synthesize(tts_text, language):
+    """Run the TTS engines (hedged, with deadlines — see TTSOrchestrator).
+
+    Returns:
+        tuple: (audio_bytes, content_type, cacheable) or (None, None, False)
+    """
+    print("[TTS] Generating speech for: {} (lang={})".format(tts_text[:40], language))
+
+    # gTTS (best quality, needs internet), hedged with pyttsx3 (offline)
+    audio_data, content_type, engine = get_tts_orchestrator().synthesize(tts_text, language)
+    if audio_data:
+        print("[TTS] {} OK — {} bytes ({})".format(engine, len(audio_data), content_type))
+        return audio_data, content_type, True
+
+    # Pure-Python silent-tone WAV — always works, no dependencies
+    print("[TTS] Using built-in tone fallback (WAV)")
+    tone = generate_simple_tone()
+    if tone:
+        return tone, 'audio/wav', False
+    return None, None, False
+
+
+def _generate_with_gtts(text, language='hi', timeout=None):
+    """Generate speech using Google Text-to-Speech (gTTS)
+    
+    Args:
+        text: Text to speak
+        language: Language code
+        timeout: Seconds allowed per HTTP request (None = no limit)
+        
+    Returns:
+        bytes: MP3 audio data
+    """
+    try:
+        from gtts import gTTS
+        
+        # Map languages
+        lang_map = {
+            'hi': 'hi',  # Hindi
+            'sat': 'hi',  # Santali falls back to Hindi
+            'en': 'en',  # English
+        }
+        
+        lang_code = lang_map.get(language, 'hi')
+        
+        # Generate speech
+        tts = gTTS(text=text, lang=lang_code, slow=False, timeout=timeout)
+        
+        # Save to bytes
+        audio_buffer = BytesIO()
+        tts.write_to_fp(audio_buffer)
+        audio_buffer.seek(0)
+        
+        print(f"Generated gTTS audio ({language}): {len(audio_buffer.getvalue())} bytes")
+        return audio_buffer.getvalue()
+        
+    except ImportError:
+        raise Exception("gTTS not installed")
+    except Exception as e:
+        raise Exception(f"gTTS error: {str(e)}")
+
+
+def _generate_with_pyttsx3(text, language='hi'):
+    """Generate speech using the pool of pre-initialized pyttsx3 workers
+    
+    Set PYTTSX3_WORKERS=0 to synthesize in-process instead.
+    
+    Args:
+        text: Text to speak
+        language: Language code
+        
+    Returns:
+        bytes: WAV audio data
+    """
+    if os.environ.get('PYTTSX3_WORKERS') == '0':
+        return _generate_with_pyttsx3_inprocess(text, language)
+    try:
+        audio_data = get_offline_tts_pool().synthesize(text, language)
+    except Exception as e:
+        raise Exception(f"pyttsx3 error: {str(e)}")
+    print(f"Generated pyttsx3 audio: {len(audio_data)} bytes")
+    return audio_data
+
+
+def _generate_with_pyttsx3_inprocess(text, language='hi'):
+    """Generate speech using a fresh pyttsx3 engine in this process
+    
+    Args:
+        text: Text to speak
+        language: Language code
+        
+    Returns:
+        bytes: WAV audio data
+    """
+    try:
+        import pyttsx3
+        
+        # Initialize engine
+        engine = pyttsx3.init()
+        
+        # Configure voice properties
+        engine.setProperty('rate', 150)  # Speed
+        engine.setProperty('volume', 0.9)  # Volume
+        
+        # Try to set language
+        try:
+            voices = engine.getProperty('voices')
+            for voice in voices:
+                if language.lower() in voice.languages[0].lower():
+                    engine.setProperty('voice', voice.id)
+                    break
+        except:
+            pass  # Use default voice
+        
+        # Create temporary file
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
+            tmp_path = tmp.name
+        
+        try:
+            # Save to file
+            engine.save_to_file(text, tmp_path)
+            engine.runAndWait()
+            engine.stop()
+            
+            # Read audio file
+            with open(tmp_path, 'rb') as f:
+                audio_data = f.read()
+            
+            print(f"Generated pyttsx3 audio: {len(audio_data)} bytes")
+            return audio_data
+            
+        finally:
+            # Clean up
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except:
+                    pass
+                    
+    except ImportError:
+        raise Exception("pyttsx3 not installed")
+    except Exception as e:
+        raise Exception(f"pyttsx3 error: {str(e)}")
+
+
+def generate_simple_tone():
+    """Generate a simple 440 Hz beep tone using only the Python standard library.
+    No numpy, no scipy — always available. The waveform is computed once per
+    process (see pcm.tone) and reused.
+    Returns raw WAV bytes.
+    """
+    try:
+        fmt = PCMFormat(channels=1, sample_width=2, rate=22050)
+        return pcm.to_wav(pcm.tone(frequency=440, duration=0.5, rate=fmt.rate, amplitude=0.25), fmt)
+    except Exception as e:
+        print("[TTS] Tone generation failed: {}".format(e))
+        return None
@@ -0,0 +1,188 @@
+"""
+Parallel batch translation with de-duplication and cache reuse
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .cache import copy_result
+
+# Per-process engine used by pool workers (set by _init_worker)
+_worker_engine = None
+
+
+def _init_worker(dictionary) -> None:
+    """Pool initializer: wrap the parent's dictionary in a worker-local engine"""
+    global _worker_engine
+    from .engine import TranslationEngine
+    _worker_engine = TranslationEngine(dictionary=dictionary, batch_workers=1)
+
+
+def _pool_context():
+    """Start method for pool workers that is safe from a threaded server
+
+    The pool is created lazily, typically inside a threaded gunicorn worker.
+    fork() there copies whatever locks other threads hold at that moment, so
+    workers are started by a fork server (or spawned where there is none).
+    The dictionary reaches them pickled once, as the initializer argument.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _default_workers() -> int:
+    """Pool size when the caller does not choose one
+
+    BATCH_WORKERS wins when set. Under a preloading server (TRANSLATOR_PRELOAD,
+    see gunicorn.conf.py) every server worker would start its own pool, each
+    process holding a private, unpickled copy of the dictionary that the
+    preload shares copy-on-write, so batches run in-process there; the server
+    workers already use the cores. Otherwise the pool matches the CPU count.
+    """
+    configured = os.environ.get('BATCH_WORKERS', '').strip()
+    if configured:
+        return max(1, int(configured))
+    if os.environ.get('TRANSLATOR_PRELOAD', '').lower() in ('1', 'true', 'yes'):
+        return 1
+    return os.cpu_count() or 1
+
+
+def _translate_in_worker(args: Tuple[str, str, str]) -> Tuple[Dict, float]:
+    """Translate one text in a pool worker and time it"""
+    text, source_lang, target_lang = args
+    start = time.perf_counter()
+    result = _worker_engine.translate(text, source_lang, target_lang)
+    return result, (time.perf_counter() - start) * 1000
+
+
+class BatchExecutor:
+    """Translate batches in input order, fanning uncached work out to processes
+
+    Identical inputs are translated once and cached results are served
+    directly from the engine's cache. The remaining texts go to a process pool
+    (see _default_workers for its size); each worker holds a copy of the
+    engine's dictionary, passed once at worker start-up (see _pool_context).
+    The pool is recreated when the dictionary changes, and the executor falls
+    back to translating in-process for small batches or when processes are
+    unavailable (e.g. no /dev/shm on some serverless hosts).
+
+    One executor serves every request thread of a server worker: the pool is
+    created and replaced under a lock, and a replaced pool finishes the work
+    already handed to it before its processes exit.
+    """
+
+    def __init__(self, engine, max_workers: Optional[int] = None, min_parallel: int = 16):
+        """Initialize batch executor
+
+        Args:
+            engine: TranslationEngine that owns the cache and dictionary
+            max_workers: Worker processes (defaults to _default_workers(); 1
+                disables the pool)
+            min_parallel: Smallest number of uncached texts worth sending to the pool
+        """
+        self.engine = engine
+        self.max_workers = max_workers or _default_workers()
+        self.min_parallel = min_parallel
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pool_version = None
+        self._pool_disabled = self.max_workers <= 1
+
+    def translate(self, texts: List[str], source_lang: str, target_lang: str) -> List[Dict]:
+        """Translate texts, returning one result per input in input order
+
+        Each result carries 'elapsed_ms' (time spent producing it) and 'cached'
+        (served from the cache or from an identical earlier input).
+        """
+        engine = self.engine
+        results: List[Optional[Dict]] = [None] * len(texts)
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(text, []).append(i)
+
+        pending = []
+        for text, indices in positions.items():
+            start = time.perf_counter()
+            cached = engine.get_cached(text, source_lang, target_lang) if text and text.strip() else None
+            if cached is None:
+                pending.append(text)
+            else:
+                self._fill(results, indices, cached, (time.perf_counter() - start) * 1000, True)
+
+        for text, (result, elapsed_ms) in zip(pending, self._run(pending, source_lang, target_lang)):
+            self._fill(results, positions[text], result, elapsed_ms, False)
+        return results
+
+    @staticmethod
+    def _fill(results, indices, result, elapsed_ms, cached) -> None:
+        """Place a result (and independent copies for duplicates) at its positions"""
+        for n, i in enumerate(indices):
+            item = result if n == 0 else copy_result(result)
+            item['elapsed_ms'] = round(elapsed_ms, 3)
+            item['cached'] = cached or n > 0
+            results[i] = item
+
+    def _run(self, texts, source_lang, target_lang):
+        """Yield (result, elapsed_ms) for uncached texts, in order"""
+        pool = self._get_pool() if len(texts) >= self.min_parallel else None
+        if pool is not None:
+            chunksize = max(1, len(texts) // (self.max_workers * 4))
+            try:
+                outputs = list(pool.map(_translate_in_worker,
+                                        [(t, source_lang, target_lang) for t in texts],
+                                        chunksize=chunksize))
+            except Exception as e:
+                print("[WARN] Batch pool failed, translating in-process: {}".format(repr(e)))
+                self._retire(pool)
+                outputs = None
+            if outputs is not None:
+                for text, (result, elapsed_ms) in zip(texts, outputs):
+                    self.engine.store_cached(text, source_lang, target_lang, result)
+                    yield result, elapsed_ms
+                return
+
+        for text in texts:
+            start = time.perf_counter()
+            # Already looked up in translate(); probing again would count a second miss
+            result = self.engine._translate_uncached(text, source_lang, target_lang)
+            yield result, (time.perf_counter() - start) * 1000
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return a pool whose workers hold the current dictionary"""
+        if self._pool_disabled:
+            return None
+        version = self.engine.dictionary.version
+        with self._lock:
+            if self._pool is not None and self._pool_version != version:
+                # Other threads may still be mapping on it: let their work finish
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            if self._pool is None and not self._pool_disabled:
+                try:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=_pool_context(),
+                                                     initializer=_init_worker,
+                                                     initargs=(self.engine.dictionary,))
+                    self._pool_version = version
+                except (OSError, NotImplementedError, ImportError) as e:
+                    print("[WARN] Process pool unavailable, batches run in-process: {}".format(repr(e)))
+                    self._pool_disabled = True
+            return self._pool
+
+    def _retire(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a failed pool, unless another thread has already replaced it"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a new pool is started on demand)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,137 @@
+"""
+Bounded LRU cache for translation results
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .word_mapping import WordMapping
+
+
+def copy_result(value):
+    """Copy the dict/list structure of a result so callers never share it
+
+    WordMapping records are read-only and are shared rather than copied.
+    """
+    if isinstance(value, dict):
+        return {k: copy_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_result(v) for v in value]
+    return value
+
+
+def _approx_size(value) -> int:
+    """Approximate memory footprint of a result in bytes"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += sys.getsizeof(k) + _approx_size(v)
+    elif isinstance(value, list):
+        for v in value:
+            size += _approx_size(v)
+    elif isinstance(value, WordMapping):
+        for v in value.values():
+            size += sys.getsizeof(v)
+    return size
+
+
+class TranslationCache:
+    """Thread-safe LRU cache bounded by entry count and approximate bytes
+
+    Entries optionally expire after a TTL. Values are copied on the way in and
+    on the way out, so a caller mutating a returned result cannot corrupt the
+    cached copy or another caller's result.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: Optional[float] = None):
+        """Initialize cache
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum approximate size of all cached results
+            ttl: Seconds before an entry expires (None = never)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, size, stored_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy_result(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a copy of a result, evicting least recently used entries"""
+        value = copy_result(value)
+        size = _approx_size(key) + _approx_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def invalidate(self) -> None:
+        """Drop all entries because the underlying dictionary changed"""
+        self.clear()
+        self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'approx_bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
@@ -0,0 +1,484 @@
+"""
+Dictionary management module for Hindi-Santali translations
+Optimized for speed and accuracy
+"""
+
+import csv
+import os
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+import unicodedata
+from .fuzzy_index import FuzzyIndex, fold_olchiki
+from .morphology import HINDI_MORPHOLOGY
+from .phrase_trie import PhraseTrie
+from .prefix_index import PrefixIndex
+
+class Dictionary:
+    """Manage Hindi-Santali dictionary with optimized lookups"""
+    
+    def __init__(self, dictionary_path='data/dictionary.csv'):
+        """Initialize dictionary
+        
+        Args:
+            dictionary_path: Path to dictionary CSV file
+        """
+        self.dictionary_path = dictionary_path
+        self.hindi_to_santali = {}
+        self.santali_to_hindi = {}
+        # Lowercase -> original Hindi key, only where the two differ (see
+        # _index_lower); Devanagari is uncased, so this stays small
+        self.hindi_lower = {}
+        # Lookup indexes are built lazily on first use (see _ensure_* below)
+        # so cold starts only pay for parsing the CSV
+        self._prefix_index = None
+        self.hindi_fuzzy_index = None  # Candidate pruning for fuzzy matching
+        self.santali_fuzzy_index = None
+        self.phrase_trie = None  # Token trie for longest-phrase matching
+        self.total_rows_loaded = 0
+        self.version = 0  # Bumped on every change so caches can invalidate
+        self.load_dictionary()
+    
+    def _normalize_text(self, text):
+        """Normalize text for better matching"""
+        if not text:
+            return ''
+        # Unicode NFC normalization (important for Devanagari composed vs decomposed forms)
+        text = unicodedata.normalize('NFC', text)
+        # Remove extra whitespace
+        text = ' '.join(text.strip().split())
+        return text
+    
+    def _is_valid_santali(self, text: str) -> bool:
+        """Return False for garbled/corrupted Santali entries.
+
+        Garbage entries (produced by broken transliteration of proper nouns)
+        look like: "ᱞᱧ ᱞᱞ ᱢ ᱳ ᱱᱞ ᱠᱳ ᱢ ᱰᱨᱠᱪᱢ ᱣ ᱯ"
+        — many space-separated single Ol Chiki characters.
+
+        Good entries look like: "ᱟᱜᱡᱪᱷᱛᱩ ᱤᱱ ᱾" or "ᱡᱚᱦᱟᱨ"
+        """
+        if not text:
+            return False
+        # Any ASCII a-z / A-Z in a Santali translation = definitely garbage
+        for ch in text:
+            if ch.isascii() and ch.isalpha():
+                return False
+        tokens = text.split()
+        if len(tokens) > 4:
+            single_char = sum(1 for t in tokens if len(t) == 1)
+            # If more than half the tokens are isolated single characters → garbled
+            if single_char / len(tokens) > 0.50:
+                return False
+        return True
+
+    def load_dictionary(self):
+        """Load dictionary from CSV file with optimization"""
+        if os.path.exists(self.dictionary_path):
+            try:
+                with open(self.dictionary_path, 'r', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    # Handle different column names (resolved once, not per row)
+                    hindi_col = self._find_column(header, ('hindi', 'Hindi'))
+                    santali_col = self._find_column(header, ('santali_olchiki', 'santali', 'Santali'))
+                    total_loaded = 0
+                    duplicates_skipped = 0
+                    hindi_to_santali = self.hindi_to_santali
+                    
+                    for row in reader:
+                        hindi = row[hindi_col].strip() if hindi_col is not None and hindi_col < len(row) else ''
+                        santali = row[santali_col].strip() if santali_col is not None and santali_col < len(row) else ''
+                        
+                        if hindi and santali:
+                            # Skip rows that are duplicate header entries
+                            if hindi.lower() in ('hindi', 'h') or santali.lower() in ('santali', 's'):
+                                continue
+                            # Skip single-character Devanagari entries — they belong
+                            # only in the letter-level transliteration map, NOT as word
+                            # lookups (they corrupt multi-word lookups: एक→long junk, नदी→spaced)
+                            if len(hindi) == 1:
+                                continue
+                            # Skip garbled/corrupted Santali values
+                            if not self._is_valid_santali(santali):
+                                continue
+                            # Normalize
+                            hindi = self._normalize_text(hindi)
+                            santali = self._normalize_text(santali)
+                            
+                            # Skip duplicates
+                            if hindi in hindi_to_santali:
+                                duplicates_skipped += 1
+                                continue
+                            
+                            # Store with original case (primary lookup)
+                            hindi_to_santali[hindi] = santali
+                            self.santali_to_hindi[santali] = hindi
+                            total_loaded += 1
+                            
+                            # Build lowercase index for case-insensitive matching
+                            self._index_lower(hindi)
+                
+                self.total_rows_loaded = total_loaded
+            except Exception as e:
+                print("[WARN] Error loading dictionary: {}".format(repr(e)))
+                self._initialize_basic_dictionary()
+                return
+            # Print success outside try/except so a print encoding error
+            # does NOT trigger the except clause and wipe the loaded data.
+            try:
+                print("[OK] Loaded {} Hindi-Santali pairs ({} duplicates skipped)".format(
+                    total_loaded, duplicates_skipped))
+            except Exception:
+                print("[OK] Loaded {} pairs".format(total_loaded))
+            self._reset_indexes()
+        else:
+            print("[WARN] Dictionary file not found at {}".format(self.dictionary_path))
+            self._initialize_basic_dictionary()
+    
+    
+    def _initialize_basic_dictionary(self):
+        """Initialize with basic Hindi-Santali word mappings"""
+        basic_words = {
+            'नमस्ते': 'जोहार',
+            'धन्यवाद': 'सोनोज़',
+            'हाँ': 'एले',
+            'नहीं': 'माहा',
+            'पानी': 'तुरु',
+            'खाना': 'होपोर्',
+            'दिन': 'अदिल',
+            'रात': 'राति',
+            'सूरज': 'सूर्य',
+            'चाँद': 'चंद्र',
+            'आँख': 'मेंदा',
+            'कान': 'कुलु',
+            'नाक': 'नाटा',
+            'दांत': 'दाँत',
+            'हाथ': 'सेल',
+            'पैर': 'होरो',
+            'सिर': 'जोहोल',
+            'हृदय': 'हिया',
+            'रक्त': 'कु',
+            'घर': 'ओडि',
+            'गली': 'पथा',
+            'मार्ग': 'पथा',
+            'विद्यालय': 'स्कूल',
+            'पुस्तक': 'किताब',
+            'कलम': 'लिख',
+            'कागज': 'कागद',
+            'शिक्षक': 'सिक्षक',
+            'विद्यार्थी': 'छात्र',
+            'हेलो': 'हेलो',
+            'नमस्ते': 'जोहार',
+            'अलविदा': 'अलविदा',
+            'प्रणाम': 'जोहार',
+            'आपका स्वागत है': 'जोहार',
+            'कैसे हो': 'की कोडा',
+            'ठीक हूँ': 'अक्छे छिहै',
+            'क्या नाम है': 'ने नाय की छिहै',
+            'मेरा नाम': 'अम् नाय',
+            'कृपया': 'माइ',
+            'मदद': 'दीरी',
+            'पसंद': 'दिसाग',
+            'प्रेम': 'लेबे',
+            'दोस्त': 'दोस्त',
+            'परिवार': 'हातेम',
+            'माता': 'अय',
+            'पिता': 'अप',
+            'भाई': 'आयत',
+            'बहन': 'तांग',
+            'बेटा': 'पोरो',
+            'बेटी': 'पोरोय',
+            'पत्नी': 'पेंत',
+            'पति': 'अवोर',
+            'बुजुर्ग': 'बोड़ो',
+            'बच्चा': 'छोटो',
+            'छोटा': 'हेड़ो',
+            'बड़ा': 'बाड़ो',
+            'अच्छा': 'अक्छे',
+            'बुरा': 'बेड़ो',
+            'सुंदर': 'रंगा',
+            'काला': 'कारा',
+            'सफेद': 'पेत',
+            'लाल': 'लाल',
+            'हरा': 'हरे',
+            'नीला': 'नील',
+            'पीला': 'पीला',
+            'गर्म': 'तपा',
+            'ठंडा': 'सीता',
+            'गीला': 'भेड़ो',
+            'सूखा': 'सूका',
+            'तेज': 'तिज',
+            'धीमा': 'मीना',
+            'मीठा': 'मीठो',
+            'कड़वा': 'कड़वो',
+            'नमकीन': 'खारो',
+            'खट्टा': 'खारो',
+        }
+        self.hindi_to_santali = basic_words
+        self.santali_to_hindi = {v: k for k, v in basic_words.items()}
+        self._reset_indexes()
+
+    @staticmethod
+    def _find_column(header, names):
+        """Index of the first column in header named like one of names"""
+        for name in names:
+            if name in header:
+                return header.index(name)
+        return None
+
+    def _reset_indexes(self):
+        """Drop derived indexes after a bulk load; they rebuild on first use"""
+        self.version += 1
+        self._prefix_index = None
+        self.hindi_fuzzy_index = None
+        self.santali_fuzzy_index = None
+        self.phrase_trie = None
+
+    def _ensure_phrase_trie(self) -> PhraseTrie:
+        """Build the phrase trie if missing or stale"""
+        # Entries written straight into hindi_to_santali bypass add_word
+        if self.phrase_trie is None or len(self.phrase_trie) != len(self.hindi_to_santali):
+            self.phrase_trie = PhraseTrie(self.hindi_to_santali)
+        return self.phrase_trie
+
+    def _ensure_hindi_fuzzy_index(self) -> FuzzyIndex:
+        """Build the Hindi fuzzy-match index if missing or stale"""
+        if self.hindi_fuzzy_index is None or len(self.hindi_fuzzy_index) != len(self.hindi_to_santali):
+            self.hindi_fuzzy_index = FuzzyIndex(self.hindi_to_santali)
+        return self.hindi_fuzzy_index
+
+    def _ensure_santali_fuzzy_index(self) -> FuzzyIndex:
+        """Build the Santali fuzzy-match index if missing or stale"""
+        if self.santali_fuzzy_index is None or len(self.santali_fuzzy_index) != len(self.santali_to_hindi):
+            self.santali_fuzzy_index = FuzzyIndex(self.santali_to_hindi, fold=fold_olchiki)
+        return self.santali_fuzzy_index
+
+    def build_indexes(self) -> None:
+        """Build every lazy index now rather than on first use"""
+        self._ensure_phrase_trie()
+        self._ensure_hindi_fuzzy_index()
+        self._ensure_santali_fuzzy_index()
+        self.prefix_index
+
+    @property
+    def prefix_index(self) -> PrefixIndex:
+        """Prefix -> Hindi keys starting with it, built on first access"""
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex(self.hindi_to_santali)
+        return self._prefix_index
+
+    def _index_lower(self, hindi: str) -> None:
+        """Record hindi as the key that case-insensitive lookups resolve to
+        
+        The latest key with a given lowercase form wins. When that key is its
+        own lowercase form no entry is needed, since probe_hindi falls back
+        to looking up the lowercase form directly.
+        """
+        lower = hindi.lower()
+        if lower == hindi:
+            self.hindi_lower.pop(lower, None)
+        else:
+            self.hindi_lower[lower] = hindi
+    
+    def normalize_key(self, text: str) -> str:
+        """Key form expected by the probe_* methods (NFC, single spaces)
+        
+        Normalize a text once and probe with its tokens, rather than calling
+        the lookup_* methods, which normalize their argument on every call.
+        """
+        return self._normalize_text(text)
+
+    def probe_hindi(self, key: str) -> Optional[str]:
+        """Exact then lowercase lookup of a normalized Hindi key"""
+        santali = self.hindi_to_santali.get(key)
+        if santali is not None:
+            return santali
+        lower = key.lower()
+        return self.hindi_to_santali.get(self.hindi_lower.get(lower, lower))
+
+    def probe_hindi_stem(self, key: str) -> Optional[str]:
+        """Look up a normalized inflected Hindi word by its stem
+        
+        Suffixes are matched from the end of the word in one pass (see
+        morphology.SuffixTrie); stems are tried in suffix priority order.
+        """
+        for stem in HINDI_MORPHOLOGY.stems(key):
+            santali = self.probe_hindi(stem)
+            if santali:
+                return santali
+        return None
+
+    def probe_hindi_fuzzy(self, key: str, threshold: float = 0.7) -> Optional[Tuple[str, float]]:
+        """fuzzy_match_hindi_to_santali for a normalized key"""
+        match = self._ensure_hindi_fuzzy_index().best_match(key.lower(), threshold)
+        if match is None:
+            return None
+        dictionary_word, similarity = match
+        return (self.hindi_to_santali[dictionary_word], similarity)
+
+    def probe_santali(self, key: str) -> Optional[str]:
+        """Exact lookup of a normalized Santali key"""
+        return self.santali_to_hindi.get(key)
+
+    def lookup_hindi_to_santali(self, hindi_word: str) -> Optional[str]:
+        """Look up Hindi word in dictionary - optimized for speed"""
+        if not hindi_word:
+            return None
+        
+        # Exact, then lowercase match
+        santali = self.probe_hindi(self._normalize_text(hindi_word))
+        if santali is not None:
+            return santali
+        
+        # Decomposed (NFD) keys written straight into hindi_to_santali
+        word_nfd = unicodedata.normalize('NFD', hindi_word).strip()
+        return self.hindi_to_santali.get(word_nfd)
+
+    def stem_lookup_hindi_to_santali(self, hindi_word: str) -> Optional[str]:
+        """Look up an inflected Hindi word by its stem (see probe_hindi_stem)"""
+        return self.probe_hindi_stem(self._normalize_text(hindi_word))
+
+    def lookup_santali_to_hindi(self, santali_word: str) -> Optional[str]:
+        """Look up Santali word in dictionary"""
+        if not santali_word:
+            return None
+        return self.probe_santali(self._normalize_text(santali_word))
+
+    def encode_tokens(self, tokens: Sequence[str]) -> array:
+        """Phrase trie token IDs for normalized tokens (see PhraseTrie.encode)"""
+        return self._ensure_phrase_trie().encode(tokens)
+
+    def longest_phrase_match(self, ids: Sequence[int], start: int) -> Tuple[int, Optional[str]]:
+        """Greedy longest dictionary match starting at ids[start]
+
+        Args:
+            ids: Token IDs of one sentence (see encode_tokens)
+            start: Index of the first token to match
+
+        Returns:
+            (number of tokens consumed, Santali translation) or (0, None)
+        """
+        length, hindi = self._ensure_phrase_trie().longest_match(ids, start)
+        if hindi is None:
+            return 0, None
+        return length, self.hindi_to_santali[hindi]
+
+    def max_phrase_tokens(self) -> int:
+        """Most tokens longest_phrase_match can consume (its lookahead span)"""
+        return max(1, self._ensure_phrase_trie().max_depth)
+
+    def phrase_match_span(self, ids: Sequence[int], start: int) -> int:
+        """Tokens from start that longest_phrase_match actually looks at"""
+        return self._ensure_phrase_trie().match_span(ids, start)
+
+    def add_word(self, hindi: str, santali: str) -> None:
+        """Add word pair to dictionary"""
+        hindi = self._normalize_text(hindi)
+        santali = self._normalize_text(santali)
+        self.hindi_to_santali[hindi] = santali
+        self._index_lower(hindi)
+        self.santali_to_hindi[santali] = hindi
+        # Keep already-built indexes current; unbuilt ones pick this up later
+        if self.hindi_fuzzy_index is not None:
+            self.hindi_fuzzy_index.add(hindi)
+        if self.santali_fuzzy_index is not None:
+            self.santali_fuzzy_index.add(santali)
+        if self.phrase_trie is not None:
+            self.phrase_trie.add(hindi)
+        self._prefix_index = None
+        self.version += 1
+
+    # State persisted by snapshot.save_snapshot; everything else is rebuilt lazily
+    _SNAPSHOT_FIELDS = (
+        'dictionary_path', 'hindi_to_santali', 'santali_to_hindi', 'hindi_lower',
+        'total_rows_loaded', 'hindi_fuzzy_index', 'santali_fuzzy_index',
+    )
+
+    def to_snapshot(self) -> Dict:
+        """Return the state to persist in a snapshot (fuzzy indexes included)"""
+        self._ensure_hindi_fuzzy_index()
+        self._ensure_santali_fuzzy_index()
+        return {field: getattr(self, field) for field in self._SNAPSHOT_FIELDS}
+
+    @classmethod
+    def from_snapshot(cls, state: Dict) -> 'Dictionary':
+        """Create a dictionary from snapshot state without reading the CSV"""
+        dictionary = cls.__new__(cls)
+        dictionary._prefix_index = None
+        dictionary.phrase_trie = None
+        dictionary.version = 0
+        for field in cls._SNAPSHOT_FIELDS:
+            setattr(dictionary, field, state[field])
+        return dictionary
+
+    def get_all_words(self) -> Dict[str, str]:
+        """Get all Hindi-Santali word pairs"""
+        return self.hindi_to_santali.copy()
+
+    def save_dictionary(self) -> None:
+        """Save dictionary to CSV file"""
+        try:
+            os.makedirs(os.path.dirname(self.dictionary_path), exist_ok=True)
+            with open(self.dictionary_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['hindi', 'santali'])
+                for hindi, santali in self.hindi_to_santali.items():
+                    if not hindi.islower() or hindi not in [h.lower() for h in self.hindi_to_santali.keys()]:
+                        writer.writerow([hindi, santali])
+        except Exception as e:
+            print("Error saving dictionary: {}".format(str(e)))
+
+    def search_words(self, query: str, source_lang: str = 'hi') -> List[Tuple[str, str]]:
+        """Search for words matching query - optimized"""
+        results: List[Tuple[str, str]] = []
+        query_lower = query.lower().strip()
+        
+        if not query_lower:
+            return results
+        
+        if source_lang == 'hi':
+            # Search in Hindi words
+            for hindi in self.hindi_to_santali.keys():
+                if hindi.islower() and hindi != hindi.lower():
+                    continue  # Skip lowercase duplicates
+                if query_lower in hindi.lower():
+                    santali = self.hindi_to_santali[hindi]
+                    results.append((hindi, santali))
+        else:
+            # Search in Santali words
+            for santali in self.santali_to_hindi.keys():
+                if query_lower in santali.lower():
+                    hindi = self.santali_to_hindi[santali]
+                    results.append((hindi, santali))
+        
+        return results[:20]  # Limit to top 20 results for speed
+
+    def fuzzy_match_hindi_to_santali(self, hindi_word: str, threshold: float = 0.7) -> Optional[Tuple[str, float]]:
+        """Find fuzzy match for Hindi word - pruned with the character index
+
+        Returns the same best match and score as a full SequenceMatcher scan
+        over hindi_to_santali, but only scores keys that can still beat it.
+        """
+        return self.probe_hindi_fuzzy(self._normalize_text(hindi_word), threshold)
+
+    def fuzzy_match_santali_to_hindi(self, santali_word: str, threshold: float = 0.7) -> Optional[Tuple[str, float]]:
+        """Find fuzzy match for Santali word - pruned with the character index
+
+        Same result as a full SequenceMatcher scan over santali_to_hindi; the
+        Ol Chiki keys are folded once at index time instead of on every call.
+        """
+        santali_word_lower = fold_olchiki(santali_word)
+
+        match = self._ensure_santali_fuzzy_index().best_match(santali_word_lower, threshold)
+        if match is None:
+            return None
+        dictionary_santali, similarity = match
+        return (self.santali_to_hindi[dictionary_santali], similarity)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get dictionary statistics"""
+        return {
+            'unique_pairs': len(self.hindi_to_santali),
+            'total_rows_loaded': getattr(self, 'total_rows_loaded', 0),
+        }
+
@@ -0,0 +1,139 @@
+"""
+Candidate-pruning index for fuzzy dictionary matching
+"""
+
+from array import array
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def fold_olchiki(text: str) -> str:
+    """Case-fold text, skipping the work for uncased Ol Chiki strings
+
+    Ol Chiki (U+1C50-U+1C7F) has no letter case, so lower() is the identity
+    for pure Ol Chiki keys; only mixed-script text needs folding.
+    """
+    for char in text:
+        if not ('\u1c50' <= char <= '\u1c7f' or char == ' '):
+            return text.lower()
+    return text
+
+
+class FuzzyIndex:
+    """Character inverted index that shortlists keys for SequenceMatcher scoring
+
+    SequenceMatcher.ratio() is 2*M / (len(a) + len(b)), where M (the number of
+    matched characters) can never exceed the multiset intersection of the two
+    strings' characters. That intersection is accumulated from per-character
+    posting lists, giving an upper bound for every key sharing at least one
+    character with the query. Keys are scored in descending bound order and the
+    scan stops once no remaining key can beat the best score, so the result is
+    identical to a full linear scan in insertion order (ties go to the earlier key).
+    """
+
+    def __init__(self, keys: Iterable[str] = (), fold: Callable[[str], str] = str.lower):
+        """Initialize index
+
+        Args:
+            keys: Initial keys, in dictionary insertion order
+            fold: Case-folding applied to keys (and expected of queries)
+        """
+        self.fold = fold
+        self._keys: List[str] = []            # original keys by id
+        self._folded: List[str] = []          # folded keys by id
+        self._exact: Dict[str, int] = {}      # folded key -> first id
+        # original key -> id, only for keys _exact does not already resolve
+        # (keys that change when folded, or repeat an earlier folded key)
+        self._ids: Dict[str, int] = {}
+        # char -> (key ids, per-key occurrence counts); arrays keep this compact
+        # and make snapshots cheap to unpickle
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return self._id_of(key) is not None
+
+    def _id_of(self, key) -> Optional[int]:
+        """Id of an indexed original key, or None"""
+        idx = self._ids.get(key)
+        if idx is None:
+            idx = self._exact.get(key)
+            if idx is not None and self._keys[idx] != key:
+                idx = None
+        return idx
+
+    def add(self, key: str) -> None:
+        """Add a key (no-op if it is already indexed)"""
+        if self._id_of(key) is not None:
+            return
+        idx = len(self._keys)
+        folded = self.fold(key)
+        if folded == key:
+            folded = key  # share the string instead of keeping an equal copy
+        self._keys.append(key)
+        self._folded.append(folded)
+        if self._exact.setdefault(folded, idx) != idx or folded is not key:
+            self._ids[key] = idx
+        for char, count in Counter(folded).items():
+            posting = self._postings.get(char)
+            if posting is None:
+                posting = self._postings[char] = (array('i'), array('i'))
+            posting[0].append(idx)
+            posting[1].append(count)
+
+    def best_match(self, query: str, threshold: float) -> Optional[Tuple[str, float]]:
+        """Find the key most similar to an already-folded query
+
+        Args:
+            query: Query string, folded with the same fold as the keys
+            threshold: Score a key must strictly exceed to be returned
+
+        Returns:
+            (key, similarity) or None if no key scores above threshold
+        """
+        if not query:
+            return None
+
+        exact = self._exact.get(query)
+        if exact is not None:
+            return (self._keys[exact], 1.0)
+
+        # Accumulate shared-character counts per candidate key
+        overlap: Dict[int, int] = {}
+        for char, count in Counter(query).items():
+            posting = self._postings.get(char)
+            if posting is None:
+                continue
+            for idx, key_count in zip(*posting):
+                overlap[idx] = overlap.get(idx, 0) + (count if count < key_count else key_count)
+
+        query_len = len(query)
+        folded = self._folded
+        candidates = []
+        for idx, common in overlap.items():
+            bound = 2.0 * common / (query_len + len(folded[idx]))
+            if bound > threshold:
+                candidates.append((-bound, idx))
+        candidates.sort()
+
+        best_idx = None
+        best_score = threshold
+        for neg_bound, idx in candidates:
+            bound = -neg_bound
+            if bound < best_score:
+                break
+            if bound == best_score and (best_idx is None or idx > best_idx):
+                continue
+            score = SequenceMatcher(None, query, folded[idx]).ratio()
+            if score > best_score or (score == best_score and best_idx is not None and idx < best_idx):
+                best_score = score
+                best_idx = idx
+
+        if best_idx is None:
+            return None
+        return (self._keys[best_idx], best_score)
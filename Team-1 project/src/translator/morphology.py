@@ -0,0 +1,55 @@
+"""
+Hindi suffix stripping for dictionary stem lookup
+
+Suffixes are stored reversed in a character trie, so every suffix a word ends
+with is found in one walk from its last character, however many suffixes are
+configured. The candidate stems then cost one dictionary probe each.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+# Common Hindi suffixes; when several end a word, the earlier one wins
+HINDI_SUFFIXES = (
+    'ाओं', 'ियों', 'ियाँ', 'ाएँ', 'कर', 'ने', 'की', 'का', 'के',
+    'में', 'से', 'पर', 'को', 'ता', 'ती', 'ते', 'ना', 'नी',
+    'ाँ', 'ों', 'ें', 'ां', 'ा', 'ी', 'े', 'ो', 'ु', 'ू',
+)
+
+_END = None  # node key holding the priority of a complete suffix
+
+
+class SuffixTrie:
+    """Reversed-character trie over a prioritized suffix list"""
+
+    def __init__(self, suffixes: Iterable[str], min_stem: int = 2):
+        """Initialize trie
+
+        Args:
+            suffixes: Suffixes in priority order (first = preferred)
+            min_stem: Shortest stem (in characters) left after stripping
+        """
+        self.min_stem = min_stem
+        self._root: Dict = {}
+        for priority, suffix in enumerate(suffixes):
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node.setdefault(_END, priority)
+
+    def stems(self, word: str) -> List[str]:
+        """Stems of word for every suffix it ends with, preferred suffix first"""
+        found: List[Tuple[int, str]] = []
+        node = self._root
+        limit = len(word) - self.min_stem
+        for length in range(1, limit + 1):
+            node = node.get(word[-length])
+            if node is None:
+                break
+            priority = node.get(_END)
+            if priority is not None:
+                found.append((priority, word[:-length]))
+        found.sort()
+        return [stem for _, stem in found]
+
+
+HINDI_MORPHOLOGY = SuffixTrie(HINDI_SUFFIXES)
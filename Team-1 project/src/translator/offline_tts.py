@@ -0,0 +1,228 @@
+"""
+Pool of long-lived pyttsx3 worker processes
+
+pyttsx3.init() and the voice scan cost far more than speaking a phrase, so
+each worker does them once and then serves requests over a pipe. pyttsx3 can
+only render to a file path, so every worker reuses one scratch file (on tmpfs
+when available) and sends the bytes back; callers never touch the filesystem.
+"""
+
+import atexit
+import os
+import queue
+import tempfile
+import threading
+from typing import Optional
+
+from .batch import _pool_context
+
+_ERROR, _OK = 'error', 'ok'
+
+
+def _scratch_dir() -> str:
+    """RAM-backed directory when the host has one"""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def _worker_main(conn, rate: int, volume: float) -> None:
+    """Worker process: initialize pyttsx3 once, then synthesize on request"""
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+        engine.setProperty('rate', rate)
+        engine.setProperty('volume', volume)
+        default_voice = engine.getProperty('voice')
+        voices = []
+        try:
+            for voice in engine.getProperty('voices'):
+                language = voice.languages[0] if voice.languages else ''
+                if isinstance(language, bytes):
+                    language = language.decode('utf-8', errors='ignore')
+                voices.append((language.lower(), voice.id))
+        except Exception:
+            pass  # Use default voice
+    except Exception as e:
+        conn.send((_ERROR, 'pyttsx3 unavailable: {}'.format(e)))
+        return
+    conn.send((_OK, None))
+
+    scratch = os.path.join(_scratch_dir(), 'pyttsx3-{}.wav'.format(os.getpid()))
+    voice_for = {}
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            text, language = request
+            try:
+                if language not in voice_for:
+                    voice_for[language] = next(
+                        (vid for lang, vid in voices if language.lower() in lang), default_voice)
+                engine.setProperty('voice', voice_for[language])
+                engine.save_to_file(text, scratch)
+                engine.runAndWait()
+                with open(scratch, 'rb') as f:
+                    conn.send((_OK, f.read()))
+            except Exception as e:
+                conn.send((_ERROR, str(e)))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        try:
+            os.remove(scratch)
+        except OSError:
+            pass
+
+
+class _Worker:
+    def __init__(self, ctx, rate: int, volume: float, start_timeout: float):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, rate, volume), daemon=True)
+        self.process.start()
+        child_conn.close()
+        if not self.conn.poll(start_timeout):
+            self.kill()
+            raise RuntimeError("pyttsx3 worker did not start in {:.0f}s".format(start_timeout))
+        status, message = self.conn.recv()
+        if status != _OK:
+            self.kill()
+            raise RuntimeError(message)
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+class OfflineTTSPool:
+    """Pre-initialized pyttsx3 processes shared by all request threads"""
+
+    def __init__(self, size: int = 2, rate: int = 150, volume: float = 0.9,
+                 start_timeout: float = 15.0):
+        """Initialize pool (workers start on first use, or via warm())
+
+        Args:
+            size: Number of worker processes
+            rate: Speech rate passed to pyttsx3
+            volume: Volume passed to pyttsx3
+            start_timeout: Seconds allowed for a worker's pyttsx3.init()
+        """
+        self.size = size
+        self.rate = rate
+        self.volume = volume
+        self.start_timeout = start_timeout
+        # Workers start lazily on TTS threads, so never by a bare fork()
+        self._ctx = _pool_context()
+        self._idle = queue.Queue()
+        self._started = 0
+        self._lock = threading.Lock()
+        self.unavailable = None  # reason, once workers are known not to start
+        self.restarts = 0
+
+    def _checkout(self, timeout: float) -> _Worker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self.unavailable:
+                raise RuntimeError(self.unavailable)
+            if self._started < self.size:
+                try:
+                    worker = _Worker(self._ctx, self.rate, self.volume, self.start_timeout)
+                except (RuntimeError, OSError) as e:
+                    self.unavailable = str(e)
+                    raise RuntimeError(self.unavailable)
+                self._started += 1
+                return worker
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No pyttsx3 worker free within {:.1f}s".format(timeout))
+
+    def _discard(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self._started -= 1
+            self.restarts += 1
+
+    def warm(self) -> None:
+        """Start all workers now instead of on first use"""
+        workers = []
+        try:
+            for _ in range(self.size - self._started):
+                workers.append(self._checkout(self.start_timeout))
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def synthesize(self, text: str, language: str = 'hi', timeout: float = 10.0) -> Optional[bytes]:
+        """Speak text in a worker process
+
+        Args:
+            text: Text to speak
+            language: Language code used to pick a voice
+            timeout: Seconds to wait for the audio
+
+        Returns:
+            bytes: WAV audio data
+
+        Raises:
+            RuntimeError: If pyttsx3 is unavailable or the worker failed
+            TimeoutError: If no audio arrived in time (the worker is replaced)
+        """
+        worker = self._checkout(timeout)
+        try:
+            worker.conn.send((text, language))
+            if not worker.conn.poll(timeout):
+                raise TimeoutError("pyttsx3 worker timed out after {:.1f}s".format(timeout))
+            status, payload = worker.conn.recv()
+        except BaseException:
+            self._discard(worker)
+            raise
+        self._idle.put(worker)
+        if status != _OK:
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self) -> None:
+        """Stop all idle workers"""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(timeout=1)
+            worker.kill()
+            with self._lock:
+                self._started -= 1
+
+    def get_stats(self) -> dict:
+        return {
+            'size': self.size,
+            'started': self._started,
+            'idle': self._idle.qsize(),
+            'restarts': self.restarts,
+            'unavailable': self.unavailable,
+        }
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def get_offline_tts_pool() -> OfflineTTSPool:
+    """Process-wide pool sized by PYTTSX3_WORKERS (default 2)"""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = OfflineTTSPool(size=int(os.environ.get('PYTTSX3_WORKERS', '2')))
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -0,0 +1,272 @@
+"""
+Devanagari to Ol Chiki Script Converter
+Based on: https://github.com/Prasanta-Hembram/Devanagari-to-Ol-Chiki-Script-Converter-tool
+License: CC0 1.0 Universal (Public Domain)
+"""
+
+import re
+
+
+class OlChikiConverter:
+    """Converts Devanagari script to Ol Chiki script for Santali language"""
+    
+    # Devanagari to Ol Chiki character mappings
+    SUBSTITUTIONS = {
+        # Special phrases (longest patterns first)
+        "उदुगोक् आ": "ᱩᱫᱩᱜᱚᱜᱼᱟ",
+        "आ़च् किर": "ᱟᱹᱛᱠᱤᱨ",
+        "मेसाक् आ": "ᱢᱮᱥᱟᱜᱼᱟ",
+        "ओनोल": "ᱚᱱᱚᱞ",
+        "चेदाक्": "ᱪᱮᱫᱟᱜ",
+        "ओल": "ᱚᱞ",
+        "रिच्": "ᱨᱤᱡ",
+        "उचा": "ᱩᱪᱟᱹ",
+        "ड़ोक्": "ᱲᱚᱜ",
+        "नाक्": "ᱱᱟᱜ",
+        "इप": "ᱭᱤᱯ",
+        "ड़ो": "ᱲᱚ",
+        "ड़ि": "ᱲᱤ",
+        "नुक्": "ᱱᱩᱜ",
+        "झा़": "ᱡᱷᱟᱹ",
+        "बा़": "ᱵᱟᱹ",
+        "विं": "ᱣᱤᱱ",
+        "ाक्": "ᱟᱜ",
+        "ोक्": "ᱚᱜ",
+        
+        # Vowels with diacritics
+        "ऀ": "ऀ",
+        "ँ": "ᱸ",
+        "ं": "ᱸ",
+        "ः": "ᱷ",
+        "ऄ": "ऄ",
+        "आ़": "ᱟᱹ",
+        "अ": "ᱚ",
+        "आ": "ᱟ",
+        "इ": "ᱤ",
+        "ई": "ᱤᱻ",
+        "उ": "ᱩ",
+        "ऊ": "ᱩᱻ",
+        "ऋ": "ᱨᱩ",
+        "ऌ": "ᱞᱩ",
+        "ऍ": "ᱚᱹ",
+        "ऎ": "ᱮᱹ",
+        "ए": "ᱮ",
+        "ऐ": "ᱚᱤ",
+        "ऑ": "ᱟᱹ",
+        "ऒ": "ᱳ",
+        "ओ": "ᱳ",
+        "औ": "ᱚᱣ",
+        
+        # Consonants
+        "क्": "ᱠ",
+        "क": "ᱠ",
+        "ख": "ᱠᱷ",
+        "ग": "ᱜ",
+        "घ": "ᱜᱷ",
+        "ङ": "ᱝ",
+        "च्": "ᱡ",
+        "च": "ᱪ",
+        "छ": "ᱪᱷ",
+        "ज": "ᱡ",
+        "झ": "ᱡᱷ",
+        "ञ": "ᱧ",
+        "ट": "ᱴ",
+        "ठ": "ᱴᱷ",
+        "ड": "ᱰ",
+        "ढ": "ᱰᱷ",
+        "ण": "ᱬ",
+        "त्": "ᱫ",
+        "त": "ᱛ",
+        "थ": "ᱛᱷ",
+        "द": "ᱫ",
+        "ध": "ᱫᱷ",
+        "न": "ᱱ",
+        "ऩ": "ᱱ",
+        "प": "ᱯ",
+        "फ": "ᱯᱷ",
+        "ब": "ᱵ",
+        "भ": "ᱵᱷ",
+        "म": "ᱢ",
+        "य": "ᱭ",
+        "र": "ᱨ",
+        "ऱ": "ᱨ",
+        "ल": "ᱞ",
+        "ळ": "ᱞ",
+        "ऴ": "ᱞ",
+        "व": "ᱣ",
+        "श": "ᱥ",
+        "ष": "ᱥ",
+        "स": "ᱥ",
+        "ह": "ᱦ",
+        "ऺ": "",
+        "ला़": "ᱞᱟᱹ",
+        "ऻ": "ᱟ",
+        
+        # Vowel signs
+        "ा़": "ᱟᱹ",
+        "ा": "ᱟ",
+        "ि": "ᱤ",
+        "ी": "ᱤ",
+        "ु": "ᱩ",
+        "ू": "ᱩ",
+        "ृ": "ᱨᱩ",
+        "ॄ": "ᱨᱩ",
+        "ॅ": "ᱟᱸ",
+        "ॆ": "ᱮ",
+        "े": "ᱮ",
+        "ै": "ᱮᱭ",
+        "ॉ": "ᱟᱸ",
+        "ॊ": "ᱚ",
+        "ो": "ᱚ",
+        "ौ": "ᱚᱣ",
+        "्": "",
+        "ॎ": "ᱮ",
+        "ॏ": "ॏ",
+        "ॐ": "ᱳᱸ",
+        "॑": "↑",
+        "॒": "↓",
+        "॓": "॓",
+        "॔": "॔",
+        "ॕ": "ᱚᱸ",
+        "ॖ": "ᱩ",
+        "ॗ": "ᱩ",
+        
+        # Nukta variants
+        "क़": "ᱠᱚ",
+        "ख़": "ᱠᱷᱚ",
+        "ग़": "ᱜ",
+        "ज़": "ᱡ",
+        "ड़": "ᱲ",
+        "ढ़": "ᱰᱷ",
+        "फ़": "ᱯ",
+        "य़": "ᱭ",
+        
+        # Additional characters
+        "ॠ": "ᱨᱩ",
+        "ॡ": "ᱞᱩ",
+        "ॢ": "ᱞᱩ",
+        "ॣ": "ᱞᱩ",
+        
+        # Punctuation
+        "।": "᱾",
+        "॥": "᱿",
+        ".": "᱾",
+        
+        # Numbers
+        "०": "᱐",
+        "१": "᱑",
+        "२": "᱒",
+        "३": "᱓",
+        "४": "᱔",
+        "५": "᱕",
+        "६": "᱖",
+        "७": "᱗",
+        "८": "᱘",
+        "९": "᱙",
+        
+        # Other
+        "॰": "॰",
+        "ॱ": "ॱ",
+        "ॲ": "ᱚᱹ",
+        "ॳ": "ᱚ",
+        "ॴ": "ᱟ",
+        "ॵ": "ᱚᱣ",
+        "ॶ": "ᱩ",
+        "ॷ": "ᱩ",
+    }
+    
+    @classmethod
+    def convert(cls, devanagari_text):
+        """
+        Convert Devanagari text to Ol Chiki script
+        
+        Uses the tables precompiled at import time: one regex scan for the
+        multi-character patterns, then one str.translate pass for single
+        characters. Output is identical to applying SUBSTITUTIONS one by one,
+        longest first.
+        
+        Args:
+            devanagari_text (str): Text in Devanagari script
+            
+        Returns:
+            str: Text converted to Ol Chiki script
+        """
+        if not devanagari_text:
+            return ""
+        
+        table = cls._MULTI_TABLE
+        result = cls._MULTI_PATTERN.sub(lambda m: table[m.group()], devanagari_text)
+        return result.translate(cls._CHAR_TABLE)
+    
+    @classmethod
+    def _convert_sequential(cls, devanagari_text):
+        """Reference conversion: one str.replace pass per substitution, longest first"""
+        result = devanagari_text
+        for devanagari, olchiki in sorted(cls.SUBSTITUTIONS.items(), key=lambda x: len(x[0]), reverse=True):
+            result = result.replace(devanagari, olchiki)
+        return result
+    
+    @classmethod
+    def _compile(cls):
+        """Build the multi-character pattern, its replacement table and the
+        single-character translate table
+        
+        Single-character outputs never contain other keys, so those passes are
+        order-independent and collapse into one str.translate. For the longer
+        patterns, sequential replacement lets a longer pattern win even when a
+        shorter one starts earlier and overlaps it (e.g. "ओला़" becomes
+        "ओ" + "ला़", not "ओल" + "ा़"). A leftmost-longest scan would differ
+        there, so every overlapping pair of patterns whose outputs disagree is
+        added as a composite pattern carrying the sequential result, until
+        none remain.
+        """
+        # Code-point-indexed list: str.translate indexes it directly (faster
+        # than a dict for Devanagari); characters past the end stay unchanged
+        singles = {k: v for k, v in cls.SUBSTITUTIONS.items() if len(k) == 1}
+        char_table = [chr(i) for i in range(max(map(ord, singles)) + 1)]
+        for devanagari, olchiki in singles.items():
+            char_table[ord(devanagari)] = olchiki
+        table = {k: v for k, v in cls.SUBSTITUTIONS.items() if len(k) > 1}
+        all_keys = sorted(cls.SUBSTITUTIONS, key=len, reverse=True)
+        while True:
+            pattern = re.compile('|'.join(re.escape(k) for k in sorted(table, key=len, reverse=True)))
+            composites = {}
+            for left in all_keys:
+                for right in all_keys:
+                    for k in range(1, min(len(left), len(right))):
+                        if left[-k:] != right[:k]:
+                            continue
+                        text = left + right[k:]
+                        expected = cls._convert_sequential(text)
+                        actual = pattern.sub(lambda m: table[m.group()], text).translate(char_table)
+                        if actual != expected:
+                            composites[text] = expected
+            if not composites:
+                return pattern, table, char_table
+            table.update(composites)
+    
+    @classmethod
+    def is_devanagari(cls, text):
+        """
+        Check if text contains Devanagari characters
+        
+        Args:
+            text (str): Text to check
+            
+        Returns:
+            bool: True if text contains Devanagari characters
+        """
+        if not text:
+            return False
+        
+        # Devanagari Unicode range: U+0900 to U+097F
+        for char in text:
+            if '\u0900' <= char <= '\u097F':
+                return True
+        return False
+
+
+# Compiled once at import time
+(OlChikiConverter._MULTI_PATTERN,
+ OlChikiConverter._MULTI_TABLE,
+ OlChikiConverter._CHAR_TABLE) = OlChikiConverter._compile()
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+PCM buffer utilities for generated and stitched speech audio
+
+Everything works on whole buffers (bytes / array slicing and repetition), so
+no per-sample Python loop runs on the request path. Waveforms are cached.
+"""
+
+import functools
+import math
+import struct
+import sys
+import wave
+from array import array
+from io import BytesIO
+from typing import Iterable, NamedTuple
+
+
+class PCMFormat(NamedTuple):
+    """Layout of raw PCM frames"""
+    channels: int = 1
+    sample_width: int = 2   # bytes per sample
+    rate: int = 22050       # frames per second
+
+
+def silence(duration_ms: float, fmt: PCMFormat) -> bytes:
+    """Silent frames of the given duration"""
+    frames = int(fmt.rate * duration_ms / 1000)
+    # 8-bit PCM is unsigned, so its zero level is 0x80
+    fill = b'\x80' if fmt.sample_width == 1 else b'\x00'
+    return fill * (frames * fmt.channels * fmt.sample_width)
+
+
+@functools.lru_cache(maxsize=32)
+def tone(frequency: int = 440, duration: float = 0.5, rate: int = 22050,
+         amplitude: float = 0.25) -> bytes:
+    """16-bit mono sine wave as little-endian PCM frames
+
+    Only one exact period of the sampled wave is computed (rate / gcd(rate,
+    frequency) samples); the rest is produced by repeating that block.
+
+    Args:
+        frequency: Tone frequency in Hz (integer, so the sampled wave repeats)
+        duration: Length in seconds
+        rate: Sample rate in Hz
+        amplitude: Peak level between 0 and 1
+
+    Returns:
+        PCM frames (cached; bytes are immutable)
+    """
+    num_samples = int(rate * duration)
+    period = rate // math.gcd(rate, frequency)
+    scale = amplitude * 32767
+    block = array('h', [max(-32768, min(32767, int(scale * math.sin(2 * math.pi * frequency * i / rate))))
+                        for i in range(min(period, num_samples))])
+    samples = block * (num_samples // len(block) + 1) if block else block
+    del samples[num_samples:]
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def concat(chunks: Iterable[bytes], fmt: PCMFormat, gap_ms: float = 0) -> bytes:
+    """Join PCM chunks, optionally separated by silence"""
+    return silence(gap_ms, fmt).join(chunks) if gap_ms else b''.join(chunks)
+
+
+_TYPECODES = {1: 'B', 2: 'h', 4: 'i'}
+
+
+def resample(frames: bytes, fmt: PCMFormat, rate: int) -> bytes:
+    """Convert frames to another sample rate (nearest-sample)
+
+    Integer decimation and repetition factors are done with array slicing;
+    other ratios go through audioop.ratecv (C) when available.
+
+    Args:
+        frames: PCM frames in fmt
+        fmt: Current format
+        rate: Target sample rate
+
+    Returns:
+        PCM frames at the target rate (same channels and sample width)
+    """
+    if rate == fmt.rate or not frames:
+        return frames
+    typecode = _TYPECODES.get(fmt.sample_width)
+    if typecode is None:
+        raise ValueError("Unsupported sample width: {}".format(fmt.sample_width))
+    samples = array(typecode, frames)
+    swap = sys.byteorder == 'big' and fmt.sample_width > 1
+    if swap:
+        samples.byteswap()  # WAV data is little-endian
+    channels = fmt.channels
+    return _to_bytes(_resample_samples(samples, typecode, channels, fmt, rate), swap)
+
+
+def _to_bytes(samples, swap: bool) -> bytes:
+    if swap:
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def _resample_samples(samples, typecode, channels, fmt, rate):
+    """Resample native-order samples; returns an array"""
+    if fmt.rate % rate == 0:
+        factor = fmt.rate // rate
+        if channels == 1:
+            return samples[::factor]
+        out = array(typecode, bytes(len(samples) // factor // channels * channels * fmt.sample_width))
+        for c in range(channels):
+            out[c::channels] = samples[c::channels * factor][:len(out) // channels]
+        return out
+
+    if rate % fmt.rate == 0:
+        factor = rate // fmt.rate
+        out = array(typecode, bytes(len(samples) * factor * fmt.sample_width))
+        for k in range(factor):
+            for c in range(channels):
+                out[k * channels + c::channels * factor] = samples[c::channels]
+        return out
+
+    # audioop treats 8-bit samples as signed, so unsigned WAV data skips it
+    if fmt.sample_width > 1:
+        try:
+            import warnings
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                import audioop
+            # audioop works on native-order samples, like the array
+            converted = audioop.ratecv(samples.tobytes(), fmt.sample_width, channels,
+                                       fmt.rate, rate, None)[0]
+            return array(typecode, converted)
+        except ImportError:
+            pass
+    # Pure-Python fallback for odd ratios on interpreters without audioop
+    count = len(samples) // channels * rate // fmt.rate
+    ratio = fmt.rate / rate
+    return array(typecode, [samples[int(i * ratio) * channels + c]
+                            for i in range(count) for c in range(channels)])
+
+
+def to_mono(frames: bytes, fmt: PCMFormat) -> bytes:
+    """Keep the first channel of interleaved frames"""
+    if fmt.channels == 1:
+        return frames
+    typecode = _TYPECODES.get(fmt.sample_width)
+    if typecode is None:
+        raise ValueError("Unsupported sample width: {}".format(fmt.sample_width))
+    return array(typecode, frames)[::fmt.channels].tobytes()
+
+
+# 8-bit WAV samples are unsigned: flipping the top bit makes them signed
+_UNSIGNED_TO_SIGNED = bytes(b ^ 0x80 for b in range(256))
+
+
+def to_16bit(frames: bytes, fmt: PCMFormat) -> bytes:
+    """Convert little-endian PCM frames of any sample width to 16-bit
+
+    Wider samples keep their two most significant bytes; 8-bit samples
+    become the high byte. Done with byte slicing, no per-sample loop.
+    """
+    width = fmt.sample_width
+    if width == 2:
+        return frames
+    count = len(frames) // width
+    out = bytearray(count * 2)
+    if width == 1:
+        out[1::2] = frames[:count].translate(_UNSIGNED_TO_SIGNED)
+    else:
+        out[0::2] = frames[width - 2::width][:count]
+        out[1::2] = frames[width - 1::width][:count]
+    return bytes(out)
+
+
+def to_wav(frames: bytes, fmt: PCMFormat) -> bytes:
+    """Wrap PCM frames in a WAV container"""
+    out = BytesIO()
+    with wave.open(out, 'wb') as w:
+        w.setnchannels(fmt.channels)
+        w.setsampwidth(fmt.sample_width)
+        w.setframerate(fmt.rate)
+        w.writeframes(frames)
+    return out.getvalue()
+
+
+def wav_stream_header(fmt: PCMFormat) -> bytes:
+    """WAV header for a stream of unknown length
+
+    The RIFF and data sizes are set to the maximum (0xFFFFFFFF), which
+    browsers and players treat as "read until the stream ends".
+    """
+    block_align = fmt.channels * fmt.sample_width
+    return struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 0xFFFFFFFF, b'WAVE', b'fmt ', 16, 1,
+                       fmt.channels, fmt.rate, fmt.rate * block_align, block_align,
+                       fmt.sample_width * 8, b'data', 0xFFFFFFFF)
+
+
+def from_wav(data: bytes):
+    """Split WAV bytes into (PCMFormat, frames)
+
+    Raises:
+        wave.Error / EOFError: If data is not a PCM WAV file
+    """
+    with wave.open(BytesIO(data), 'rb') as w:
+        fmt = PCMFormat(w.getnchannels(), w.getsampwidth(), w.getframerate())
+        return fmt, w.readframes(w.getnframes())
@@ -0,0 +1,200 @@
+"""
+Pre-rendered phrase audio and request-time stitching
+
+build_phrase_audio.py renders one WAV clip per dictionary entry ahead of time.
+/api/speak then assembles an utterance from those clips, joined by short
+silences, and only synthesizes the words no clip covers.
+"""
+
+import hashlib
+import os
+import wave
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from . import pcm
+from .audio_cache import normalize_tts_text
+from .cache import TranslationCache
+
+# Punctuation dropped from token edges before matching clips
+_PUNCTUATION = '।॥.,!?;:"\'()'
+
+
+class PhraseAudioStore:
+    """Directory of pre-rendered WAV clips keyed by language and phrase text"""
+
+    def __init__(self, directory: str, silence_ms: int = 80, max_phrase_tokens: int = 8,
+                 clip_cache_bytes: int = 8 * 1024 * 1024):
+        """Initialize store
+
+        Args:
+            directory: Folder holding the clips (may not exist yet)
+            silence_ms: Pause inserted between stitched segments
+            max_phrase_tokens: Longest phrase (in tokens) looked up as one clip
+            clip_cache_bytes: Maximum bytes of decoded clips kept in memory;
+                the rest are re-read from disk (and the OS page cache)
+        """
+        self.directory = directory
+        self.silence_ms = silence_ms
+        self.max_phrase_tokens = max_phrase_tokens
+        self._available = None  # clip file names, listed on first use
+        self._clips = TranslationCache(max_entries=4096, max_bytes=clip_cache_bytes)
+
+    @staticmethod
+    def tokens(text: str) -> List[str]:
+        """Normalized tokens of a phrase, without edge punctuation"""
+        tokens = (t.strip(_PUNCTUATION) for t in normalize_tts_text(text).split())
+        return [t for t in tokens if t]
+
+    def _name(self, tokens: Sequence[str], language: str) -> str:
+        raw = language + '\0' + ' '.join(tokens)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:40] + '.wav'
+
+    @property
+    def available(self) -> set:
+        if self._available is None:
+            try:
+                self._available = {n for n in os.listdir(self.directory) if n.endswith('.wav')}
+            except OSError:
+                self._available = set()
+        return self._available
+
+    def __len__(self) -> int:
+        return len(self.available)
+
+    def has(self, text: str, language: str) -> bool:
+        """Whether a clip exists for exactly this phrase"""
+        tokens = self.tokens(text)
+        return bool(tokens) and self._name(tokens, language) in self.available
+
+    def save(self, text: str, language: str, wav_data: bytes) -> None:
+        """Store a rendered clip for a phrase
+
+        Raises:
+            wave.Error: If wav_data is not a PCM WAV file
+        """
+        pcm.from_wav(wav_data)
+        name = self._name(self.tokens(text), language)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(wav_data)
+        os.replace(path + '.tmp', path)
+        self.available.add(name)
+        self._clips.clear()
+
+    def _read_clip(self, path: str):
+        """Decode a stored clip to (PCMFormat, PCM frames)"""
+        clip = self._clips.get(path)
+        if clip is None:
+            with open(path, 'rb') as f:
+                fmt, frames = pcm.from_wav(f.read())
+            clip = {'format': fmt, 'frames': frames}
+            self._clips.set(path, clip)
+        return clip['format'], clip['frames']
+
+    def segment(self, text: str, language: str,
+                segments: Optional[Sequence[str]] = None) -> List[Tuple[str, Optional[str]]]:
+        """Split text into covered phrases and uncovered leftovers
+
+        Args:
+            text: Text to speak
+            language: Language code
+            segments: Units to use instead of greedy matching (e.g. the
+                'santali' values of a translation's word_mappings)
+
+        Returns:
+            List of (segment text, clip path or None), in order; consecutive
+            uncovered words are merged into one segment
+        """
+        parts = []
+        if segments is not None:
+            token_runs = [self.tokens(s) for s in segments]
+        else:
+            token_runs = [self.tokens(text)]
+
+        available = self.available
+        for tokens in token_runs:
+            i = 0
+            while i < len(tokens):
+                # Longest stored phrase starting at token i
+                for j in range(min(len(tokens), i + self.max_phrase_tokens), i, -1):
+                    name = self._name(tokens[i:j], language)
+                    if name in available:
+                        parts.append((' '.join(tokens[i:j]), os.path.join(self.directory, name)))
+                        i = j
+                        break
+                else:
+                    if parts and parts[-1][1] is None:
+                        parts[-1] = (parts[-1][0] + ' ' + tokens[i], None)
+                    else:
+                        parts.append((tokens[i], None))
+                    i += 1
+        return parts
+
+    def stitch(self, text: str, language: str,
+               synthesize: Optional[Callable[[str], Optional[bytes]]] = None,
+               segments: Optional[Sequence[str]] = None) -> Optional[bytes]:
+        """Build a WAV utterance from stored clips
+
+        Args:
+            text: Text to speak
+            language: Language code
+            synthesize: Renders an uncovered segment to WAV bytes (or None)
+            segments: Optional explicit segmentation (see segment())
+
+        Returns:
+            WAV bytes, or None if no clip applies, a leftover cannot be
+            synthesized, or the clips' audio formats differ
+        """
+        if not self.available:
+            return None
+        parts = self.segment(text, language, segments)
+        if not any(path for _, path in parts):
+            return None
+
+        fmt = None
+        chunks = []
+        for segment_text, path in parts:
+            try:
+                if path is not None:
+                    clip_fmt, frames = self._read_clip(path)
+                else:
+                    wav_data = synthesize(segment_text) if synthesize else None
+                    if not wav_data:
+                        return None
+                    clip_fmt, frames = pcm.from_wav(wav_data)
+            except (OSError, EOFError, wave.Error) as e:
+                print("[WARN] Phrase audio unavailable for '{}': {}".format(segment_text, repr(e)))
+                return None
+            if fmt is None:
+                fmt = clip_fmt
+            elif clip_fmt != fmt:
+                # Clips from different engines may differ in sample rate
+                if clip_fmt[:2] != fmt[:2]:
+                    return None
+                frames = pcm.resample(frames, clip_fmt, fmt.rate)
+            chunks.append(frames)
+
+        return pcm.to_wav(pcm.concat(chunks, fmt, self.silence_ms), fmt)
+
+
+_default_store = None
+
+
+def get_phrase_audio_store() -> PhraseAudioStore:
+    """Process-wide store in PHRASE_AUDIO_DIR (default: <project root>/phrase_audio)
+
+    PHRASE_CLIP_CACHE_MB bounds the decoded clips it keeps in memory (default 8).
+    """
+    global _default_store
+    if _default_store is None:
+        directory = os.environ.get('PHRASE_AUDIO_DIR')
+        if not directory:
+            project_root = os.environ.get(
+                'TRANSLATOR_ROOT',
+                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            )
+            directory = os.path.join(project_root, 'phrase_audio')
+        _default_store = PhraseAudioStore(
+            directory, clip_cache_bytes=int(float(os.environ.get('PHRASE_CLIP_CACHE_MB', '8')) * 1024 * 1024))
+    return _default_store
@@ -0,0 +1,183 @@
+"""
+Token-level trie for greedy longest-phrase matching
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Sentence terminators that TextProcessor.tokenize_sentences splits on; a
+# phrase stored as 'आज मौसम कैसा है?' can only ever be seen without them.
+_SENTENCE_END = '।॥.!?'
+
+_END = None  # dict node key holding the dictionary key of a complete phrase
+
+
+def _child(node, token_id: int):
+    """Child of node for token_id, or None"""
+    kind = type(node)
+    if kind is dict:
+        return node.get(token_id)
+    if kind is tuple and node[0] == token_id:
+        return node[1]
+    return None
+
+
+def _key(node) -> Optional[str]:
+    """Dictionary key completed at node, or None"""
+    kind = type(node)
+    if kind is str:
+        return node
+    if kind is dict:
+        return node.get(_END)
+    return None
+
+
+def _as_dict(node) -> dict:
+    """Expand a compact node so children can be added"""
+    if isinstance(node, str):
+        return {_END: node}
+    if isinstance(node, tuple):
+        return {node[0]: node[1]}
+    return node
+
+
+class PhraseTrie:
+    """Trie keyed by whitespace tokens of dictionary keys
+
+    Every token that occurs in a dictionary key gets an integer ID. Input is
+    encoded to an array of IDs once (unknown tokens become -1, which no node
+    has), then matching walks the IDs, so no n-gram strings are built and
+    phrases of any length are found in one pass over the tokens they cover.
+
+    Most nodes have a single child or none, so nodes take the smallest form
+    that fits:
+        str                     a complete key with no children (a leaf)
+        (token ID, child)       one child, not a complete key
+        dict                    anything else: token ID -> child, plus the
+                                complete key under _END
+    """
+
+    def __init__(self, phrases: Iterable[str] = ()):
+        """Initialize trie
+
+        Args:
+            phrases: Normalized dictionary keys
+        """
+        self._root: dict = {}
+        self._size = 0
+        self.token_ids: Dict[str, int] = {}
+        self.max_depth = 0  # tokens in the longest stored path
+        for phrase in phrases:
+            self.add(phrase)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, phrase: str) -> None:
+        """Add a normalized dictionary key"""
+        tokens: List[str] = phrase.split()
+        if not tokens:
+            return
+        if self._insert(tokens, phrase, exact=True):
+            self._size += 1
+
+        # Also reachable without trailing sentence punctuation, unless an
+        # exact key for the bare form exists
+        last = tokens[-1].rstrip(_SENTENCE_END)
+        if last != tokens[-1]:
+            bare = tokens[:-1] + [last] if last else tokens[:-1]
+            if bare:
+                self._insert(bare, phrase, exact=False)
+
+    def _insert(self, tokens: List[str], phrase: str, exact: bool) -> bool:
+        """Store phrase at the path of tokens; True if it was not there yet"""
+        self.max_depth = max(self.max_depth, len(tokens))
+        token_ids = self.token_ids
+        ids = []
+        for token in tokens:
+            token_id = token_ids.get(token)
+            if token_id is None:
+                token_id = token_ids[token] = len(token_ids)
+            ids.append(token_id)
+        previous = self._key_at(ids)
+        self._root = self._insert_at(self._root, ids, 0, phrase, exact)
+        return previous != phrase
+
+    def _key_at(self, ids: List[int]) -> Optional[str]:
+        node = self._root
+        for token_id in ids:
+            node = _child(node, token_id)
+            if node is None:
+                return None
+        return _key(node)
+
+    def _insert_at(self, node, ids: List[int], i: int, phrase: str, exact: bool):
+        """Return node (or its replacement) with phrase stored below it"""
+        if i == len(ids):
+            if node is None:
+                return phrase
+            if isinstance(node, str):
+                return phrase if exact else node
+            node = _as_dict(node)
+            if exact or _END not in node:
+                node[_END] = phrase
+            return node
+        token_id = ids[i]
+        if node is None:
+            return (token_id, self._insert_at(None, ids, i + 1, phrase, exact))
+        if isinstance(node, tuple) and node[0] == token_id:
+            return (token_id, self._insert_at(node[1], ids, i + 1, phrase, exact))
+        node = _as_dict(node)
+        node[token_id] = self._insert_at(node.get(token_id), ids, i + 1, phrase, exact)
+        return node
+
+    def encode(self, tokens: Sequence[str]) -> array:
+        """Token IDs of normalized word tokens (-1 for tokens in no key)"""
+        get = self.token_ids.get
+        return array('i', [get(token, -1) for token in tokens])
+
+    def longest_match(self, ids: Sequence[int], start: int) -> Tuple[int, Optional[str]]:
+        """Find the longest dictionary key starting at ids[start]
+
+        Args:
+            ids: Token IDs from encode()
+            start: Index of the first token
+
+        Returns:
+            (number of tokens matched, dictionary key) or (0, None)
+        """
+        # _child and _key inlined: this runs once per token translated
+        node = self._root
+        best_length, best_key = 0, None
+        for j in range(start, len(ids)):
+            kind = type(node)
+            if kind is dict:
+                node = node.get(ids[j])
+                if node is None:
+                    break
+            elif kind is tuple and node[0] == ids[j]:
+                node = node[1]
+            else:
+                break
+            kind = type(node)
+            if kind is str:
+                return j - start + 1, node
+            if kind is dict:
+                key = node.get(_END)
+                if key is not None:
+                    best_length, best_key = j - start + 1, key
+        return best_length, best_key
+
+    def match_span(self, ids: Sequence[int], start: int) -> int:
+        """Number of tokens longest_match(ids, start) depends on
+
+        The walk reads tokens until one has no child node. If it runs off the
+        end instead, the token that would come next counts too, since
+        appending one could extend the match.
+        """
+        node = self._root
+        for j in range(start, len(ids)):
+            node = _child(node, ids[j])
+            if node is None:
+                return j - start + 1
+        return len(ids) - start + 1
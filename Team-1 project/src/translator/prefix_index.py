@@ -0,0 +1,51 @@
+"""
+Prefix lookup over dictionary keys
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List, Optional
+
+_MAX_CHAR = '\U0010ffff'
+
+
+class PrefixIndex:
+    """Read-only prefix -> keys mapping backed by one sorted key list
+
+    Behaves like a dict from every non-empty prefix of every key to the keys
+    starting with it (in sorted order), but stores each key once: the keys
+    sharing a prefix are a contiguous run of the sorted list, found by bisection.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        """Initialize index
+
+        Args:
+            keys: Dictionary keys
+        """
+        self._keys: List[str] = sorted(keys)
+
+    def _bounds(self, prefix: str):
+        keys = self._keys
+        lo = bisect_left(keys, prefix)
+        return lo, bisect_left(keys, prefix + _MAX_CHAR, lo)
+
+    def get(self, prefix: str, default=None) -> Optional[List[str]]:
+        """Keys starting with prefix, or default if there are none"""
+        if not prefix or not isinstance(prefix, str):
+            return default
+        lo, hi = self._bounds(prefix)
+        if lo == hi:
+            return default
+        return self._keys[lo:hi]
+
+    def __getitem__(self, prefix: str) -> List[str]:
+        keys = self.get(prefix)
+        if keys is None:
+            raise KeyError(prefix)
+        return keys
+
+    def __contains__(self, prefix) -> bool:
+        if not prefix or not isinstance(prefix, str):
+            return False
+        lo, hi = self._bounds(prefix)
+        return lo < hi
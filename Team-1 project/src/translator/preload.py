@@ -0,0 +1,68 @@
+"""
+Sharing one engine between forked server workers
+
+With gunicorn's preload_app (see gunicorn.conf.py) the engine is built once
+in the master process and the workers inherit it through fork(), sharing its
+memory pages until something writes to them. Two writers are avoidable:
+
+- Lazily built indexes. TranslationEngine.preload() builds them before the
+  fork, so workers never build private copies.
+- The cyclic garbage collector, which writes to the header of every tracked
+  object a collection visits. freeze_for_fork() moves everything allocated
+  so far to the collector's permanent generation (gc.freeze), which worker
+  collections skip.
+
+Reference counts still change when a worker reads a shared object, so pages
+holding the most-used objects do get copied. process_memory() reports how
+much of each worker's memory is really its own.
+"""
+
+import gc
+from typing import Dict, Optional
+
+
+def freeze_for_fork() -> int:
+    """Exempt every object allocated so far from future garbage collections
+
+    Call in the parent right before forking. Collection should be disabled
+    while the shared state is built (gc.disable()) and re-enabled only after
+    this, so that no collection frees objects in the middle of the shared
+    pages for the children to fill later.
+
+    Returns:
+        Number of frozen objects
+    """
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def process_memory(pid='self') -> Optional[Dict[str, float]]:
+    """Resident memory of a process, split into its own and shared pages
+
+    Args:
+        pid: Process ID (defaults to the current process)
+
+    Returns:
+        {'rss_mb', 'pss_mb', 'uss_mb', 'shared_mb'} or None where
+        /proc/<pid>/smaps_rollup is unavailable (non-Linux, kernel < 4.14).
+        USS counts pages only this process maps; PSS adds an equal share of
+        each shared page, so summing PSS over workers gives their total.
+    """
+    fields = {}
+    try:
+        with open('/proc/{}/smaps_rollup'.format(pid)) as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1])
+    except (OSError, ValueError):
+        return None
+    if 'Rss' not in fields:
+        return None
+    unique = fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    return {
+        'rss_mb': round(fields['Rss'] / 1024, 1),
+        'pss_mb': round(fields.get('Pss', 0) / 1024, 1),
+        'uss_mb': round(unique / 1024, 1),
+        'shared_mb': round((fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0)) / 1024, 1),
+    }
@@ -0,0 +1,132 @@
+"""
+Incremental translation sessions for translate-as-you-type
+
+A session remembers the tokens and translated units of the previous input.
+On the next update only the edited window is translated again: a unit is
+kept when every token its phrase lookup depends on lies before the first
+changed token, since the greedy longest match over those tokens cannot have
+changed. That window is the dictionary's longest phrase at most, and usually
+just the one or two tokens the phrase trie walk reads before it dead-ends.
+Everything from the first unit that fails the test onwards is re-translated.
+"""
+
+import threading
+from typing import Dict, List
+
+
+class TranslationSession:
+    """Incremental translator for one client's successive edits of a text"""
+
+    def __init__(self, engine, source_lang: str = 'hi', target_lang: str = 'sat'):
+        """Initialize session
+
+        Args:
+            engine: TranslationEngine doing the work
+            source_lang: Source language code
+            target_lang: Target language code
+        """
+        self.engine = engine
+        self.source_lang = str(source_lang).strip().lower() if source_lang else 'hi'
+        self.target_lang = str(target_lang).strip().lower() if target_lang else 'sat'
+        self._lock = threading.Lock()
+        self._sentences: List[tuple] = []  # (tokens, units) per sentence
+        self._version = None
+        self.updates = 0
+        self.reused_tokens = 0
+        self.translated_tokens = 0
+
+    @property
+    def incremental(self) -> bool:
+        """Only Hindi to Santali keeps per-token state; other pairs re-translate"""
+        return self.source_lang == 'hi' and self.target_lang == 'sat'
+
+    def reset(self) -> None:
+        """Forget the previous input"""
+        with self._lock:
+            self._sentences = []
+
+    def update(self, text: str) -> Dict:
+        """Translate the current text, reusing the unchanged prefix
+
+        Args:
+            text: Full current input
+
+        Returns:
+            Same result as TranslationEngine.translate(), plus 'reused_tokens'
+            and 'translated_tokens' for this update
+        """
+        if not self.incremental or not text or not text.strip():
+            result = self.engine.translate(text, self.source_lang, self.target_lang)
+            result['reused_tokens'] = 0
+            result['translated_tokens'] = 0
+            return result
+
+        engine = self.engine
+        with self._lock:
+            dictionary = engine.dictionary
+            if dictionary.version != self._version:
+                self._sentences = []
+                self._version = dictionary.version
+            self.updates += 1
+
+            cleaned_text = engine.processor.preprocess(text)
+            normalized = dictionary.normalize_key(cleaned_text)
+            exact = engine._hindi_exact_result(cleaned_text, normalized)
+            if exact is not None:
+                # Nothing to reuse next time either: the per-token path never ran
+                self._sentences = []
+                exact['reused_tokens'] = 0
+                exact['translated_tokens'] = 0
+                return exact
+
+            previous = self._sentences
+            sentences = []
+            reused = translated = 0
+            for index, (tokens, ids) in enumerate(engine._hindi_sentences(normalized)):
+                units = []
+                if index < len(previous):
+                    units = self._reusable_units(previous[index], tokens, ids, dictionary)
+                start = units[-1][0] + units[-1][1] if units else 0
+                units += engine._translate_hindi_units(tokens, ids, start)
+                reused += start
+                translated += len(tokens) - start
+                sentences.append((tokens, units))
+
+            self._sentences = sentences
+            self.reused_tokens += reused
+            self.translated_tokens += translated
+            result = engine._hindi_result(cleaned_text, [units for _, units in sentences])
+
+        result['reused_tokens'] = reused
+        result['translated_tokens'] = translated
+        return result
+
+    @staticmethod
+    def _reusable_units(previous: tuple, tokens: tuple, ids, dictionary) -> list:
+        """Leading units of a sentence that the edit cannot have affected"""
+        old_tokens, old_units = previous
+        if old_tokens == tokens:
+            return list(old_units)
+        changed = 0
+        limit = min(len(old_tokens), len(tokens))
+        while changed < limit and old_tokens[changed] == tokens[changed]:
+            changed += 1
+        lookahead = dictionary.max_phrase_tokens()
+        kept = []
+        for unit in old_units:
+            start = unit[0]
+            # tokens[:changed] equal the old ones, so the span is the old span
+            if (start + lookahead > changed
+                    and start + dictionary.phrase_match_span(ids, start) > changed):
+                break
+            kept.append(unit)
+        return kept
+
+    def get_stats(self) -> Dict:
+        total = self.reused_tokens + self.translated_tokens
+        return {
+            'updates': self.updates,
+            'reused_tokens': self.reused_tokens,
+            'translated_tokens': self.translated_tokens,
+            'reuse_rate': round(self.reused_tokens / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,115 @@
+"""
+Binary snapshot of the compiled dictionary for fast cold starts
+
+A snapshot holds the fully merged and validated Dictionary (CSV rows plus the
+SUPPLEMENTARY_* tables) together with its fuzzy-match indexes, so a new
+process can skip CSV parsing, validation, normalization and index building.
+
+File layout:
+    MAGIC (6 bytes) | format version (uint16 LE) | key (64 ASCII hex) | pickle
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+from typing import Dict, Iterable, Optional
+
+from .dictionary import Dictionary
+from .fuzzy_index import FuzzyIndex
+
+SNAPSHOT_FORMAT = 2  # file layout; class structure is covered by the key
+# Classes whose instances are pickled into a snapshot (see Dictionary.to_snapshot)
+SNAPSHOT_CLASSES = (Dictionary, FuzzyIndex)
+_MAGIC = b'HSDICT'
+_HEADER = struct.Struct('<6sH64s')
+
+
+def _code_version(cls: type) -> str:
+    """Digest of the module defining cls (its name if the file is unreadable)"""
+    module = sys.modules[cls.__module__]
+    try:
+        with open(module.__file__, 'rb') as f:
+            return cls.__qualname__ + ':' + hashlib.sha256(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return cls.__qualname__
+
+
+def snapshot_path_for(csv_path: str) -> str:
+    """Snapshot file that sits next to a dictionary CSV"""
+    return os.path.splitext(csv_path)[0] + '.snapshot'
+
+
+def snapshot_key(csv_path: str, tables: Iterable[Dict[str, str]],
+                 classes: Iterable[type] = SNAPSHOT_CLASSES) -> str:
+    """Hash identifying the inputs a snapshot was built from
+
+    Args:
+        csv_path: Dictionary CSV file
+        tables: Supplementary tables merged on top of the CSV, in merge order
+        classes: Classes pickled into the snapshot; the code defining them
+            is hashed too, so changing their structure retires old snapshots
+            without a manual SNAPSHOT_FORMAT bump
+
+    Returns:
+        64-character hex digest of the CSV bytes, the tables' contents and
+        the source of the snapshotted classes' modules
+    """
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        digest.update(f.read())
+    for cls in classes:
+        digest.update(_code_version(cls).encode('utf-8'))
+    for table in tables:
+        # Item order matters: later add_word calls overwrite earlier ones
+        digest.update(json.dumps(list(table.items()), ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def save_snapshot(dictionary: Dictionary, path: str, key: str) -> None:
+    """Write a snapshot atomically
+
+    Args:
+        dictionary: Fully merged dictionary
+        path: Snapshot file to write
+        key: snapshot_key() of the dictionary's inputs
+    """
+    payload = pickle.dumps(dictionary.to_snapshot(), protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, SNAPSHOT_FORMAT, key.encode('ascii')))
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str, key: str) -> Optional[Dictionary]:
+    """Load a snapshot if it exists and matches the current inputs
+
+    Args:
+        path: Snapshot file
+        key: snapshot_key() of the current CSV and supplementary tables
+
+    Returns:
+        Dictionary, or None if the snapshot is missing, stale or unreadable
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, version, stored_key = _HEADER.unpack(header)
+            if magic != _MAGIC or version != SNAPSHOT_FORMAT:
+                print("[WARN] Ignoring snapshot {} (unknown format)".format(path))
+                return None
+            if stored_key.decode('ascii') != key:
+                print("[WARN] Ignoring stale snapshot {}".format(path))
+                return None
+            state = pickle.load(f)
+    except Exception as e:
+        print("[WARN] Error loading snapshot: {}".format(repr(e)))
+        return None
+    return Dictionary.from_snapshot(state)
@@ -0,0 +1,152 @@
+"""
+Sentence-by-sentence streaming speech for long texts
+"""
+
+import threading
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, Tuple
+
+from . import pcm
+from .processor import TextProcessor
+
+_processor = TextProcessor()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tts-stream')
+        return _executor
+
+
+def stream_speech(text: str, language: str, synthesize: Callable[[str, str], Optional[dict]],
+                  ahead: int = 4, gap_ms: int = 150,
+                  synthesize_as: Optional[Callable[[str, str, str], Optional[dict]]] = None
+                  ) -> Optional[Tuple[str, Iterator[bytes]]]:
+    """Synthesize text sentence by sentence and stream the audio in order
+
+    Sentences (TextProcessor.tokenize_sentences) are synthesized concurrently,
+    at most `ahead` at a time, and each is streamed as soon as it and every
+    sentence before it are ready, so time to first audio does not depend on
+    text length.
+
+    The first sentence fixes the stream format. MP3 segments are concatenated
+    as-is. WAV segments are sent as PCM after one streaming header (resampled
+    if needed and joined by `gap_ms` of silence). A later sentence answered
+    in the other format (e.g. the offline engine won the hedge for it) is
+    synthesized again with `synthesize_as`, pinned to the stream's format;
+    only if that fails too is it skipped.
+
+    Args:
+        text: Text to speak
+        language: Language code
+        synthesize: (sentence, language) -> dict with 'audio' and
+            'content_type' (see audio_gen.get_speech_audio), or None
+        ahead: Sentences synthesized ahead of the one being streamed
+        gap_ms: Pause between WAV sentences
+        synthesize_as: (sentence, language, content_type) -> dict like
+            synthesize's, in that format (see audio_gen.get_speech_audio_as)
+
+    Returns:
+        (content_type, iterator of audio chunks), or None if the first
+        sentence that could be synthesized does not exist
+    """
+    sentences = _processor.tokenize_sentences(text) or [text.strip()]
+    executor = _get_executor(ahead)
+    futures = deque()
+    remaining = iter(sentences)
+
+    def fill():
+        while len(futures) < ahead:
+            sentence = next(remaining, None)
+            if sentence is None:
+                return
+            futures.append((sentence, executor.submit(synthesize, sentence, language)))
+
+    def next_entry():
+        while True:
+            fill()
+            if not futures:
+                return None, None
+            sentence, future = futures.popleft()
+            try:
+                entry = future.result()
+            except Exception as e:
+                print("[TTS] Streaming segment failed: {}".format(e))
+                entry = None
+            if entry:
+                return sentence, entry
+            print("[TTS] No audio for segment: {}".format(sentence[:40]))
+
+    _, first = next_entry()
+    if first is None:
+        return None
+    content_type = first['content_type']
+
+    def conform(sentence, entry):
+        """entry in the stream's format, or None if it cannot be had"""
+        if entry['content_type'] == content_type:
+            return entry
+        pinned = None
+        if synthesize_as is not None:
+            try:
+                pinned = synthesize_as(sentence, language, content_type)
+            except Exception as e:
+                print("[TTS] Pinned segment failed: {}".format(e))
+        if pinned and pinned['content_type'] == content_type:
+            return pinned
+        print("[TTS] Skipping {} segment in {} stream: {}".format(
+            entry['content_type'], content_type, sentence[:40]))
+        return None
+
+    def mp3_chunks():
+        entry = first
+        while entry is not None:
+            yield entry['audio']
+            while True:
+                sentence, entry = next_entry()
+                if entry is None:
+                    return
+                entry = conform(sentence, entry)
+                if entry is not None:
+                    break
+
+    def wav_chunks():
+        try:
+            fmt, frames = pcm.from_wav(first['audio'])
+        except (EOFError, wave.Error) as e:
+            print("[TTS] Unreadable WAV segment: {}".format(repr(e)))
+            return
+        yield pcm.wav_stream_header(fmt)
+        yield frames
+        gap = pcm.silence(gap_ms, fmt)
+        while True:
+            sentence, entry = next_entry()
+            if entry is None:
+                return
+            entry = conform(sentence, entry)
+            if entry is None:
+                continue
+            try:
+                clip_fmt, frames = pcm.from_wav(entry['audio'])
+            except (EOFError, wave.Error):
+                print("[TTS] Skipping unreadable WAV segment in WAV stream")
+                continue
+            if clip_fmt[:2] != fmt[:2]:
+                continue
+            yield gap + pcm.resample(frames, clip_fmt, fmt.rate)
+
+    def chunks():
+        try:
+            yield from (mp3_chunks() if content_type != 'audio/wav' else wav_chunks())
+        finally:
+            # Client went away: do not synthesize sentences nobody will hear
+            for _, future in futures:
+                future.cancel()
+
+    return content_type, chunks()
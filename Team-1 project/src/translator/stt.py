@@ -0,0 +1,391 @@
+"""
+Pluggable speech-to-text backends for /api/transcribe
+
+Backends are tried in order (STT_BACKENDS, default "vosk,google"); one that
+is unavailable or hears nothing hands over to the next. The local Vosk
+backend runs on the CPU and keeps its model resident for the life of the
+worker process, so only the first request pays for loading it.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from array import array
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from . import pcm
+from .pcm import PCMFormat
+from .tts_orchestrator import EngineStats
+
+
+class STTError(Exception):
+    """Transcription failed"""
+
+
+class STTUnavailable(STTError):
+    """Backend cannot run here (missing package or model, network down)"""
+
+
+class STTNoSpeech(STTError):
+    """Backend ran but recognized no speech"""
+
+
+class STTBackend(ABC):
+    """Base class: transcribe 16-bit mono PCM frames"""
+
+    name = 'base'
+    load_error = None  # set once the backend is known not to run in this process
+
+    @abstractmethod
+    def transcribe(self, frames: bytes, rate: int, language: str) -> str:
+        """Recognize speech
+
+        Args:
+            frames: 16-bit little-endian mono PCM
+            rate: Sample rate in Hz
+            language: Language code ('hi')
+
+        Returns:
+            Recognized text
+
+        Raises:
+            STTUnavailable / STTNoSpeech
+        """
+
+
+class GoogleSTTBackend(STTBackend):
+    """Google Web Speech API via SpeechRecognition (network)"""
+
+    name = 'google'
+    _LOCALES = {'hi': 'hi-IN', 'en': 'en-IN'}
+
+    def __init__(self):
+        self._recognizer = None
+
+    def transcribe(self, frames: bytes, rate: int, language: str) -> str:
+        try:
+            import speech_recognition as sr
+        except ImportError:
+            raise STTUnavailable('SpeechRecognition not installed. Run: pip install SpeechRecognition')
+        if self._recognizer is None:
+            self._recognizer = sr.Recognizer()
+        try:
+            return self._recognizer.recognize_google(
+                sr.AudioData(frames, rate, 2), language=self._LOCALES.get(language, 'hi-IN'))
+        except sr.UnknownValueError:
+            raise STTNoSpeech('Could not understand the audio')
+        except sr.RequestError as e:
+            raise STTUnavailable('Speech service unavailable: ' + str(e))
+
+
+class VoskSTTBackend(STTBackend):
+    """Offline CPU recognizer (Vosk/Kaldi) with a resident model
+
+    The model directory comes from VOSK_MODEL_PATH (for Hindi, e.g.
+    vosk-model-small-hi-0.22 from alphacephei.com/vosk/models).
+    """
+
+    name = 'vosk'
+    SAMPLE_RATE = 16000
+
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or os.environ.get('VOSK_MODEL_PATH')
+        self._model = None
+        self._lock = threading.Lock()
+        self.load_error = None
+
+    def load(self):
+        """Load the model once per process"""
+        with self._lock:
+            if self._model is None and self.load_error is None:
+                if not self.model_path or not os.path.isdir(self.model_path):
+                    self.load_error = 'VOSK_MODEL_PATH not set or missing'
+                else:
+                    try:
+                        import vosk
+                        vosk.SetLogLevel(-1)
+                        start = time.perf_counter()
+                        self._model = vosk.Model(self.model_path)
+                        print("[OK] Vosk model loaded in {:.1f}s".format(time.perf_counter() - start))
+                    except Exception as e:
+                        self.load_error = 'Vosk unavailable: {}'.format(e)
+        if self._model is None:
+            raise STTUnavailable(self.load_error)
+        return self._model
+
+    def stream_recognizer(self):
+        """New incremental recognizer over the resident model (16 kHz input)"""
+        model = self.load()
+        import vosk
+        return vosk.KaldiRecognizer(model, self.SAMPLE_RATE)
+
+    def transcribe(self, frames: bytes, rate: int, language: str) -> str:
+        model = self.load()
+        import vosk
+        frames = pcm.resample(frames, PCMFormat(1, 2, rate), self.SAMPLE_RATE)
+        recognizer = vosk.KaldiRecognizer(model, self.SAMPLE_RATE)
+        recognizer.AcceptWaveform(frames)
+        text = json.loads(recognizer.FinalResult()).get('text', '').strip()
+        if not text:
+            raise STTNoSpeech('Could not understand the audio')
+        return text
+
+
+class STTBackendStats(EngineStats):
+    """Latency histogram plus real-time factor (processing time / audio time)"""
+
+    def __init__(self):
+        super().__init__()
+        self.audio_seconds = 0.0
+        self.processing_seconds = 0.0
+
+    def observe_rtf(self, processing_seconds: float, audio_seconds: float) -> None:
+        with self._lock:
+            self.processing_seconds += processing_seconds
+            self.audio_seconds += audio_seconds
+
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data['audio_seconds'] = round(self.audio_seconds, 2)
+        data['real_time_factor'] = (round(self.processing_seconds / self.audio_seconds, 3)
+                                    if self.audio_seconds else None)
+        return data
+
+
+BACKENDS = {
+    'google': GoogleSTTBackend,
+    'vosk': VoskSTTBackend,
+}
+
+
+class STTService:
+    """Try backends in order and record per-backend metrics"""
+
+    def __init__(self, backends: List[STTBackend]):
+        self.backends = backends
+        self.stats = {backend.name: STTBackendStats() for backend in backends}
+
+    def transcribe(self, wav_data: bytes, language: str = 'hi') -> Dict:
+        """Transcribe an uploaded audio file
+
+        PCM WAV of any sample width is read directly. Other files (AIFF,
+        FLAC) are decoded by SpeechRecognition's AudioFile when it is installed.
+
+        Args:
+            wav_data: Audio file bytes
+            language: Language code
+
+        Returns:
+            dict with 'text', 'engine', 'latency_ms' and 'real_time_factor'
+
+        Raises:
+            STTNoSpeech: If a backend ran but none recognized speech
+            STTUnavailable: If no backend could run
+            STTError: If the audio cannot be decoded
+        """
+        try:
+            fmt, frames = pcm.from_wav(wav_data)
+        except (EOFError, wave.Error) as e:
+            frames, rate = _decode_audio_file(wav_data, e)
+            return self.transcribe_pcm(frames, rate, language)
+        if fmt.sample_width not in (1, 2, 3, 4):
+            raise STTError('Unsupported audio (sample width {})'.format(fmt.sample_width))
+        frames = pcm.to_mono(pcm.to_16bit(frames, fmt), fmt._replace(sample_width=2))
+        return self.transcribe_pcm(frames, fmt.rate, language)
+
+    def transcribe_pcm(self, frames: bytes, rate: int, language: str = 'hi') -> Dict:
+        """Transcribe 16-bit mono PCM frames (see transcribe)"""
+        audio_seconds = len(frames) / 2 / rate if rate else 0.0
+
+        errors = []
+        for backend in self.backends:
+            if backend.load_error:
+                # Known not to run here (e.g. no Vosk model): not a failure per request
+                errors.append(STTUnavailable(backend.load_error))
+                continue
+            stats = self.stats[backend.name]
+            start = time.perf_counter()
+            try:
+                text = backend.transcribe(frames, rate, language)
+            except STTError as e:
+                if not backend.load_error:
+                    stats.observe((time.perf_counter() - start) * 1000, False)
+                errors.append(e)
+                continue
+            except Exception as e:
+                stats.observe((time.perf_counter() - start) * 1000, False)
+                print("[WARN] STT backend {} failed: {}".format(backend.name, repr(e)))
+                errors.append(STTUnavailable(str(e)))
+                continue
+            elapsed = time.perf_counter() - start
+            stats.observe(elapsed * 1000, True)
+            stats.observe_rtf(elapsed, audio_seconds)
+            stats.count('wins')
+            return {
+                'text': text,
+                'engine': backend.name,
+                'latency_ms': round(elapsed * 1000, 1),
+                'real_time_factor': round(elapsed / audio_seconds, 3) if audio_seconds else None,
+            }
+
+        no_speech = [e for e in errors if isinstance(e, STTNoSpeech)]
+        if no_speech:
+            raise no_speech[0]
+        raise errors[-1] if errors else STTUnavailable('No STT backend configured')
+
+    def get_stats(self) -> Dict:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+
+def _decode_audio_file(data: bytes, wav_error: Exception):
+    """Decode AIFF/FLAC (or unusual WAV) to 16-bit mono frames with SpeechRecognition
+
+    Returns:
+        (frames, rate)
+
+    Raises:
+        STTError: If the audio cannot be decoded
+    """
+    try:
+        import speech_recognition as sr
+    except ImportError:
+        raise STTError('Unsupported audio (expected PCM WAV): {}'.format(wav_error))
+    try:
+        with sr.AudioFile(BytesIO(data)) as source:
+            audio = sr.Recognizer().record(source)
+    except Exception as e:
+        raise STTError('Unsupported audio (expected WAV, AIFF or FLAC): {}'.format(e))
+    return audio.get_raw_data(convert_width=2), audio.sample_rate
+
+
+class StreamingTranscriber:
+    """Turn a live stream of PCM frames into partial and final transcripts
+
+    With a Vosk backend first in line, frames go straight into its incremental
+    recognizer, which yields partial hypotheses and marks utterances final.
+    Otherwise speech is cut into utterances at pauses (peak-level voice
+    activity detection) and each one is sent through STTService.transcribe_pcm.
+
+    feed() and finish() return lists of events:
+        {'type': 'partial', 'text': ...}
+        {'type': 'final', 'text': ..., 'engine': ...}
+        {'type': 'error', 'error': ...}
+    """
+
+    def __init__(self, service: STTService, rate: int = 16000, language: str = 'hi',
+                 silence_ms: int = 600, max_utterance_s: float = 15.0, threshold: int = 500):
+        """Initialize transcriber
+
+        Args:
+            service: STT service (its backends and metrics are used)
+            rate: Sample rate of the incoming 16-bit mono frames
+            language: Language code
+            silence_ms: Pause that ends an utterance (segmenting mode)
+            max_utterance_s: Longest utterance before it is cut (segmenting mode)
+            threshold: Peak level that counts as speech (segmenting mode)
+        """
+        self.service = service
+        self.rate = rate
+        self.language = language
+        self.silence_frames = int(rate * silence_ms / 1000)
+        self.max_frames = int(rate * max_utterance_s)
+        self.threshold = threshold
+        self._buffer = bytearray()
+        self._odd_byte = b''  # first half of a sample split across feed() calls
+        self._speech = False
+        self._silent_frames = 0
+        self._last_partial = ''
+        self._recognizer = None
+        first = service.backends[0] if service.backends else None
+        if isinstance(first, VoskSTTBackend):
+            try:
+                self._recognizer = first.stream_recognizer()
+            except STTUnavailable:
+                pass
+
+    def feed(self, frames: bytes) -> List[Dict]:
+        """Consume the next frames
+        
+        Messages need not hold whole samples: a trailing odd byte is kept
+        and completed by the next call, so later samples stay aligned.
+        """
+        frames = self._odd_byte + bytes(frames)
+        whole = len(frames) - len(frames) % 2
+        self._odd_byte = frames[whole:]
+        frames = frames[:whole]
+        if not frames:
+            return []
+        if self._recognizer is not None:
+            return self._feed_vosk(frames)
+        events = []
+        samples = array('h', frames)
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        peak = max(max(samples), -min(samples)) if samples else 0
+        if peak >= self.threshold:
+            self._speech = True
+            self._silent_frames = 0
+        elif self._speech:
+            self._silent_frames += len(samples)
+        if self._speech:
+            self._buffer += frames
+        if self._speech and (self._silent_frames >= self.silence_frames
+                             or len(self._buffer) // 2 >= self.max_frames):
+            events.extend(self._flush())
+        return events
+
+    def finish(self) -> List[Dict]:
+        """End of stream: finalize whatever is pending"""
+        if self._recognizer is not None:
+            return self._final(json.loads(self._recognizer.FinalResult()).get('text', ''), 'vosk')
+        return self._flush()
+
+    def _feed_vosk(self, frames: bytes) -> List[Dict]:
+        frames = pcm.resample(frames, PCMFormat(1, 2, self.rate), VoskSTTBackend.SAMPLE_RATE)
+        if self._recognizer.AcceptWaveform(frames):
+            return self._final(json.loads(self._recognizer.Result()).get('text', ''), 'vosk')
+        partial = json.loads(self._recognizer.PartialResult()).get('partial', '').strip()
+        if partial and partial != self._last_partial:
+            self._last_partial = partial
+            return [{'type': 'partial', 'text': partial}]
+        return []
+
+    def _final(self, text: str, engine: str) -> List[Dict]:
+        self._last_partial = ''
+        text = text.strip()
+        return [{'type': 'final', 'text': text, 'engine': engine}] if text else []
+
+    def _flush(self) -> List[Dict]:
+        frames = bytes(self._buffer)
+        self._buffer.clear()
+        self._speech = False
+        self._silent_frames = 0
+        if not frames:
+            return []
+        try:
+            result = self.service.transcribe_pcm(frames, self.rate, self.language)
+        except STTNoSpeech:
+            return []
+        except STTError as e:
+            return [{'type': 'error', 'error': str(e)}]
+        return self._final(result['text'], result['engine'])
+
+
+_default_service = None
+
+
+def get_stt_service() -> STTService:
+    """Process-wide service built from STT_BACKENDS (default "vosk,google")"""
+    global _default_service
+    if _default_service is None:
+        names = [n.strip() for n in os.environ.get('STT_BACKENDS', 'vosk,google').split(',') if n.strip()]
+        unknown = [n for n in names if n not in BACKENDS]
+        if unknown:
+            print("[WARN] Unknown STT backends ignored: {}".format(', '.join(unknown)))
+        _default_service = STTService([BACKENDS[n]() for n in names if n in BACKENDS])
+    return _default_service
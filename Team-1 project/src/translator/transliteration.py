@@ -0,0 +1,52 @@
+"""
+Compiled character-map transliteration shared by the engine and TTS
+"""
+
+import re
+from typing import Dict
+
+
+class Transliterator:
+    """Character-by-character transliteration compiled to str.translate
+
+    Single-character keys go into a str.maketrans table, so the bulk of the
+    work runs in C. Multi-character keys (conjuncts such as 'क्ष', 'ज्ञ') are
+    matched first, longest first, by one regex split; only the text between
+    those matches is passed through the table.
+    """
+
+    def __init__(self, mapping: Dict[str, str]):
+        """Compile a transliteration map
+
+        Args:
+            mapping: Source string -> replacement; characters not in the map
+                are kept unchanged
+        """
+        self._table = str.maketrans({k: v for k, v in mapping.items() if len(k) == 1})
+        self._multi = {k: v for k, v in mapping.items() if len(k) > 1}
+        self._pattern = None
+        if self._multi:
+            alternatives = sorted(self._multi, key=len, reverse=True)
+            self._pattern = re.compile('(' + '|'.join(re.escape(k) for k in alternatives) + ')')
+
+    def transliterate(self, text: str) -> str:
+        """Transliterate text
+
+        Args:
+            text: Text to transliterate
+
+        Returns:
+            Transliterated text
+        """
+        if not text:
+            return ''
+        if self._pattern is None:
+            return text.translate(self._table)
+        # split() with a capture group alternates plain text and matched keys
+        parts = self._pattern.split(text)
+        table, multi = self._table, self._multi
+        for i in range(0, len(parts), 2):
+            parts[i] = parts[i].translate(table)
+        for i in range(1, len(parts), 2):
+            parts[i] = multi[parts[i]]
+        return ''.join(parts)
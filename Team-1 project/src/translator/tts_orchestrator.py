@@ -0,0 +1,185 @@
+"""
+Deadline-bounded, hedged fan-out over TTS engines
+
+The primary engine (gTTS, network) gets a head start. If it has not answered
+within the hedge budget, or fails, the next engine (pyttsx3, offline) is
+started alongside it and whichever succeeds first wins. Every engine has its
+own deadline, so a hung connection can no longer block the request.
+"""
+
+import bisect
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class TTSEngine(NamedTuple):
+    """A speech engine: synthesize(text, language) -> audio bytes"""
+    name: str
+    synthesize: Callable[[str, str], Optional[bytes]]
+    content_type: str
+    deadline: float  # seconds
+
+
+class EngineStats:
+    """Latency histogram and outcome counters for one engine"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.wins = 0
+        self.total_ms = 0.0
+
+    def observe(self, elapsed_ms: float, ok: bool) -> None:
+        with self._lock:
+            self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+            self.calls += 1
+            self.total_ms += elapsed_ms
+            if ok:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    def count(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def to_dict(self) -> Dict:
+        labels = ['<={}ms'.format(b) for b in LATENCY_BUCKETS_MS] + ['>{}ms'.format(LATENCY_BUCKETS_MS[-1])]
+        return {
+            'calls': self.calls,
+            'successes': self.successes,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'wins': self.wins,
+            'mean_ms': round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            'latency_histogram': dict(zip(labels, self.buckets)),
+        }
+
+
+class TTSOrchestrator:
+    """Run TTS engines in preference order with hedging and deadlines"""
+
+    def __init__(self, engines: Sequence[TTSEngine], hedge_after: float = 1.5, max_workers: int = 8):
+        """Initialize orchestrator
+
+        Args:
+            engines: Engines in order of preference
+            hedge_after: Seconds to wait for a running engine before also
+                starting the next one
+            max_workers: Threads shared by all in-flight synthesis calls
+        """
+        self.engines = list(engines)
+        self.hedge_after = hedge_after
+        self.hedges = 0
+        self.stats = {engine.name: EngineStats() for engine in self.engines}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tts')
+
+    def _run(self, engine: TTSEngine, text: str, language: str) -> Optional[bytes]:
+        start = time.perf_counter()
+        try:
+            audio = engine.synthesize(text, language)
+        except Exception as e:
+            print("[TTS] {} failed: {}".format(engine.name, e))
+            audio = None
+        self.stats[engine.name].observe((time.perf_counter() - start) * 1000, bool(audio))
+        return audio
+
+    def synthesize(self, text: str, language: str,
+                   content_type: Optional[str] = None) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+        """Return the first successful engine's audio
+
+        Args:
+            text: Text to speak (already prepared for TTS)
+            language: Language code for the engines
+            content_type: Only run the engines producing this format
+
+        Returns:
+            tuple: (audio_bytes, content_type, engine_name) or (None, None, None)
+            when every engine failed or missed its deadline
+        """
+        running: Dict = {}  # future -> (engine, deadline)
+        pending: List[TTSEngine] = [engine for engine in self.engines
+                                    if content_type is None or engine.content_type == content_type]
+
+        def launch():
+            engine = pending.pop(0)
+            future = self._executor.submit(self._run, engine, text, language)
+            running[future] = (engine, time.monotonic() + engine.deadline)
+            return time.monotonic() + self.hedge_after
+
+        hedge_at = launch() if pending else None
+        while running:
+            now = time.monotonic()
+            wake = min(deadline for _, deadline in running.values())
+            if pending:
+                wake = min(wake, hedge_at)
+            done, _ = wait(list(running), timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                engine, _ = running.pop(future)
+                audio = future.result()
+                if audio:
+                    self.stats[engine.name].count('wins')
+                    for other in running:
+                        other.cancel()
+                    return audio, engine.content_type, engine.name
+                if pending:
+                    hedge_at = launch()
+
+            now = time.monotonic()
+            for future, (engine, deadline) in list(running.items()):
+                if now >= deadline:
+                    # The thread cannot be killed; its result is simply ignored
+                    print("[TTS] {} missed its {:.1f}s deadline".format(engine.name, engine.deadline))
+                    del running[future]
+                    future.cancel()
+                    self.stats[engine.name].count('timeouts')
+                    if pending:
+                        hedge_at = launch()
+
+            if pending and running and now >= hedge_at:
+                self.hedges += 1
+                hedge_at = launch()
+        return None, None, None
+
+    def get_stats(self) -> Dict:
+        """Per-engine latency histograms and failure counts"""
+        return {
+            'hedge_after_ms': int(self.hedge_after * 1000),
+            'hedges': self.hedges,
+            'engines': {name: stats.to_dict() for name, stats in self.stats.items()},
+        }
+
+
+_default_orchestrator = None
+_default_lock = threading.Lock()
+
+
+def get_tts_orchestrator() -> TTSOrchestrator:
+    """Process-wide orchestrator over gTTS then pyttsx3
+
+    TTS_HEDGE_MS sets the hedge budget; TTS_GTTS_TIMEOUT and
+    TTS_OFFLINE_TIMEOUT set the engines' deadlines in seconds.
+    """
+    global _default_orchestrator
+    with _default_lock:
+        if _default_orchestrator is None:
+            from .audio_gen import _generate_with_gtts, _generate_with_pyttsx3
+            gtts_deadline = float(os.environ.get('TTS_GTTS_TIMEOUT', '8'))
+            _default_orchestrator = TTSOrchestrator([
+                TTSEngine('gtts', lambda text, lang: _generate_with_gtts(text, lang, timeout=gtts_deadline),
+                          'audio/mpeg', gtts_deadline),
+                TTSEngine('pyttsx3', _generate_with_pyttsx3, 'audio/wav',
+                          float(os.environ.get('TTS_OFFLINE_TIMEOUT', '10'))),
+            ], hedge_after=int(os.environ.get('TTS_HEDGE_MS', '1500')) / 1000)
+        return _default_orchestrator
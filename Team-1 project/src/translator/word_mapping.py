@@ -0,0 +1,96 @@
+"""
+Compact, read-only records for the word_mappings of translation results
+
+A WordMapping reads like the dict it replaces (m['santali'], m.get('note'),
+dict(m)) but keeps its fields in __slots__. Because it is immutable, the
+engine shares one record between every result that maps the same word to
+the same dictionary entry, and caches hand it out without copying. It only
+turns into a dict when the result is serialized (see json_default).
+
+Every entry of a result's word_mappings is a WordMapping, whatever the
+language pair: Hindi <-> Santali results use WordMapping itself, Hindi <->
+English results use EnglishWordMapping. Serialize results with
+json.dumps(default=json_default) or the app's JSON provider.
+"""
+
+from collections.abc import Mapping
+from typing import Optional
+
+
+class WordMapping(Mapping):
+    """How one source word or phrase was translated (Hindi <-> Santali)"""
+
+    __slots__ = ('hindi', 'santali', 'source', 'confidence', 'note')
+    _FIELDS = ('hindi', 'santali', 'source', 'confidence', 'note')
+
+    def __init__(self, hindi: str, santali: str, source: str, confidence: float,
+                 note: Optional[str] = None):
+        """Initialize record
+
+        Args:
+            hindi: Hindi side of the mapping
+            santali: Santali side of the mapping
+            source: How it was found ('dictionary', 'stem_match', ...)
+            confidence: Score between 0 and 1
+            note: Optional remark (omitted from the mapping when None)
+        """
+        self._set_fields(hindi, santali, source, confidence, note)
+
+    def _set_fields(self, *values) -> None:
+        for name, value in zip(self._FIELDS, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is read-only'.format(type(self).__name__))
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __getitem__(self, key: str):
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        for name in self._FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__name__, self.to_dict())
+
+    def to_dict(self) -> dict:
+        """Plain dict with the same keys"""
+        return {name: getattr(self, name) for name in self}
+
+
+class EnglishWordMapping(WordMapping):
+    """How one source word or phrase was translated (Hindi <-> English)"""
+
+    __slots__ = ('english',)
+    _FIELDS = ('hindi', 'english', 'source', 'confidence', 'note')
+
+    def __init__(self, hindi: str, english: str, source: str, confidence: float,
+                 note: Optional[str] = None):
+        """Initialize record
+
+        Args:
+            hindi: Hindi side of the mapping
+            english: English side of the mapping
+            source: How it was found ('dictionary' or 'unknown')
+            confidence: Score between 0 and 1
+            note: Optional remark (omitted from the mapping when None)
+        """
+        self._set_fields(hindi, english, source, confidence, note)
+
+
+def json_default(value):
+    """json.dumps(default=...) hook that serializes WordMapping records"""
+    if isinstance(value, WordMapping):
+        return value.to_dict()
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(value).__name__))
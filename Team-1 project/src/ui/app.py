@@ -0,0 +1,472 @@
+"""
+Production-Ready Flask API for Hindi-Santali Translator
+Modern API with React frontend support
+"""
+
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
+import sys
+import os
+import json
+import re
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator.engine import TranslationEngine
+from translator.cache import TranslationCache
+from translator.word_mapping import WordMapping
+from translator.preload import process_memory
+from translator.audio_cache import get_audio_cache
+from translator.tts_orchestrator import get_tts_orchestrator
+from translator.offline_tts import get_offline_tts_pool
+from translator.stt import get_stt_service
+
+try:
+    # Optional: WebSocket support for live transcription (pip install flask-sock)
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
+
+# IDs handed out by /api/session (uuid4 hex); workers adopt them on first sight
+_SESSION_ID = re.compile(r'[0-9a-f]{32}')
+
+class TranslatorJSONProvider(DefaultJSONProvider):
+    """jsonify() that also serializes the engine's WordMapping records"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, WordMapping):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
+def create_app(config=None):
+    """Create and configure Flask application"""
+    # Use absolute paths so templates & static files resolve correctly both
+    # locally and on Vercel's serverless filesystem.
+    _here = os.path.dirname(os.path.abspath(__file__))
+    app = Flask(__name__,
+                template_folder=os.path.join(_here, 'templates'),
+                static_folder=None)   # no separate static dir; everything inline
+    
+    CORS(app)
+    app.json = TranslatorJSONProvider(app)
+    app.config['TEMPLATES_AUTO_RELOAD'] = True
+    if config:
+        app.config.update(config)
+    
+    # Initialize translator (includes dictionary)
+    translator = TranslationEngine()
+    if os.environ.get('TRANSLATOR_PRELOAD') == '1':
+        # Built before gunicorn forks its workers (see gunicorn.conf.py)
+        translator.preload()
+        if not translator.snapshot_loaded and os.path.exists(translator.dictionary_path):
+            # Missing or stale snapshot: write one so the next start skips the CSV
+            try:
+                print("[OK] Wrote dictionary snapshot {}".format(translator.build_snapshot()))
+            except OSError as e:
+                print("[WARN] Could not write dictionary snapshot: {}".format(repr(e)))
+    
+    # Incremental translate-as-you-type sessions; idle ones expire
+    sessions = TranslationCache(max_entries=int(os.environ.get('TRANSLATE_SESSIONS', '1000')),
+                                ttl=float(os.environ.get('TRANSLATE_SESSION_TTL', '1800')))
+    
+    # ============ STATIC PAGES ============
+    
+    @app.route('/')
+    def index():
+        """Serve main React app"""
+        return render_template('index.html')
+    
+    @app.route('/test')
+    def test():
+        """Quick test page"""
+        result = translator.translate("नमस्ते", 'hi', 'sat')
+        return f"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>Test</title><style>body{{font-family:Arial;padding:20px}}</style></head>
+        <body>
+            <h1>Translation Test</h1>
+            <p><strong>Input:</strong> नमस्ते</p>
+            <p><strong>Output:</strong> {result.get('translated_text')}</p>
+            <p><strong>Status:</strong> {'✓ Success' if result.get('success') else '✗ Failed'}</p>
+        </body>
+        </html>
+        """
+    
+    # ============ TRANSLATION API ============
+    
+    @app.route('/api/translate', methods=['POST'])
+    def translate():
+        """Translate text (Hindi ↔ Santali)"""
+        try:
+            data = request.get_json()
+            text = data.get('text', '').strip()
+            source_lang = str(data.get('source_lang', 'hi')).strip().lower()
+            target_lang = str(data.get('target_lang', 'sat')).strip().lower()
+            
+            if not text:
+                return jsonify({'success': False, 'error': 'Empty text'}), 400
+            
+            result = translator.translate(text, source_lang, target_lang)
+            return jsonify(result)
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    @app.route('/api/session', methods=['POST'])
+    def create_session():
+        """Start an incremental translation session"""
+        try:
+            data = request.get_json(silent=True) or {}
+            session_id = uuid.uuid4().hex
+            sessions.set(session_id, translator.create_session(
+                data.get('source_lang', 'hi'), data.get('target_lang', 'sat')))
+            return jsonify({'success': True, 'session_id': session_id})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    @app.route('/api/session/<session_id>/translate', methods=['POST'])
+    def session_translate(session_id):
+        """Translate the full current text of a session, reusing the unchanged prefix
+        
+        Each call carries the full text, so a worker that has not seen the
+        session (another gunicorn worker, a fresh serverless instance, or an
+        expired session) starts it afresh under the same ID and translates
+        the whole text; later calls that reach this worker reuse its state.
+        """
+        try:
+            data = request.get_json(silent=True) or {}
+            text = data.get('text', '')
+            if not text.strip():
+                return jsonify({'success': False, 'error': 'Empty text'}), 400
+            session = sessions.get(session_id)
+            resumed = session is not None
+            if not resumed:
+                if not _SESSION_ID.fullmatch(session_id):
+                    return jsonify({'success': False, 'error': 'Invalid session id'}), 404
+                session = translator.create_session(
+                    data.get('source_lang', 'hi'), data.get('target_lang', 'sat'))
+            result = session.update(text)
+            result['session_resumed'] = resumed
+            sessions.set(session_id, session)  # Refresh its expiry
+            return jsonify(result)
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    @app.route('/api/batch-translate', methods=['POST'])
+    def batch_translate():
+        """Translate multiple texts"""
+        try:
+            data = request.get_json()
+            texts = data.get('texts', [])
+            source_lang = data.get('source_lang', 'hi')
+            target_lang = data.get('target_lang', 'sat')
+            
+            if not texts:
+                return jsonify({'error': 'No texts provided'}), 400
+            
+            results = translator.batch_translate(texts, source_lang, target_lang)
+            
+            return jsonify({'success': True, 'count': len(results), 'results': results})
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    @app.route('/api/batch-translate/stream', methods=['POST'])
+    def batch_translate_stream():
+        """Translate texts one per line, streaming each result as it finishes.
+        
+        The body is either plain text (one text per line, read incrementally
+        so memory stays flat for any input size; languages come from the
+        query string) or a JSON object like /api/batch-translate.
+        Output is NDJSON by default, or Server-Sent Events with ?format=sse
+        (or an Accept: text/event-stream header). A final
+        {"done": true, "count": n} record ends the stream.
+        """
+        source_lang = request.args.get('source_lang', 'hi')
+        target_lang = request.args.get('target_lang', 'sat')
+        use_sse = (request.args.get('format') == 'sse'
+                   or request.accept_mimetypes.best == 'text/event-stream')
+        
+        if request.is_json:
+            data = request.get_json(silent=True) or {}
+            lines = data.get('texts', [])
+            source_lang = data.get('source_lang', source_lang)
+            target_lang = data.get('target_lang', target_lang)
+            if not isinstance(lines, list):
+                return jsonify({'error': 'texts must be a list'}), 400
+        else:
+            def read_lines(stream):
+                for raw in stream:
+                    line = raw.decode('utf-8', errors='replace').strip()
+                    if line:
+                        yield line
+            lines = read_lines(request.stream)
+        
+        def encode(record, event=None):
+            payload = json.dumps(record, ensure_ascii=False, default=app.json.default)
+            if not use_sse:
+                return payload + '\n'
+            return ('event: ' + event + '\n' if event else '') + 'data: ' + payload + '\n\n'
+        
+        def generate():
+            count = 0
+            try:
+                for result in translator.translate_iter(lines, source_lang, target_lang):
+                    count += 1
+                    yield encode(result)
+            except Exception as e:
+                yield encode({'done': True, 'count': count, 'error': str(e)}, 'done')
+                return
+            yield encode({'done': True, 'count': count}, 'done')
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream' if use_sse else 'application/x-ndjson',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    
+    # ============ DICTIONARY API ============
+    
+    @app.route('/api/dictionary/search', methods=['GET'])
+    def search_dictionary():
+        """Search dictionary"""
+        try:
+            q = request.args.get('q', '').strip()
+            lang = request.args.get('lang', 'hi')
+            
+            if not q:
+                return jsonify({'error': 'Empty query'}), 400
+            
+            results = translator.dictionary.search_words(q, lang)
+            return jsonify({'query': q, 'results': results, 'count': len(results)})
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    @app.route('/api/dictionary/lookup/<word>', methods=['GET'])
+    def lookup_word(word):
+        """Look up a single word"""
+        try:
+            result = translator.dictionary.lookup_hindi_to_santali(word)
+            if result:
+                return jsonify({'success': True, 'hindi': word, 'santali': result})
+            return jsonify({'success': False, 'error': 'Word not found'}), 404
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    # ============ SPEECH-TO-TEXT (TRANSCRIBE) API ============
+
+    @app.route('/api/transcribe', methods=['POST'])
+    def transcribe():
+        """Transcribe uploaded audio (WAV; AIFF/FLAC via SpeechRecognition) to Hindi text (see translator.stt)."""
+        try:
+            from translator.stt import STTError, STTNoSpeech
+
+            audio_file = request.files.get('audio')
+            if not audio_file:
+                return jsonify({'success': False, 'error': 'No audio file uploaded'}), 400
+
+            try:
+                result = get_stt_service().transcribe(audio_file.read(), 'hi')
+            except STTNoSpeech:
+                return jsonify({'success': False, 'error': 'Could not understand the audio. Please speak clearly in Hindi.'})
+            except STTError as e:
+                return jsonify({'success': False, 'error': str(e)})
+            return jsonify({'success': True, **result})
+
+        except Exception as e:
+            import traceback
+            print('[/api/transcribe] Exception:', traceback.format_exc())
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    if Sock is not None:
+        sock = Sock(app)
+
+        @sock.route('/ws/transcribe')
+        def transcribe_live(ws):
+            """Live transcription + translation over a WebSocket.
+
+            The client sends binary messages of 16-bit little-endian mono PCM
+            (rate from ?rate=, default 16000) and a text message {"type": "stop"}
+            when done. The server sends JSON events: 'partial' transcripts,
+            'final' segments with their translation, and 'done'.
+            """
+            from translator.stt import StreamingTranscriber
+
+            rate = request.args.get('rate', 16000, type=int)
+            source_lang = request.args.get('source_lang', 'hi')
+            target_lang = request.args.get('target_lang', 'sat')
+            transcriber = StreamingTranscriber(get_stt_service(), rate=rate, language=source_lang)
+
+            def send(events):
+                for event in events:
+                    if event['type'] == 'final':
+                        result = translator.translate(event['text'], source_lang, target_lang)
+                        event['translated_text'] = result.get('translated_text', '')
+                        event['confidence'] = result.get('confidence', 0)
+                    ws.send(json.dumps(event, ensure_ascii=False))
+
+            while True:
+                message = ws.receive()
+                if message is None:
+                    break
+                if isinstance(message, str):
+                    try:
+                        control = json.loads(message)
+                    except ValueError:
+                        continue
+                    if control.get('type') == 'stop':
+                        break
+                    continue
+                send(transcriber.feed(message))
+            send(transcriber.finish())
+            ws.send(json.dumps({'type': 'done'}))
+    else:
+        print("[WARN] flask-sock not installed - /ws/transcribe disabled (uploads still work)")
+
+    # ============ TEXT-TO-SPEECH API ============
+    
+    @app.route('/api/speak', methods=['GET', 'POST'])
+    def speak():
+        """Generate audio for text (Text-to-Speech).
+        Returns MP3 (gTTS) or WAV (pyttsx3 / fallback tone) with correct Content-Type.
+        Synthesized clips are cached (memory + disk) and sent with an ETag, so
+        repeated phrases are served without synthesis and a matching
+        If-None-Match gets 304. The ETag hashes the audio bytes, so it only
+        validates what this worker would send. GET takes
+        ?text=&language=[&segments=] for HTTP caching; the segmentation is
+        part of the cache key.
+        """
+        try:
+            from translator.audio_gen import get_speech_audio
+
+            if request.method == 'GET':
+                data = request.args
+            else:
+                data = request.get_json(force=True, silent=True) or {}
+            text = str(data.get('text', '')).strip()
+            language = str(data.get('language', 'hi')).strip().lower()
+
+            if not text:
+                return jsonify({'error': 'Empty text provided'}), 400
+
+            # Optional phrase units (e.g. word_mappings[*].santali) for
+            # stitching: a JSON list in the POST body or in ?segments=
+            segments = data.get('segments')
+            if isinstance(segments, str):
+                try:
+                    segments = json.loads(segments)
+                except ValueError:
+                    segments = None
+            if not isinstance(segments, list) or not all(isinstance(seg, str) for seg in segments):
+                segments = None
+
+            # A cached clip is returned without synthesis, so a revalidation
+            # of audio this worker holds costs only the cache lookup
+            entry = get_speech_audio(text, language, segments=segments)
+
+            if not entry:
+                return jsonify({'error': 'All TTS engines failed — check server logs'}), 500
+
+            cache_headers = {'Cache-Control': 'public, max-age=86400'}
+            if entry['etag'] and request.if_none_match.contains(entry['etag']):
+                response = Response(status=304, headers=cache_headers)
+                response.set_etag(entry['etag'])
+                return response
+
+            audio_data = entry['audio']
+            response = Response(
+                audio_data,
+                mimetype=entry['content_type'],
+                headers={
+                    'Content-Length': str(len(audio_data)),
+                    'X-TTS-Cache': 'HIT' if entry['cached'] else 'MISS'
+                }
+            )
+            if entry['etag']:
+                response.headers.update(cache_headers)
+                response.set_etag(entry['etag'])
+            else:
+                response.headers['Cache-Control'] = 'no-cache'
+            return response
+        except Exception as e:
+            import traceback
+            print("[/api/speak] Exception:", traceback.format_exc())
+            return jsonify({'error': str(e)}), 500
+    
+    @app.route('/api/speak/stream', methods=['GET', 'POST'])
+    def speak_stream():
+        """Stream speech for long texts sentence by sentence (chunked MP3/WAV).
+        Playback can start as soon as the first sentence is synthesized.
+        """
+        try:
+            from translator.audio_gen import get_speech_audio, get_speech_audio_as
+            from translator.speech_stream import stream_speech
+
+            if request.method == 'GET':
+                data = request.args
+            else:
+                data = request.get_json(force=True, silent=True) or {}
+            text = str(data.get('text', '')).strip()
+            language = str(data.get('language', 'hi')).strip().lower()
+
+            if not text:
+                return jsonify({'error': 'Empty text provided'}), 400
+
+            stream = stream_speech(text, language, get_speech_audio, synthesize_as=get_speech_audio_as)
+            if stream is None:
+                return jsonify({'error': 'All TTS engines failed — check server logs'}), 500
+
+            content_type, chunks = stream
+            return Response(
+                chunks,
+                mimetype=content_type,
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+        except Exception as e:
+            import traceback
+            print("[/api/speak/stream] Exception:", traceback.format_exc())
+            return jsonify({'error': str(e)}), 500
+    
+    # ============ STATS & INFO ============
+    
+    @app.route('/api/stats', methods=['GET'])
+    def get_stats():
+        """Get translator statistics"""
+        try:
+            stats = {
+                'total_rows_loaded': getattr(translator.dictionary, 'total_rows_loaded', 0),
+                'unique_pairs': len(translator.dictionary.hindi_to_santali),
+                'cache_size': len(translator.translation_cache),
+                'cache': translator.translation_cache.get_stats(),
+                'token_cache': translator.token_cache.get_stats(),
+                'sessions': len(sessions),
+                'worker_pid': os.getpid(),
+                'memory': process_memory(),
+                'audio_cache': get_audio_cache().get_stats(),
+                'tts': get_tts_orchestrator().get_stats(),
+                'offline_tts_pool': get_offline_tts_pool().get_stats(),
+                'stt': get_stt_service().get_stats(),
+                'dataset_path': getattr(translator.dictionary, 'dictionary_path', ''),
+                'languages': ['Hindi', 'Santali']
+            }
+            return jsonify({'success': True, 'stats': stats})
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    # ============ ERROR HANDLERS ============
+    
+    @app.errorhandler(404)
+    def not_found(error):
+        return jsonify({'error': 'Not found'}), 404
+    
+    @app.errorhandler(500)
+    def server_error(error):
+        return jsonify({'error': 'Server error'}), 500
+    
+    return app
+
+if __name__ == '__main__':
+    app = create_app()
+    app.run(debug=False, host='0.0.0.0', port=5000)
@@ -0,0 +1,54 @@
+"""
+Tests for the Flask API (skipped when Flask is not installed)
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('flask')
+pytest.importorskip('flask_cors')
+
+from src.ui.app import create_app
+
+@pytest.fixture
+def client():
+    """Create a test client for a fresh app"""
+    return create_app({'TESTING': True}).test_client()
+
+def test_speak_stream_accepts_long_text_in_post_body(client, monkeypatch):
+    """Texts too long for a URL are streamed from a POST body"""
+    import translator.audio_gen as audio_gen
+
+    def fake_speech_audio(sentence, language):
+        return {'audio': sentence.encode('utf-8'), 'content_type': 'audio/mpeg'}
+
+    monkeypatch.setattr(audio_gen, 'get_speech_audio', fake_speech_audio)
+    text = ' '.join('ᱟᱢ{} ᱫᱚ ᱪᱮᱫ ᱧᱩᱛᱩᱢ ᱠᱟᱱᱟ ᱾'.format(i) for i in range(30))
+    assert len(text) > 500
+    response = client.post('/api/speak/stream', json={'text': text, 'language': 'sat'})
+    assert response.status_code == 200
+    assert response.mimetype == 'audio/mpeg'
+    assert response.get_data().decode('utf-8').replace('᱾', '᱾ ').split() == text.split()
+
+def test_session_translate_on_a_worker_that_never_saw_the_session(client):
+    """An unknown but well-formed session ID is started afresh, not rejected"""
+    response = client.post('/api/session/' + 'a' * 32 + '/translate',
+                           json={'text': 'नमस्ते', 'source_lang': 'hi', 'target_lang': 'sat'})
+    data = response.get_json()
+    assert response.status_code == 200 and data['success']
+    assert data['session_resumed'] is False
+    again = client.post('/api/session/' + 'a' * 32 + '/translate', json={'text': 'नमस्ते पानी'})
+    assert again.get_json()['session_resumed'] is True
+
+def test_batch_stream_keeps_going_past_a_bad_item(client):
+    """A non-string text gets its own error record instead of ending the stream"""
+    import json
+
+    response = client.post('/api/batch-translate/stream',
+                           json={'texts': ['नमस्ते', 5, 'पानी'], 'source_lang': 'hi', 'target_lang': 'sat'})
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [(r['index'], r['success']) for r in records[:3]] == [(0, True), (1, False), (2, True)]
+    assert records[3] == {'done': True, 'count': 3}
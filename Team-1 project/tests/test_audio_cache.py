@@ -0,0 +1,69 @@
+"""
+Tests for the TTS audio cache
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator import audio_gen
+from src.translator.audio_cache import AudioCache
+
+def test_key_normalizes_whitespace():
+    """Equivalent texts share a key; language changes it"""
+    assert AudioCache.make_key('नमस्ते  दुनिया ', 'hi') == AudioCache.make_key('नमस्ते दुनिया', 'hi')
+    assert AudioCache.make_key('नमस्ते', 'hi') != AudioCache.make_key('नमस्ते', 'en')
+
+def test_key_depends_on_stitching_segments():
+    """Audio stitched along different phrase boundaries gets a different key and ETag"""
+    text = 'ᱟᱢ ᱫᱚ ᱪᱮᱫ'
+    plain = audio_gen.speech_cache_key(text, 'sat')
+    split = audio_gen.speech_cache_key(text, 'sat', ['ᱟᱢ ᱫᱚ', 'ᱪᱮᱫ'])
+    other = audio_gen.speech_cache_key(text, 'sat', ['ᱟᱢ', 'ᱫᱚ ᱪᱮᱫ'])
+    assert len({plain, split, other}) == 3
+    assert split == audio_gen.speech_cache_key(text, 'sat', ['ᱟᱢ  ᱫᱚ ', 'ᱪᱮᱫ'])
+    assert plain == audio_gen.speech_cache_key(text, 'sat', [])
+
+def test_disk_tier_survives_memory_loss(tmp_path):
+    """A clip evicted from memory is served from disk"""
+    cache = AudioCache(disk_dir=str(tmp_path))
+    key = AudioCache.make_key('johar', 'hi')
+    cache.set(key, b'ID3audio', 'audio/mpeg')
+    cache.memory.clear()
+    entry = cache.get(key)
+    assert entry['audio'] == b'ID3audio' and entry['content_type'] == 'audio/mpeg'
+    assert cache.get_stats()['disk_hits'] == 1
+
+def test_etag_follows_the_audio_not_the_key(tmp_path):
+    """Different audio under one key (e.g. MP3 on one worker, WAV on another) gets different ETags"""
+    key = AudioCache.make_key('johar', 'hi')
+    mp3 = AudioCache(disk_dir=str(tmp_path / 'a')).set(key, b'ID3audio', 'audio/mpeg')
+    wav = AudioCache(disk_dir=str(tmp_path / 'b')).set(key, b'RIFFaudio', 'audio/wav')
+    assert mp3['etag'] != wav['etag']
+    cache = AudioCache(disk_dir=str(tmp_path / 'a'))
+    assert cache.get(key)['etag'] == mp3['etag']
+
+def test_disk_tier_is_bounded(tmp_path):
+    """Oldest clips are removed once the disk limit is exceeded"""
+    cache = AudioCache(disk_dir=str(tmp_path), disk_max_bytes=250)
+    for i in range(5):
+        cache.set(AudioCache.make_key(str(i), 'hi'), b'x' * 100, 'audio/wav')
+    stats = cache.get_stats()
+    assert stats['disk_bytes'] <= 250 and stats['disk_evictions'] > 0
+
+def test_repeated_phrase_is_not_resynthesized(tmp_path, monkeypatch):
+    """Only the first request for a phrase reaches the TTS engines"""
+    calls = []
+
+    def fake_synthesize(tts_text, language):
+        calls.append(tts_text)
+        return b'ID3' + tts_text.encode('utf-8'), 'audio/mpeg', True
+
+    monkeypatch.setattr(audio_gen, '_synthesize', fake_synthesize)
+    cache = AudioCache(disk_dir=str(tmp_path))
+    first = audio_gen.get_speech_audio('ᱡᱚᱦᱟᱨ', 'sat', cache=cache)
+    second = audio_gen.get_speech_audio('ᱡᱚᱦᱟᱨ ', 'sat', cache=cache)
+    assert len(calls) == 1
+    assert first['cached'] is False and second['cached'] is True
+    assert second['audio'] == first['audio'] and second['etag'] == first['etag']
@@ -0,0 +1,140 @@
+"""
+Tests for dictionary module
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.dictionary import Dictionary
+
+@pytest.fixture
+def dictionary():
+    """Create dictionary instance for testing"""
+    return Dictionary()
+
+def test_lookup_hindi_to_santali(dictionary):
+    """Test Hindi to Santali lookup"""
+    result = dictionary.lookup_hindi_to_santali('नमस्ते')
+    assert result == 'जोहार'
+
+def test_lookup_santali_to_hindi(dictionary):
+    """Test Santali to Hindi lookup"""
+    result = dictionary.lookup_santali_to_hindi('जोहार')
+    assert result == 'नमस्ते'
+
+def test_lookup_nonexistent_word(dictionary):
+    """Test lookup of non-existent word"""
+    result = dictionary.lookup_hindi_to_santali('अपरिचित')
+    assert result is None
+
+def test_add_word(dictionary):
+    """Test adding word to dictionary"""
+    dictionary.add_word('नया', 'सर')
+    assert dictionary.lookup_hindi_to_santali('नया') == 'सर'
+    assert dictionary.lookup_santali_to_hindi('सर') == 'नया'
+
+def test_get_all_words(dictionary):
+    """Test getting all words"""
+    words = dictionary.get_all_words()
+    assert isinstance(words, dict)
+    assert len(words) > 0
+
+def test_search_words(dictionary):
+    """Test word search"""
+    results = dictionary.search_words('नम', 'hi')
+    assert len(results) > 0
+    assert any('नमस्ते' in result[0] for result in results)
+
+def test_case_insensitive_lookup(dictionary):
+    """Test case-insensitive lookup"""
+    result1 = dictionary.lookup_hindi_to_santali('नमस्ते')
+    result2 = dictionary.lookup_hindi_to_santali('नमस्ते')
+    assert result1 == result2
+
+def test_fuzzy_match_matches_linear_scan(dictionary):
+    """Indexed fuzzy match returns the same result as a full scan"""
+    from difflib import SequenceMatcher
+
+    def linear(word, threshold):
+        best_match, best_score = None, threshold
+        for key, value in dictionary.hindi_to_santali.items():
+            if word == key.lower():
+                return (value, 1.0)
+            score = SequenceMatcher(None, word, key.lower()).ratio()
+            if score > best_score:
+                best_match, best_score = (value, score), score
+        return best_match
+
+    dictionary.add_word('नमस्तेजी', 'ᱡᱚᱦᱟᱨ ᱡᱤ')
+    for word in ['नमस्ते', 'नमसते', 'पानीयों', 'बेटियाँ', 'सुंदरता', 'xyz', 'कलमें']:
+        for threshold in (0.5, 0.7):
+            assert dictionary.fuzzy_match_hindi_to_santali(word, threshold) == linear(word, threshold)
+
+def test_santali_fuzzy_index_tracks_add_word(dictionary):
+    """Words added after load are found by the Santali fuzzy index"""
+    dictionary.add_word('बिल्ली', 'ᱯᱩᱥᱤ')
+    assert dictionary.fuzzy_match_santali_to_hindi('ᱯᱩᱥᱤ') == ('बिल्ली', 1.0)
+    match = dictionary.fuzzy_match_santali_to_hindi('ᱯᱩᱥᱤᱠᱚ', threshold=0.65)
+    assert match is not None and match[0] == 'बिल्ली'
+
+def test_prefix_index_built_on_demand(dictionary):
+    """prefix_index is built lazily and lists every key once per prefix"""
+    assert dictionary._prefix_index is None
+    assert dictionary.prefix_index['नम'].count('नमस्ते') == 1
+    assert 'नम' in dictionary.prefix_index
+    assert dictionary.prefix_index.get('झिलमिल') is None
+    with pytest.raises(KeyError):
+        dictionary.prefix_index['झिलमिल']
+
+def test_phrase_match_span(dictionary):
+    """The span covers the tokens read, plus the next one at the end of input"""
+    from src.translator.phrase_trie import PhraseTrie
+
+    trie = PhraseTrie(['मुझे भूख लगी है', 'पानी'])
+    assert trie.max_depth == 4
+    assert list(trie.encode(['पानी', 'दो'])) == [trie.token_ids['पानी'], -1]
+    assert trie.match_span(trie.encode(['पानी', 'दो']), 0) == 2
+    assert trie.match_span(trie.encode(['मुझे', 'भूख']), 0) == 3
+    assert trie.match_span(trie.encode(['मुझे', 'भूख', 'लगी', 'है', 'आज']), 0) == 5
+
+def test_stem_lookup_uses_suffix_priority(dictionary):
+    """Suffixes are found from the word's end and tried in priority order"""
+    from src.translator.morphology import SuffixTrie
+
+    trie = SuffixTrie(['ों', 'ियों', 'ी'])
+    assert trie.stems('लड़कियों') == ['लड़किय', 'लड़क']
+    assert trie.stems('ली') == []  # stem would be shorter than two characters
+    dictionary.add_word('किताब', 'ᱯᱚᱛᱷᱤ')
+    assert dictionary.stem_lookup_hindi_to_santali('किताबों') == 'ᱯᱚᱛᱷᱤ'
+    assert dictionary.stem_lookup_hindi_to_santali('झिलमिलों') is None
+
+def test_probe_methods_match_lookups(dictionary):
+    """Raw probes on normalize_key() output agree with the normalizing lookups"""
+    for word in ['नमस्ते', '  पानी ', 'झिलमिल', 'नमसते']:
+        key = dictionary.normalize_key(word)
+        assert dictionary.probe_hindi(key) == dictionary.lookup_hindi_to_santali(word)
+        assert dictionary.probe_hindi_fuzzy(key, 0.5) == dictionary.fuzzy_match_hindi_to_santali(word, 0.5)
+
+def test_compact_phrase_trie_and_lowercase_index(dictionary):
+    """Compact trie nodes and the sparse hindi_lower index keep lookups intact"""
+    from src.translator.phrase_trie import PhraseTrie
+
+    trie = PhraseTrie(['मुझे भूख', 'मुझे भूख लगी है', 'मुझे', 'पानी।'])
+    trie.add('मुझे भूख')  # already present: not counted twice
+    assert len(trie) == 4
+    for tokens, expected in [(['मुझे', 'भूख', 'लगी', 'है'], (4, 'मुझे भूख लगी है')),
+                             (['मुझे', 'भूख', 'लगी'], (2, 'मुझे भूख')),
+                             (['मुझे', 'पानी'], (1, 'मुझे')),
+                             (['पानी', 'दो'], (1, 'पानी।'))]:
+        assert trie.longest_match(trie.encode(tokens), 0) == expected
+
+    assert dictionary.hindi_lower == {}  # Devanagari keys need no entries
+    dictionary.add_word('Hello', 'ᱡᱚᱦᱟᱨ')
+    assert dictionary.hindi_lower == {'hello': 'Hello'}
+    assert dictionary.probe_hindi('HELLO') == 'ᱡᱚᱦᱟᱨ'
+    dictionary.add_word('hello', 'ᱦᱮᱞᱳ')  # the latest key for a lowercase form wins
+    assert dictionary.hindi_lower == {}
+    assert dictionary.probe_hindi('HELLO') == 'ᱦᱮᱞᱳ'
@@ -0,0 +1,78 @@
+"""
+Tests for the persistent pyttsx3 worker pool
+"""
+
+import sys
+import os
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.offline_tts import OfflineTTSPool
+
+# Workers are started by a fork server or spawned, so the stand-in has to be
+# a real module on sys.path (which the workers receive) rather than an entry
+# patched into the parent's sys.modules
+FAKE_PYTTSX3 = '''
+inits = 0
+
+
+class Engine:
+    def __init__(self):
+        self.props = {'voice': 'default', 'voices': []}
+        self.job = None
+
+    def setProperty(self, name, value):
+        self.props[name] = value
+
+    def getProperty(self, name):
+        return self.props[name]
+
+    def save_to_file(self, text, path):
+        self.job = (text, path)
+
+    def runAndWait(self):
+        text, path = self.job
+        with open(path, 'wb') as f:
+            f.write('RIFF{}:{}'.format(inits, text).encode('utf-8'))
+
+
+def init():
+    global inits
+    inits += 1
+    return Engine()
+'''
+
+@pytest.fixture
+def stub_pyttsx3(tmp_path, monkeypatch):
+    """Put a pyttsx3 module with the given source first on sys.path"""
+    def install(source):
+        (tmp_path / 'pyttsx3.py').write_text(textwrap.dedent(source))
+        monkeypatch.syspath_prepend(str(tmp_path))
+    return install
+
+def test_workers_initialize_once(stub_pyttsx3):
+    """Engine init happens once per worker, not once per request"""
+    stub_pyttsx3(FAKE_PYTTSX3)
+    pool = OfflineTTSPool(size=1)
+    try:
+        assert pool.synthesize('johar', 'hi') == b'RIFF1:johar'
+        assert pool.synthesize('sagun', 'hi') == b'RIFF1:sagun'
+        assert pool.get_stats()['started'] == 1
+    finally:
+        pool.close()
+
+def test_workers_are_not_forked_directly():
+    """Workers start from a fork server or spawn, never fork() of a threaded process"""
+    assert OfflineTTSPool(size=1)._ctx.get_start_method() in ('forkserver', 'spawn')
+
+def test_missing_pyttsx3_is_reported(stub_pyttsx3):
+    """Without pyttsx3 the pool fails fast with a clear reason"""
+    stub_pyttsx3("raise ImportError('No module named pyttsx3')\n")
+    pool = OfflineTTSPool(size=1)
+    with pytest.raises(RuntimeError, match='pyttsx3 unavailable'):
+        pool.synthesize('johar', 'hi')
+    with pytest.raises(RuntimeError):
+        pool.synthesize('johar', 'hi')
@@ -0,0 +1,30 @@
+"""
+Tests for Ol Chiki converter
+"""
+
+import csv
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.olchiki_converter import OlChikiConverter
+
+def test_convert_basic():
+    """Test simple word conversion"""
+    assert OlChikiConverter.convert('नमस्ते') == 'ᱱᱢᱥᱛᱮ'
+    assert OlChikiConverter.convert('') == ''
+
+def test_convert_overlapping_patterns():
+    """Longer patterns win even when a shorter one starts earlier"""
+    assert OlChikiConverter.convert('ओला़') == OlChikiConverter._convert_sequential('ओला़')
+    assert OlChikiConverter.convert('ओला़') == 'ᱳᱞᱟᱹ'
+
+def test_convert_matches_sequential_on_dataset():
+    """Output is identical to sequential replacement on the dataset"""
+    path = os.path.join(os.path.dirname(__file__), '..', 'hindi_santali_final.csv')
+    with open(path, 'r', encoding='utf-8') as f:
+        corpus = [row['hindi'] for row in csv.DictReader(f)]
+    corpus.append(' '.join(corpus[:200]))
+    for text in corpus:
+        assert OlChikiConverter.convert(text) == OlChikiConverter._convert_sequential(text)
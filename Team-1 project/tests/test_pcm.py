@@ -0,0 +1,54 @@
+"""
+Tests for PCM buffer utilities
+"""
+
+import math
+import struct
+import sys
+import os
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator import pcm
+from src.translator.pcm import PCMFormat
+
+def test_tone_matches_per_sample_reference():
+    """The repeated-period tone is identical to the sample-by-sample loop"""
+    rate, frequency = 22050, 440
+    reference = b''.join(
+        struct.pack('<h', int(0.25 * 32767 * math.sin(2 * math.pi * frequency * i / rate)))
+        for i in range(int(rate * 0.5)))
+    assert pcm.tone(frequency, 0.5, rate, 0.25) == reference
+
+def test_silence_and_concat():
+    """Gaps are inserted between chunks only"""
+    fmt = PCMFormat(1, 2, 1000)
+    assert pcm.silence(3, fmt) == b'\x00' * 6
+    assert pcm.concat([b'\x01\x00', b'\x02\x00'], fmt, gap_ms=1) == b'\x01\x00\x00\x00\x02\x00'
+    assert pcm.silence(1, PCMFormat(1, 1, 2000)) == b'\x80\x80'
+
+def test_resample_integer_factors():
+    """Decimation and repetition keep channels interleaved"""
+    stereo = PCMFormat(2, 2, 16000)
+    frames = array('h', [1, -1, 2, -2, 3, -3, 4, -4]).tobytes()
+    assert array('h', pcm.resample(frames, stereo, 8000)).tolist() == [1, -1, 3, -3]
+    up = pcm.resample(array('h', [1, 2]).tobytes(), PCMFormat(1, 2, 8000), 16000)
+    assert array('h', up).tolist() == [1, 1, 2, 2]
+
+def test_resample_odd_ratio_length():
+    """Non-integer ratios produce the expected number of frames"""
+    frames = pcm.tone(440, 0.5, 22050)
+    out = pcm.resample(frames, PCMFormat(1, 2, 22050), 16000)
+    assert abs(len(out) // 2 - 8000) <= 1
+
+def test_wav_round_trip():
+    """WAV encoding and decoding give back the format and frames"""
+    fmt = PCMFormat(1, 2, 8000)
+    assert pcm.from_wav(pcm.to_wav(b'\x01\x00\x02\x00', fmt)) == (fmt, b'\x01\x00\x02\x00')
+
+def test_to_16bit_keeps_the_most_significant_bytes():
+    """8-, 24- and 32-bit samples convert to 16-bit without a per-sample loop"""
+    assert pcm.to_16bit(bytes([0, 128, 255]), PCMFormat(1, 1, 8000)) == struct.pack('<3h', -32768, 0, 32512)
+    assert pcm.to_16bit(b'\x01\x02\x03\xfd\xfe\xff', PCMFormat(1, 3, 8000)) == struct.pack('<2h', 0x0302, -2)
+    assert pcm.to_16bit(struct.pack('<2i', 0x12345678, -1), PCMFormat(1, 4, 8000)) == struct.pack('<2h', 0x1234, -1)
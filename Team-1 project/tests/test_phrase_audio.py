@@ -0,0 +1,68 @@
+"""
+Tests for phrase audio stitching
+"""
+
+import sys
+import os
+import wave
+from io import BytesIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.phrase_audio import PhraseAudioStore
+
+def make_wav(frames, rate=8000):
+    out = BytesIO()
+    with wave.open(out, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames)
+    return out.getvalue()
+
+def read_frames(data):
+    with wave.open(BytesIO(data), 'rb') as w:
+        return w.readframes(w.getnframes())
+
+def test_segment_prefers_longest_phrase(tmp_path):
+    """Stored multi-word phrases win over single words; leftovers are merged"""
+    store = PhraseAudioStore(str(tmp_path))
+    store.save('ᱡᱚᱦᱟᱨ ᱟᱢ', 'sat', make_wav(b'\x01\x00'))
+    store.save('ᱡᱚᱦᱟᱨ', 'sat', make_wav(b'\x02\x00'))
+    parts = store.segment('ᱡᱚᱦᱟᱨ ᱟᱢ ᱫᱚ ᱪᱮᱫ ᱡᱚᱦᱟᱨ।', 'sat')
+    assert [(text, path is not None) for text, path in parts] == [
+        ('ᱡᱚᱦᱟᱨ ᱟᱢ', True), ('ᱫᱚ ᱪᱮᱫ', False), ('ᱡᱚᱦᱟᱨ', True)]
+
+def test_stitch_joins_clips_with_silence(tmp_path):
+    """Clips and synthesized leftovers are concatenated in order"""
+    store = PhraseAudioStore(str(tmp_path), silence_ms=1)
+    store.save('ᱡᱚᱦᱟᱨ', 'sat', make_wav(b'\x01\x00'))
+    leftovers = []
+
+    def synthesize(text):
+        leftovers.append(text)
+        return make_wav(b'\x02\x00')
+
+    audio = store.stitch('ᱡᱚᱦᱟᱨ ᱫᱚ', 'sat', synthesize)
+    silence = b'\x00' * 16  # 8 frames of 16-bit silence at 8 kHz
+    assert leftovers == ['ᱫᱚ']
+    assert read_frames(audio) == b'\x01\x00' + silence + b'\x02\x00'
+
+def test_stitch_skips_uncovered_text(tmp_path):
+    """Without any stored clip the caller falls back to normal synthesis"""
+    store = PhraseAudioStore(str(tmp_path))
+    store.save('ᱡᱚᱦᱟᱨ', 'sat', make_wav(b'\x01\x00'))
+    assert store.stitch('ᱫᱚ ᱪᱮᱫ', 'sat', lambda text: make_wav(b'')) is None
+    assert store.stitch('ᱡᱚᱦᱟᱨ ᱫᱚ', 'sat', lambda text: None) is None
+
+def test_decoded_clips_are_bounded_by_bytes(tmp_path):
+    """The in-memory clip cache stays under its byte limit; evicted clips are re-read"""
+    store = PhraseAudioStore(str(tmp_path), silence_ms=0, clip_cache_bytes=64 * 1024)
+    words = ['ᱡᱚᱦᱟᱨ', 'ᱟᱢ', 'ᱫᱚ', 'ᱪᱮᱫ']
+    for n, word in enumerate(words):
+        store.save(word, 'sat', make_wav(bytes([n + 1, 0]) * 10000))
+    for word in words:
+        store.stitch(word, 'sat')
+    stats = store._clips.get_stats()
+    assert stats['approx_bytes'] <= 64 * 1024 and stats['evictions'] > 0
+    assert read_frames(store.stitch('ᱡᱚᱦᱟᱨ', 'sat')) == b'\x01\x00' * 10000
@@ -0,0 +1,88 @@
+"""
+Tests for sentence-by-sentence speech streaming
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator import pcm
+from src.translator.pcm import PCMFormat
+from src.translator.speech_stream import stream_speech
+
+def test_mp3_segments_stream_in_order():
+    """Later sentences finishing first do not reorder the stream"""
+    def synthesize(sentence, language):
+        time.sleep(0.05 if sentence == 'एक' else 0)
+        return {'audio': sentence.encode('utf-8'), 'content_type': 'audio/mpeg'}
+
+    content_type, chunks = stream_speech('एक। दो। तीन।', 'hi', synthesize)
+    assert content_type == 'audio/mpeg'
+    assert [c.decode('utf-8') for c in chunks] == ['एक', 'दो', 'तीन']
+
+def test_first_chunk_does_not_wait_for_the_rest():
+    """The first sentence streams while later ones are still synthesizing"""
+    def synthesize(sentence, language):
+        time.sleep(0 if sentence == 'एक' else 0.5)
+        return {'audio': b'x', 'content_type': 'audio/mpeg'}
+
+    start = time.monotonic()
+    _, chunks = stream_speech('एक। दो। तीन। चार। पाँच। छह।', 'hi', synthesize, ahead=2)
+    next(chunks)
+    assert time.monotonic() - start < 0.4
+    chunks.close()
+
+def test_wav_segments_share_one_header():
+    """WAV sentences are joined under one header with silence between them"""
+    fmt = PCMFormat(1, 2, 1000)
+
+    def synthesize(sentence, language):
+        if sentence == 'दो':
+            return None  # failed segment is skipped
+        return {'audio': pcm.to_wav(b'\x01\x00', fmt), 'content_type': 'audio/wav'}
+
+    content_type, chunks = stream_speech('एक। दो। तीन', 'hi', synthesize, gap_ms=2)
+    data = b''.join(chunks)
+    assert content_type == 'audio/wav'
+    assert data == pcm.wav_stream_header(fmt) + b'\x01\x00' + b'\x00' * 4 + b'\x01\x00'
+
+def test_long_text_streams_every_sentence():
+    """A text over 500 characters is split and streamed in full, in order"""
+    sentence = 'ᱟᱢ ᱫᱚ ᱪᱮᱫ ᱧᱩᱛᱩᱢ ᱠᱟᱱᱟ ᱾'
+    text = ' '.join(sentence.replace('ᱟᱢ', 'ᱟᱢ{}'.format(i)) for i in range(30))
+    assert len(text) > 500
+
+    def synthesize(sentence, language):
+        return {'audio': sentence.encode('utf-8') + b'|', 'content_type': 'audio/mpeg'}
+
+    _, chunks = stream_speech(text, 'sat', synthesize)
+    assert b''.join(chunks).decode('utf-8').replace('|', ' ').split() == text.split()
+
+def test_mixed_formats_lose_no_sentence():
+    """A sentence answered in the other format is re-synthesized in the stream's format"""
+    fmt = PCMFormat(1, 2, 1000)
+    answers = {'एक': 'audio/mpeg', 'दो': 'audio/wav', 'तीन': 'audio/mpeg'}
+    frames = {'एक': b'\x01\x00', 'दो': b'\x02\x00', 'तीन': b'\x03\x00'}
+
+    def encode(sentence, content_type):
+        if content_type == 'audio/wav':
+            return pcm.to_wav(frames[sentence], fmt)
+        return frames[sentence]
+
+    def synthesize(sentence, language):
+        return {'audio': encode(sentence, answers[sentence]), 'content_type': answers[sentence]}
+
+    def synthesize_as(sentence, language, content_type):
+        return {'audio': encode(sentence, content_type), 'content_type': content_type}
+
+    content_type, chunks = stream_speech('एक। दो। तीन।', 'hi', synthesize, synthesize_as=synthesize_as)
+    assert content_type == 'audio/mpeg'
+    assert list(chunks) == [b'\x01\x00', b'\x02\x00', b'\x03\x00']
+
+    answers = {'एक': 'audio/wav', 'दो': 'audio/mpeg', 'तीन': 'audio/wav'}
+    content_type, chunks = stream_speech('एक। दो। तीन।', 'hi', synthesize, gap_ms=0,
+                                         synthesize_as=synthesize_as)
+    assert content_type == 'audio/wav'
+    assert b''.join(chunks) == pcm.wav_stream_header(fmt) + b'\x01\x00\x02\x00\x03\x00'
@@ -0,0 +1,114 @@
+"""
+Tests for the pluggable speech-to-text layer
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator import pcm
+from src.translator.pcm import PCMFormat
+from src.translator.stt import STTBackend, STTNoSpeech, STTService, STTUnavailable, VoskSTTBackend
+
+class FakeBackend(STTBackend):
+    def __init__(self, name, result=None, error=None):
+        self.name = name
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    def transcribe(self, frames, rate, language):
+        self.calls.append((len(frames), rate))
+        if self.error:
+            raise self.error
+        return self.result
+
+def wav(seconds=1.0, rate=16000, channels=1):
+    return pcm.to_wav(b'\x00\x00' * int(rate * seconds) * channels, PCMFormat(channels, 2, rate))
+
+def test_falls_through_unavailable_backends():
+    """Unavailable backends hand over to the next one and are counted"""
+    local = FakeBackend('local', error=STTUnavailable('no model'))
+    remote = FakeBackend('remote', result='नमस्ते')
+    service = STTService([local, remote])
+    result = service.transcribe(wav(), 'hi')
+    assert result['text'] == 'नमस्ते' and result['engine'] == 'remote'
+    stats = service.get_stats()
+    assert stats['local']['failures'] == 1 and stats['remote']['wins'] == 1
+    assert stats['remote']['real_time_factor'] is not None
+
+def test_stereo_audio_is_downmixed():
+    """Stereo input reaches backends as mono frames"""
+    backend = FakeBackend('local', result='x')
+    STTService([backend]).transcribe(wav(0.5, 8000, channels=2), 'hi')
+    assert backend.calls == [(8000, 8000)]
+
+def test_other_sample_widths_are_converted():
+    """8-, 24- and 32-bit WAV uploads reach backends as 16-bit frames"""
+    for width in (1, 3, 4):
+        backend = FakeBackend('local', result='x')
+        data = pcm.to_wav(b'\x80' * width * 800, PCMFormat(2, width, 8000))
+        assert STTService([backend]).transcribe(data, 'hi')['text'] == 'x'
+        assert backend.calls == [(800, 8000)]
+
+def test_backend_that_cannot_load_is_skipped():
+    """A backend with a load error is passed over without counting failures"""
+    missing = VoskSTTBackend(model_path='/nonexistent')
+    service = STTService([missing, FakeBackend('remote', result='नमस्ते')])
+    for _ in range(3):
+        assert service.transcribe(wav(), 'hi')['engine'] == 'remote'
+    assert missing.load_error and service.get_stats()['vosk']['calls'] == 0
+
+def test_no_speech_reported_over_unavailable():
+    """Hearing no speech is reported in preference to a backend being unavailable"""
+    service = STTService([FakeBackend('a', error=STTNoSpeech('silence')),
+                          FakeBackend('b', error=STTUnavailable('offline'))])
+    with pytest.raises(STTNoSpeech):
+        service.transcribe(wav(), 'hi')
+
+def test_backend_without_transcribe_fails_at_construction():
+    """A backend subclass missing transcribe() cannot be instantiated"""
+    class Incomplete(STTBackend):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_vosk_without_model_is_unavailable():
+    """Vosk without a model reports itself unavailable"""
+    with pytest.raises(STTUnavailable):
+        VoskSTTBackend(model_path='/nonexistent').transcribe(b'', 16000, 'hi')
+
+def test_streaming_transcriber_cuts_utterances_at_pauses():
+    """Segments end after a pause and each one is transcribed once"""
+    from array import array
+    from src.translator.stt import StreamingTranscriber
+
+    backend = FakeBackend('remote', result='नमस्ते')
+    transcriber = StreamingTranscriber(STTService([backend]), rate=1000, silence_ms=200)
+    speech = array('h', [2000, -2000] * 50).tobytes()   # 100 ms loud
+    quiet = array('h', [0] * 100).tobytes()              # 100 ms silent
+    events = []
+    for frames in [quiet, speech, speech, quiet, quiet, quiet]:
+        events.extend(transcriber.feed(frames))
+    assert events == [{'type': 'final', 'text': 'नमस्ते', 'engine': 'remote'}]
+    assert len(backend.calls) == 1
+    events = transcriber.feed(speech) + transcriber.finish()
+    assert [e['type'] for e in events] == ['final'] and len(backend.calls) == 2
+
+def test_streaming_transcriber_keeps_samples_aligned_across_odd_messages():
+    """A sample split between two messages is joined, not shifted"""
+    from array import array
+    from src.translator.stt import StreamingTranscriber
+
+    backend = FakeBackend('remote', result='नमस्ते')
+    transcriber = StreamingTranscriber(STTService([backend]), rate=1000, silence_ms=200)
+    speech = array('h', [2000, -2000] * 50).tobytes()
+    transcriber.feed(speech[:51])
+    transcriber.feed(speech[51:] + speech)
+    assert bytes(transcriber._buffer) == speech + speech
+    transcriber.finish()
+    assert backend.calls == [(len(speech) * 2, 1000)]
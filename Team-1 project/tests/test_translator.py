@@ -0,0 +1,331 @@
+"""
+Tests for translation engine
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.engine import TranslationEngine
+
+@pytest.fixture
+def translator():
+    """Create translator instance for testing"""
+    return TranslationEngine()
+
+def test_translate_hindi_to_santali(translator):
+    """Test Hindi to Santali translation"""
+    result = translator.translate('नमस्ते', 'hi', 'sat')
+    assert result['success'] == True
+    assert result['source_language'] == 'Hindi'
+    assert result['target_language'] == 'Santali'
+
+def test_translate_empty_text(translator):
+    """Test translation with empty text"""
+    result = translator.translate('', 'hi', 'sat')
+    assert result['success'] == False
+    assert 'Empty input text' in result['error']
+
+def test_invalid_language_pair(translator):
+    """Test invalid language pair"""
+    result = translator.translate('hello', 'en', 'fr')
+    assert result['success'] == False
+    assert 'Unsupported language pair' in result['error']
+
+def test_supported_languages(translator):
+    """Test supported languages"""
+    languages = translator.get_supported_languages()
+    assert 'hi' in languages
+    assert 'sat' in languages
+    assert languages['hi'] == 'Hindi'
+    assert languages['sat'] == 'Santali'
+
+def test_batch_translate(translator):
+    """Test batch translation"""
+    texts = ['नमस्ते', 'धन्यवाद']
+    results = translator.batch_translate(texts, 'hi', 'sat')
+    assert len(results) == 2
+    assert all(r['success'] for r in results)
+
+def test_cache(translator):
+    """Test translation caching"""
+    text = 'नमस्ते'
+    result1 = translator.translate(text, 'hi', 'sat')
+    result2 = translator.translate(text, 'hi', 'sat')
+    assert result1 == result2
+    assert len(translator.translation_cache) > 0
+
+def test_clear_cache(translator):
+    """Test cache clearing"""
+    translator.translate('नमस्ते', 'hi', 'sat')
+    assert len(translator.translation_cache) > 0
+    translator.clear_cache()
+    assert len(translator.translation_cache) == 0
+
+def test_long_phrase_matched_mid_sentence(translator):
+    """Phrases longer than three words are matched inside a sentence"""
+    result = translator.translate('सुनो मुझे भूख लगी है', 'hi', 'sat')
+    phrases = [m for m in result['word_mappings'] if m['source'] == 'dictionary_phrase']
+    assert phrases and phrases[0]['hindi'] == 'मुझे भूख लगी है'
+    assert phrases[0]['santali'] == 'ᱤᱧᱠᱮ ᱵᱩᱠᱷᱟᱭ ᱞᱟᱜᱮᱡ ᱠᱟᱱᱟ'
+
+def test_cache_returns_independent_copies(translator):
+    """Mutating a returned result does not affect the cached one"""
+    result1 = translator.translate('नमस्ते', 'hi', 'sat')
+    result1['translated_text'] = 'changed'
+    result2 = translator.translate('नमस्ते', 'hi', 'sat')
+    assert result2['translated_text'] != 'changed'
+    assert translator.translation_cache.get_stats()['hits'] == 1
+
+def test_cache_evicts_least_recently_used():
+    """Cache size is bounded by max entries"""
+    engine = TranslationEngine(cache_size=2)
+    for text in ['नमस्ते', 'धन्यवाद', 'पानी']:
+        engine.translate(text, 'hi', 'sat')
+    assert len(engine.translation_cache) == 2
+    assert engine.translation_cache.get_stats()['evictions'] == 1
+
+def test_cache_entries_expire_after_ttl(monkeypatch):
+    """An entry older than the TTL is a miss and counts as an expiration"""
+    import types
+    from src.translator import cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, 'time', types.SimpleNamespace(monotonic=lambda: now[0]))
+    engine = TranslationEngine(cache_ttl=60)
+    engine.translate('नमस्ते', 'hi', 'sat')
+    now[0] += 59
+    engine.translate('नमस्ते', 'hi', 'sat')
+    now[0] += 61
+    engine.translate('नमस्ते', 'hi', 'sat')
+    stats = engine.translation_cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['expirations']) == (1, 2, 1)
+
+def test_cache_evicts_by_bytes():
+    """Cache size is bounded by approximate bytes as well as entries"""
+    from src.translator.cache import TranslationCache
+
+    cache = TranslationCache(max_entries=100, max_bytes=4096)
+    for i in range(10):
+        cache.set(str(i), {'translated_text': 'x' * 1000})
+    stats = cache.get_stats()
+    assert 0 < stats['approx_bytes'] <= 4096 and stats['evictions'] > 0
+    assert cache.get('9') is not None and cache.get('0') is None
+    cache.set('big', {'translated_text': 'x' * 5000})
+    assert 'big' not in cache
+
+def test_cache_invalidated_by_add_word(translator):
+    """Adding a word drops stale cached translations"""
+    translator.translate('झिलमिल', 'hi', 'sat')
+    translator.dictionary.add_word('झिलमिल', 'ᱡᱷᱤᱞᱢᱤᱞ')
+    result = translator.translate('झिलमिल', 'hi', 'sat')
+    assert result['translated_text'] == 'ᱡᱷᱤᱞᱢᱤᱞ'
+    assert translator.translation_cache.get_stats()['invalidations'] == 1
+
+def test_transliteration_handles_conjuncts(translator):
+    """Multi-character map entries are applied before single characters"""
+    assert translator._transliterate_hindi_to_olchiki('ज्ञान') == 'ᱡᱱᱟᱱ'
+    assert translator._transliterate_hindi_to_olchiki('क्षमा') == 'ᱠᱥᱢᱟ'
+    assert translator._transliterate_hindi_to_olchiki('abc १') == 'abc ᱑'
+
+def test_snapshot_round_trip(translator, tmp_path):
+    """A snapshot reloads to the same dictionary and is ignored when stale"""
+    from src.translator.snapshot import load_snapshot
+
+    path = translator.build_snapshot(str(tmp_path / 'dict.snapshot'))
+    key = translator._snapshot_key(translator.dictionary_path)
+    restored = load_snapshot(path, key)
+    assert restored.hindi_to_santali == translator.dictionary.hindi_to_santali
+    assert restored.fuzzy_match_hindi_to_santali('नमसते', 0.5) == \
+        translator.dictionary.fuzzy_match_hindi_to_santali('नमसते', 0.5)
+    assert load_snapshot(path, '0' * 64) is None
+
+
+def test_snapshot_key_covers_snapshotted_class_code(translator):
+    """The key changes with the set (and code) of classes pickled into the snapshot"""
+    from src.translator.snapshot import SNAPSHOT_CLASSES, snapshot_key
+    from src.translator.phrase_trie import PhraseTrie
+
+    csv_path = translator.dictionary_path
+    assert snapshot_key(csv_path, []) == snapshot_key(csv_path, [], SNAPSHOT_CLASSES)
+    assert snapshot_key(csv_path, []) != snapshot_key(csv_path, [], SNAPSHOT_CLASSES + (PhraseTrie,))
+
+def test_batch_translate_parallel_matches_sequential(translator):
+    """Pooled batches keep input order, dedupe texts and match translate()"""
+    engine = TranslationEngine(dictionary=translator.dictionary, batch_workers=2)
+    engine.batch_executor.min_parallel = 1
+    texts = ['नमस्ते', 'पानी', 'नमस्ते', 'धन्यवाद']
+    try:
+        results = engine.batch_translate(texts, 'hi', 'sat')
+    finally:
+        engine.batch_executor.shutdown()
+    assert [r['source_text'] for r in results] == texts
+    for text, result in zip(texts, results):
+        assert result['translated_text'] == translator.translate(text, 'hi', 'sat')['translated_text']
+        assert result['elapsed_ms'] >= 0
+    assert [r['cached'] for r in results] == [False, False, True, False]
+    assert engine.batch_translate(['पानी'], 'hi', 'sat')[0]['cached'] is True
+
+def test_batch_pool_size_follows_environment(translator, monkeypatch):
+    """BATCH_WORKERS sets the pool size; a preloading server runs batches in-process"""
+    from src.translator.batch import BatchExecutor
+
+    monkeypatch.delenv('BATCH_WORKERS', raising=False)
+    monkeypatch.setenv('TRANSLATOR_PRELOAD', '1')
+    assert BatchExecutor(translator).max_workers == 1
+    monkeypatch.setenv('BATCH_WORKERS', '3')
+    assert BatchExecutor(translator).max_workers == 3
+    assert BatchExecutor(translator, max_workers=2).max_workers == 2
+
+def test_concurrent_batches_share_one_pool(translator):
+    """Threads asking for the pool at once get the same one"""
+    import threading
+
+    engine = TranslationEngine(dictionary=translator.dictionary, batch_workers=2)
+    pools = []
+    barrier = threading.Barrier(4)
+
+    def get_pool():
+        barrier.wait()
+        pools.append(engine.batch_executor._get_pool())
+
+    threads = [threading.Thread(target=get_pool) for _ in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        engine.batch_executor.shutdown()
+    assert len(pools) == 4 and all(pool is pools[0] for pool in pools)
+
+def test_small_batch_counts_one_cache_lookup_per_text(translator):
+    """In-process batches do not probe the cache a second time"""
+    texts = ['नमस्ते', 'पानी', 'नमस्ते', '']
+    translator.batch_translate(texts, 'hi', 'sat')
+    stats = translator.translation_cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (0, 2)
+    translator.batch_translate(texts, 'hi', 'sat')
+    stats = translator.translation_cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (2, 2)
+
+def test_translate_iter_is_lazy(translator):
+    """Results stream out before the rest of the input is read"""
+    consumed = []
+
+    def lines():
+        for text in ['नमस्ते', 'पानी']:
+            consumed.append(text)
+            yield text
+
+    stream = translator.translate_iter(lines(), 'hi', 'sat')
+    first = next(stream)
+    assert consumed == ['नमस्ते']
+    assert first['index'] == 0 and first['elapsed_ms'] >= 0
+    assert [r['index'] for r in stream] == [1]
+
+def test_translate_iter_reports_bad_items_and_continues(translator):
+    """A non-string item fails on its own; later items are still translated"""
+    results = list(translator.translate_iter(['नमस्ते', 5, None, 'पानी'], 'hi', 'sat'))
+    assert [r['index'] for r in results] == [0, 1, 2, 3]
+    assert [r['success'] for r in results] == [True, False, False, True]
+    assert 'must be a string' in results[1]['error']
+    assert results[3]['translated_text'] == translator.translate('पानी', 'hi', 'sat')['translated_text']
+
+def test_session_matches_full_translation(translator):
+    """Incremental updates give translate()'s result and reuse the prefix"""
+    session = translator.create_session('hi', 'sat')
+    typed = ['सुनो', 'सुनो मुझे', 'सुनो मुझे भूख', 'सुनो मुझे भूख लगी है', 'सुनो मुझे भूख लगी है पानी',
+             'सुनो मुझे भूख लगी है पानी दो। नमस्ते', 'सुनो मुझे प्यास लगी है पानी दो। नमस्ते']
+    for text in typed:
+        result = session.update(text)
+        expected = translator.translate(text, 'hi', 'sat')
+        for key in ('translated_text', 'word_mappings', 'confidence', 'matched_words', 'total_words'):
+            assert result[key] == expected[key]
+    assert session.get_stats()['reused_tokens'] > 0
+
+    session.update('सुनो मुझे भूख लगी है पानी दो')
+    result = session.update('सुनो मुझे भूख लगी है पानी दो और')
+    assert result['reused_tokens'] >= 4 and result['translated_tokens'] <= 3
+    result['word_mappings'].clear()
+    assert session.update('सुनो मुझे भूख लगी है पानी दो और')['word_mappings']
+
+def test_token_cache_shared_across_texts(translator):
+    """Unknown words are resolved once across texts and re-resolved after add_word"""
+    first = translator.translate('झिलमिल पानी', 'hi', 'sat')
+    second = translator.translate('पानी झिलमिल', 'hi', 'sat')
+    assert translator.token_cache.get_stats()['hits'] >= 1
+    assert first['word_mappings'][0] == second['word_mappings'][1]
+    assert first['word_mappings'][0]['source'] == 'transliteration'
+    translator.dictionary.add_word('झिलमिल', 'ᱡᱷᱤᱞᱢᱤᱞ')
+    third = translator.translate('झिलमिल नदी', 'hi', 'sat')
+    assert third['word_mappings'][0]['santali'] == 'ᱡᱷᱤᱞᱢᱤᱞ'
+    assert translator.token_cache.get_stats()['invalidations'] == 1
+
+def test_word_mappings_are_shared_read_only_records(translator):
+    """Mappings read like dicts, are reused across results and serialize to JSON"""
+    import json
+    import pickle
+    from src.translator.word_mapping import WordMapping, json_default
+
+    first = translator.translate('नमस्ते झिलमिल', 'hi', 'sat')
+    second = translator.translate('झिलमिल नमस्ते', 'hi', 'sat')
+    assert first['word_mappings'][0] is second['word_mappings'][1]
+    mapping = first['word_mappings'][1]
+    assert isinstance(mapping, WordMapping)
+    assert mapping['source'] == 'transliteration' and 'note' in mapping
+    santali = translator.dictionary.lookup_hindi_to_santali('नमस्ते')
+    assert first['word_mappings'][0] == {'hindi': 'नमस्ते', 'santali': santali,
+                                         'source': 'dictionary', 'confidence': 1.0}
+    with pytest.raises(AttributeError):
+        mapping.santali = 'changed'
+    assert pickle.loads(pickle.dumps(mapping)) == mapping
+    decoded = json.loads(json.dumps(first, default=json_default))
+    assert decoded['word_mappings'][1] == dict(mapping)
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork()')
+def test_preloaded_engine_is_shared_with_forked_workers(translator):
+    """preload() builds every index up front; a forked child translates with it"""
+    from src.translator.preload import process_memory
+
+    translator.preload()
+    trie = translator.dictionary.phrase_trie
+    assert trie is not None and translator.dictionary.hindi_fuzzy_index is not None
+    expected = translator.translate('नमस्ते झिलमिल', 'hi', 'sat')['translated_text']
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        ok = False
+        try:
+            translator.clear_cache()
+            ok = (translator.translate('नमस्ते झिलमिल', 'hi', 'sat')['translated_text'] == expected
+                  and translator.dictionary.phrase_trie is trie)
+        finally:
+            os.write(write_fd, b'1' if ok else b'0')
+            os._exit(0)
+    os.close(write_fd)
+    assert os.read(read_fd, 1) == b'1'
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    memory = process_memory()
+    assert memory is None or memory['uss_mb'] <= memory['rss_mb']
+
+def test_every_language_pair_returns_word_mapping_records(translator):
+    """word_mappings hold records for English pairs too; len() matches iteration"""
+    import json
+    from src.translator.word_mapping import EnglishWordMapping, WordMapping, json_default
+
+    for text, source, target in [('नमस्ते दोस्त', 'hi', 'en'), ('hello friend', 'en', 'hi'),
+                                 ('नमस्ते', 'hi', 'sat')]:
+        mappings = translator.translate(text, source, target)['word_mappings']
+        assert mappings and all(isinstance(m, WordMapping) for m in mappings)
+        assert json.loads(json.dumps(mappings, default=json_default)) == [dict(m) for m in mappings]
+    mapping = EnglishWordMapping('नमस्ते', 'hello', 'dictionary', 1.0)
+    assert dict(mapping) == {'hindi': 'नमस्ते', 'english': 'hello', 'source': 'dictionary', 'confidence': 1.0}
+    assert len(mapping) == len(list(mapping)) == 4
+    assert len(WordMapping('a', None, 'unknown', 0.0)) == len(list(WordMapping('a', None, 'unknown', 0.0))) == 3
@@ -0,0 +1,88 @@
+"""
+Tests for the hedged TTS orchestrator, with a local stub standing in for gTTS
+"""
+
+import sys
+import os
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.translator.tts_orchestrator import TTSEngine, TTSOrchestrator
+
+class StubTTSHandler(BaseHTTPRequestHandler):
+    """Answers /speak?delay=<seconds> with fake MP3 bytes after the delay"""
+
+    def do_GET(self):
+        delay = float(self.path.split('delay=')[1]) if 'delay=' in self.path else 0
+        time.sleep(delay)
+        self.send_response(200)
+        self.send_header('Content-Type', 'audio/mpeg')
+        self.end_headers()
+        self.wfile.write(b'ID3stub')
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture(scope='module')
+def stub_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubTTSHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield 'http://127.0.0.1:{}/speak'.format(server.server_address[1])
+    server.shutdown()
+
+def stub_engine(url, delay, deadline=2.0):
+    def synthesize(text, language):
+        with urllib.request.urlopen('{}?delay={}'.format(url, delay), timeout=deadline) as r:
+            return r.read()
+    return TTSEngine('stub', synthesize, 'audio/mpeg', deadline)
+
+def offline_engine(audio=b'RIFFoffline', delay=0.0):
+    def synthesize(text, language):
+        time.sleep(delay)
+        return audio
+    return TTSEngine('offline', synthesize, 'audio/wav', 2.0)
+
+def test_fast_primary_wins_without_hedging(stub_url):
+    """A primary engine that answers in time is used and no hedge starts"""
+    tts = TTSOrchestrator([stub_engine(stub_url, 0), offline_engine()], hedge_after=1.0)
+    assert tts.synthesize('johar', 'hi') == (b'ID3stub', 'audio/mpeg', 'stub')
+    stats = tts.get_stats()
+    assert stats['hedges'] == 0 and stats['engines']['offline']['calls'] == 0
+
+def test_slow_primary_is_hedged(stub_url):
+    """A slow primary engine is hedged and the faster fallback wins"""
+    tts = TTSOrchestrator([stub_engine(stub_url, 1.0), offline_engine()], hedge_after=0.05)
+    start = time.monotonic()
+    audio, content_type, engine = tts.synthesize('johar', 'hi')
+    assert (audio, engine) == (b'RIFFoffline', 'offline')
+    assert time.monotonic() - start < 0.8
+    assert tts.get_stats()['hedges'] == 1
+
+def test_failed_primary_falls_through_immediately():
+    """A failing primary engine hands over without waiting for the hedge delay"""
+    def broken(text, language):
+        raise ConnectionError('offline')
+    tts = TTSOrchestrator([TTSEngine('broken', broken, 'audio/mpeg', 1.0), offline_engine()],
+                          hedge_after=5.0)
+    assert tts.synthesize('johar', 'hi')[2] == 'offline'
+    assert tts.get_stats()['engines']['broken']['failures'] == 1
+
+def test_deadline_bounds_hung_engines(stub_url):
+    """An engine that hangs is given up on at its deadline"""
+    tts = TTSOrchestrator([stub_engine(stub_url, 2.0, deadline=0.2)], hedge_after=5.0)
+    start = time.monotonic()
+    assert tts.synthesize('johar', 'hi') == (None, None, None)
+    assert time.monotonic() - start < 1.0
+    assert tts.get_stats()['engines']['stub']['timeouts'] == 1
+
+def test_content_type_pins_the_engine(stub_url):
+    """Asking for a format only runs the engines that produce it"""
+    tts = TTSOrchestrator([stub_engine(stub_url, 0), offline_engine()], hedge_after=1.0)
+    assert tts.synthesize('johar', 'hi', content_type='audio/wav') == (b'RIFFoffline', 'audio/wav', 'offline')
+    assert tts.get_stats()['engines']['stub']['calls'] == 0